@@ -0,0 +1,175 @@
+"""Test feature performance precision database helpers."""
+import json
+import typing as tp
+import unittest
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+from tests.helper_utils import run_in_test_environment
+from varats.data.databases import feature_perf_precision_database
+from varats.data.databases.feature_perf_precision_database import (
+    get_feature_performance_from_tef_report,
+    load_patched_pims,
+    VXray,
+)
+from varats.report.report import ReportFilepath
+from varats.report.tef_report import TEFReport
+
+
+def _trace_event(name: str, event_type: str, timestamp: int, uuid: int) -> str:
+    return json.dumps({
+        "name": name,
+        "cat": "Feature",
+        "ph": event_type,
+        "ts": timestamp,
+        "pid": 42,
+        "tid": 42,
+        "ID": uuid
+    })
+
+
+class TestFeaturePerformanceFromTEFReport(unittest.TestCase):
+    """Test the extraction of feature performance values from trace event
+    files."""
+
+    @run_in_test_environment()
+    def test_nested_features(self) -> None:
+        """Test that durations of nested features are subtracted from their
+        parent interaction."""
+        trace_events = [
+            _trace_event("Base", "B", 0, 0),
+            _trace_event("FR(A)", "B", 10, 1),
+            _trace_event("FR(B)", "B", 20, 2),
+            _trace_event("FR(B)", "E", 25, 2),
+            _trace_event("FR(A)", "E", 40, 1),
+            _trace_event("FR(B)", "B", 50, 3),
+            _trace_event("FR(B)", "E", 60, 3),
+            _trace_event("FR(C)", "E", 65, 4),
+            _trace_event("Base", "E", 100, 0),
+        ]
+        Path("trace.json").write_text(
+            f'{{"traceEvents": [{",".join(trace_events)}], '
+            '"timestampUnit": "ns"}'
+        )
+
+        feature_performances = get_feature_performance_from_tef_report(
+            TEFReport(Path("trace.json"))
+        )
+
+        self.assertEqual(
+            feature_performances, {
+                "A": 30 - 5,
+                "A*B": 5,
+                "Base": 100 - 30 - 10,
+                "B": 10,
+            }
+        )
+
+
+def _write_tef_aggregate(
+    zip_file: ZipFile, member_name: str, feature_durations: tp.List[int]
+) -> None:
+    """Add a TEF report aggregate with one trace per repetition, in which
+    feature A takes the given time."""
+    aggregate_path = Path(member_name)
+    with ZipFile(aggregate_path, "w") as aggregate_file:
+        for repetition, duration in enumerate(feature_durations):
+            trace_events = [
+                _trace_event("Base", "B", 0, 0),
+                _trace_event("FR(A)", "B", 10, 1),
+                _trace_event("FR(A)", "E", 10 + duration, 1),
+                _trace_event("Base", "E", 10000, 0),
+            ]
+            aggregate_file.writestr(
+                f"trace_{repetition}.json",
+                f'{{"traceEvents": [{",".join(trace_events)}], '
+                '"timestampUnit": "ns"}'
+            )
+    zip_file.write(aggregate_path, member_name)
+    aggregate_path.unlink()
+
+
+class TestPatchedPIMs(unittest.TestCase):
+    """Test the shared extraction of performance-influence models from
+    multi-patch result files."""
+
+    @run_in_test_environment()
+    def test_models_are_extracted_once_per_file(self) -> None:
+        """Test that all patches of a result file are served from one
+        extraction."""
+        report_path = Path("mpr_tef.zip")
+        with ZipFile(report_path, "w") as zip_file:
+            _write_tef_aggregate(
+                zip_file, "baseline_tef.zip", [1000, 1010, 990, 1000]
+            )
+            _write_tef_aggregate(
+                zip_file, "patched_4_slow_tef.zip", [5000, 5010, 4990, 5000]
+            )
+            _write_tef_aggregate(
+                zip_file, "patched_4_same_tef.zip", [1000, 1005, 995, 1000]
+            )
+        # make sure the file is not considered as racily modified
+        with mock.patch(
+            "varats.data.databases.feature_perf_precision_database."
+            "is_racily_modified",
+            return_value=False
+        ), mock.patch.object(
+            VXray, "extract_patched_pims", wraps=VXray().extract_patched_pims
+        ) as extract_mock:
+            profiler = VXray()
+            report_filepath = ReportFilepath.construct(
+                report_path.resolve(), Path.cwd()
+            )
+            self.assertTrue(profiler.is_regression(report_filepath, "slow"))
+            self.assertFalse(profiler.is_regression(report_filepath, "same"))
+            self.assertFalse(profiler.is_regression(report_filepath, "same"))
+
+            extract_mock.assert_called_once()
+            patched_pims = load_patched_pims(profiler, report_path.resolve())
+            self.assertEqual([1000, 1010, 990, 1000],
+                             patched_pims.baseline_pim["A"])
+            self.assertIsNone(patched_pims.get_pim_for_patch("unknown"))
+
+    @run_in_test_environment()
+    def test_cached_models_are_bounded(self) -> None:
+        """Test that only the models of the current version of the most
+        recently used result files are kept in memory."""
+        cached_pims = getattr(feature_perf_precision_database, "__PATCHED_PIMS")
+        cached_pims.clear()
+        report_paths = [Path(f"mpr_{name}.zip").resolve() for name in "abc"]
+        for report_path in report_paths:
+            report_path.write_text("v1")
+
+        profiler = VXray()
+        with mock.patch(
+            "varats.data.databases.feature_perf_precision_database."
+            "is_racily_modified",
+            return_value=False
+        ), mock.patch(
+            "varats.data.databases.feature_perf_precision_database."
+            "__MAX_PATCHED_PIMS", 2
+        ), mock.patch.object(
+            VXray, "extract_patched_pims", side_effect=lambda path: object()
+        ) as extract_mock:
+            first_pims = load_patched_pims(profiler, report_paths[0])
+            for report_path in report_paths:
+                load_patched_pims(profiler, report_path)
+            self.assertEqual(extract_mock.call_count, 3)
+            self.assertEqual([path for _, path in cached_pims],
+                             [str(report_paths[1]),
+                              str(report_paths[2])])
+
+            self.assertIsNot(
+                load_patched_pims(profiler, report_paths[0]), first_pims
+            )
+            self.assertEqual(extract_mock.call_count, 4)
+
+            report_paths[2].write_text("v2 of the file")
+            load_patched_pims(profiler, report_paths[2])
+            self.assertEqual(extract_mock.call_count, 5)
+            self.assertEqual([path for _, path in cached_pims],
+                             [str(report_paths[0]),
+                              str(report_paths[2])])
+
+        cached_pims.clear()
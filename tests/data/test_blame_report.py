@@ -1,5 +1,6 @@
 """Test VaRA blame reports."""
 
+import os
 import typing as tp
 import unittest
 import unittest.mock as mock
@@ -7,6 +8,7 @@ from pathlib import Path
 
 import yaml
 
+from tests.helper_utils import run_in_test_environment
 from varats.data.reports.blame_report import (
     BlameReport,
     BlameReportDiff,
@@ -663,6 +665,103 @@ class TestBlameReportWithRepoData(unittest.TestCase):
         )
         self.assertEqual(interaction.base_taint.commit.repository_name, "xz")
 
+    def test_compact_tables(self) -> None:
+        """Checks if commits and taints are interned into compact tables."""
+        tables = self.report.tables
+
+        self.assertEqual(
+            tables.function_names,
+            ["adjust_assignment_expression", "bool_exec", "_Z7doStuffii"]
+        )
+        self.assertEqual(
+            list(tables.function_interaction_offsets), [0, 0, 1, 1]
+        )
+        self.assertEqual(list(tables.interaction_taint_offsets), [0, 3])
+        self.assertEqual(list(tables.interaction_amounts), [5])
+        self.assertEqual(
+            tables.repository_names,
+            ["xz", "Unknown", "gzip", "repo-with-dashes"]
+        )
+        self.assertEqual(
+            tables.commit_hashes[tables.taint_commits[
+                tables.interaction_base_taints[0]]],
+            "48f8ed5347aeb9d54e7ea041b1f8d67ffe74db33"
+        )
+        self.assertEqual(list(tables.taint_regions), [-1, -1, -1, -1])
+
+    def test_function_entries_are_shared_views(self) -> None:
+        """Checks if function entries created from the tables share their
+        taints."""
+        first_entry = self.report.get_blame_result_function_entry("bool_exec")
+        second_entry = self.report.get_blame_result_function_entry("bool_exec")
+
+        self.assertIsNot(first_entry, second_entry)
+        self.assertIs(
+            first_entry.interactions[0].base_taint,
+            second_entry.interactions[0].base_taint
+        )
+        self.assertIsNone(self.report.get_blame_result_function_entry("foo"))
+        self.assertEqual(len(self.report.function_entries), 3)
+
+
+class TestBlameReportSidecar(unittest.TestCase):
+    """Test if parsed blame reports are stored in a binary sidecar."""
+
+    @run_in_test_environment()
+    def test_sidecar_is_used_instead_of_yaml(self) -> None:
+        """Checks if a second load reads the sidecar instead of the yaml."""
+        report_path = Path(FAKE_REPORT_PATH)
+        report_path.write_text(
+            YAML_DOC_HEADER + YAML_DOC_BR_METADATA + YAML_DOC_BR_6
+        )
+        os.utime(report_path, ns=(0, 0))
+        report = BlameReport(report_path)
+
+        with mock.patch(
+            "varats.data.reports.blame_report.yaml.load_all",
+            side_effect=AssertionError("parsed")
+        ):
+            cached_report = BlameReport(report_path)
+
+        self.assertEqual(
+            cached_report.meta_data.num_functions,
+            report.meta_data.num_functions
+        )
+        self.assertEqual(
+            cached_report.blame_taint_scope, report.blame_taint_scope
+        )
+        self.assertEqual(
+            generate_degree_tuples(cached_report),
+            generate_degree_tuples(report)
+        )
+        self.assertEqual(
+            cached_report.tables.function_names, report.tables.function_names
+        )
+        self.assertEqual(
+            cached_report.tables.function_file_names,
+            report.tables.function_file_names
+        )
+
+    @run_in_test_environment()
+    def test_changed_yaml_is_parsed_again(self) -> None:
+        """Checks if sidecars of changed reports are not used."""
+        report_path = Path(FAKE_REPORT_PATH)
+        report_path.write_text(
+            YAML_DOC_HEADER + YAML_DOC_BR_METADATA + YAML_DOC_BR_1
+        )
+        os.utime(report_path, ns=(0, 0))
+        BlameReport(report_path)
+
+        report_path.write_text(
+            YAML_DOC_HEADER + YAML_DOC_BR_METADATA + YAML_DOC_BR_2
+        )
+        os.utime(report_path, ns=(1, 1))
+        report = BlameReport(report_path)
+
+        self.assertIsNotNone(
+            report.get_blame_result_function_entry('_Z7doStuffdd')
+        )
+
 
 class TestBlameReportDiff(unittest.TestCase):
     """Test if diffs between BlameReports are correctly computed."""
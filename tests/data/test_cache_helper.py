@@ -1,4 +1,6 @@
 """Test the cache_helper module."""
+import multiprocessing as mp
+import os
 import unittest
 from pathlib import Path
 
@@ -6,8 +8,13 @@ import pandas as pd
 
 from tests.helper_utils import run_in_test_environment
 from varats.data.cache_helper import (
+    CACHE_ID_COL,
+    CACHE_TIMESTAMP_COL,
     build_cached_report_table,
+    cache_dataframe,
     get_data_file_path,
+    load_cached_df_or_none,
+    update_cached_dataframe,
 )
 from varats.utils.settings import vara_cfg
 
@@ -27,7 +34,7 @@ class TestCacheHelper(unittest.TestCase):
     def test_get_data_file_path(self):
         path = get_data_file_path("foo", "tmux")
         self.assertEqual(
-            str(vara_cfg()["data_cache"]) + "/foo-tmux.csv.gz", str(path)
+            str(vara_cfg()["data_cache"]) + "/foo-tmux.parquet", str(path)
         )
 
     @run_in_test_environment()
@@ -86,3 +93,151 @@ class TestCacheHelper(unittest.TestCase):
         self.assertNotIn("a2", df["entry"].values)
         self.assertIn("b", df["entry"].values)
         self.assertIn("c2", df["entry"].values)
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_in_parallel(self):
+        """Check whether entries can be created by multiple processes."""
+
+        def create_empty_df():
+            return pd.DataFrame(columns=["entry"])
+
+        def create_cache_entry_data(entry: str):
+            return pd.DataFrame({"entry": entry}, index=[0]), entry, "1"
+
+        df = build_cached_report_table(
+            "cache_test_data",
+            "project", ["a", "b", "c"], [],
+            create_empty_df,
+            create_cache_entry_data,
+            lambda entry: entry,
+            lambda entry: "1",
+            lambda ts1, ts2: int(ts1) > int(ts2),
+            jobs=2
+        )
+
+        self.assertEqual(list(df["entry"]), ["a", "b", "c"])
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_in_worker_process(self):
+        """Check whether worker processes create entries themselves instead of
+        starting a nested pool."""
+        result_path = Path("pids.csv").absolute()
+
+        def create_empty_df():
+            return pd.DataFrame(columns=["entry", "pid"])
+
+        def create_cache_entry_data(entry: str):
+            return pd.DataFrame({
+                "entry": entry,
+                "pid": os.getpid()
+            }, index=[0]), entry, "1"
+
+        def build_in_worker() -> None:
+            build_cached_report_table(
+                "cache_test_data",
+                "project", ["a", "b", "c"], [],
+                create_empty_df,
+                create_cache_entry_data,
+                lambda entry: entry,
+                lambda entry: "1",
+                lambda ts1, ts2: int(ts1) > int(ts2),
+                jobs=None
+            ).to_csv(result_path)
+
+        worker = mp.get_context("fork").Process(target=build_in_worker)
+        worker.start()
+        worker.join()
+
+        self.assertEqual(worker.exitcode, 0)
+        df = pd.read_csv(result_path)
+        self.assertEqual(list(df["entry"]), ["a", "b", "c"])
+        self.assertEqual(set(df["pid"]), {worker.pid})
+
+    @run_in_test_environment()
+    def test_migrate_csv_cache(self):
+        """Check whether csv caches are converted to the parquet format."""
+        legacy_path = Path(str(vara_cfg()["data_cache"])) / "foo-tmux.csv.gz"
+        legacy_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({
+            "entry": ["a", "b"],
+            "value": [1, 2]
+        }).to_csv(str(legacy_path), compression='infer')
+
+        df = load_cached_df_or_none("foo", "tmux", {"value": "int64"})
+
+        self.assertFalse(legacy_path.exists())
+        self.assertTrue(get_data_file_path("foo", "tmux").is_dir())
+        self.assertEqual(list(df["entry"]), ["a", "b"])
+        self.assertEqual(
+            list(
+                load_cached_df_or_none(
+                    "foo", "tmux", {
+                        "value": "int64"
+                    }, columns=["value"]
+                ).columns
+            ), ["value"]
+        )
+
+    @run_in_test_environment()
+    def test_compact_migrated_csv_cache(self):
+        """Check whether numeric ids and timestamps of migrated csv caches can
+        be compacted together with new entries."""
+        legacy_path = Path(str(vara_cfg()["data_cache"])) / "foo-tmux.csv.gz"
+        legacy_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({
+            "entry": ["a", "b"],
+            CACHE_ID_COL: [1, 2],
+            CACHE_TIMESTAMP_COL: [1000000000000000000, 1000000000000000000]
+        }).to_csv(str(legacy_path), compression='infer')
+        load_cached_df_or_none("foo", "tmux", {})
+
+        for entry_id in range(3, 19):
+            update_cached_dataframe(
+                "foo", "tmux",
+                pd.DataFrame({
+                    "entry": [f"e{entry_id}"],
+                    CACHE_ID_COL: [str(entry_id)],
+                    CACHE_TIMESTAMP_COL: ["1000000000000000001"]
+                }), []
+            )
+
+        cache_path = get_data_file_path("foo", "tmux")
+        self.assertEqual(len(list(cache_path.glob("*.parquet"))), 1)
+        cached_df = load_cached_df_or_none("foo", "tmux", {})
+        self.assertEqual(
+            sorted(cached_df[CACHE_ID_COL], key=int),
+            [str(entry_id) for entry_id in range(1, 19)]
+        )
+
+    @run_in_test_environment()
+    def test_update_only_rewrites_changed_parts(self):
+        """Check whether updating entries keeps unchanged cache files."""
+        cache_dataframe(
+            "foo", "tmux", pd.DataFrame({
+                "entry": ["a"],
+                CACHE_ID_COL: ["a"]
+            })
+        )
+        update_cached_dataframe(
+            "foo", "tmux", pd.DataFrame({
+                "entry": ["b"],
+                CACHE_ID_COL: ["b"]
+            }), []
+        )
+        cache_path = get_data_file_path("foo", "tmux")
+        parts = sorted(cache_path.glob("*.parquet"))
+        self.assertEqual(len(parts), 2)
+
+        update_cached_dataframe(
+            "foo", "tmux", pd.DataFrame({
+                "entry": ["b2"],
+                CACHE_ID_COL: ["b"]
+            }), []
+        )
+
+        self.assertIn(parts[0], list(cache_path.glob("*.parquet")))
+        self.assertNotIn(parts[1], list(cache_path.glob("*.parquet")))
+        self.assertEqual(
+            sorted(load_cached_df_or_none("foo", "tmux", {})["entry"]),
+            ["a", "b2"]
+        )
@@ -0,0 +1,80 @@
+"""Test the data manager and its parsed report cache."""
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.helper_utils import run_in_test_environment
+from tests.report.test_aggregated_reports import GNU_TIME_OUTPUT1
+from varats.data.data_manager import DataManager, ParsedReportCache
+from varats.report.gnu_time_report import TimeReport
+from varats.utils.settings import vara_cfg
+
+
+class TestParsedReportCache(unittest.TestCase):
+    """Test if parsed reports are persisted and reused."""
+
+    @run_in_test_environment()
+    def test_parsed_report_is_reused(self) -> None:
+        """Test that a second data manager does not parse the report again."""
+        report_path = Path("time_report.txt")
+        report_path.write_text(GNU_TIME_OUTPUT1)
+        os.utime(report_path, ns=(0, 0))
+
+        report = DataManager().load_data_class_sync(report_path, TimeReport)
+        self.assertTrue(
+            any((Path(str(vara_cfg()["data_cache"])) /
+                 "parsed_reports").glob("*.pickle"))
+        )
+
+        with mock.patch.object(
+            TimeReport, "__init__", side_effect=AssertionError("parsed")
+        ):
+            cached_report = DataManager().load_data_class_sync(
+                report_path, TimeReport
+            )
+
+        self.assertEqual(cached_report.wall_clock_time, report.wall_clock_time)
+
+    @run_in_test_environment()
+    def test_changed_report_is_parsed_again(self) -> None:
+        """Test that cached reports are invalidated when the file changes."""
+        report_path = Path("time_report.txt")
+        report_path.write_text(GNU_TIME_OUTPUT1)
+        os.utime(report_path, ns=(0, 0))
+        DataManager().load_data_class_sync(report_path, TimeReport)
+
+        report_path.write_text(GNU_TIME_OUTPUT1.replace("0:02.00", "0:03.00"))
+        os.utime(report_path, ns=(1, 1))
+        report = DataManager().load_data_class_sync(report_path, TimeReport)
+
+        self.assertEqual(report.wall_clock_time.total_seconds(), 3.0)
+
+    @run_in_test_environment()
+    def test_recently_modified_report_is_not_cached(self) -> None:
+        """Test that reports that could still change unnoticed are not
+        cached."""
+        report_path = Path("time_report.txt")
+        report_path.write_text(GNU_TIME_OUTPUT1)
+        DataManager().load_data_class_sync(report_path, TimeReport)
+
+        self.assertFalse(
+            any((Path(str(vara_cfg()["data_cache"])) /
+                 "parsed_reports").glob("*.pickle"))
+        )
+
+    @run_in_test_environment()
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entries are evicted first."""
+        cache = ParsedReportCache(Path("cache"), 2500)
+        cache.store("a", "a" * 1000)
+        cache.store("b", "b" * 1000)
+        os.utime(Path("cache/a.pickle"), ns=(0, 0))
+        os.utime(Path("cache/b.pickle"), ns=(1, 1))
+
+        self.assertEqual(cache.load("a"), "a" * 1000)
+        cache.store("c", "c" * 1000)
+
+        self.assertIsNone(cache.load("b"))
+        self.assertEqual(cache.load("a"), "a" * 1000)
+        self.assertEqual(cache.load("c"), "c" * 1000)
@@ -1,5 +1,6 @@
 """Test revision helper functions."""
 
+import os
 import typing as tp
 import unittest
 import unittest.mock as mock
@@ -7,13 +8,18 @@ from pathlib import Path
 
 from benchbuild.utils.revision_ranges import block_revisions, SingleRevision
 
-from tests.helper_utils import DummyGit
+from tests.helper_utils import DummyGit, run_in_test_environment
 from varats.projects.c_projects.glibc import Glibc
 from varats.projects.c_projects.gravity import Gravity
-from varats.report.report import ReportFilename, ReportFilepath
+from varats.report.report import (
+    FileStatusExtension,
+    ReportFilename,
+    ReportFilepath,
+)
 from varats.revision.revisions import (
     filter_blocked_revisions,
     _split_into_config_file_lists,
+    ResultFileCatalog,
 )
 from varats.utils.git_util import ShortCommitHash
 
@@ -141,3 +147,94 @@ class TestRevisionHelpers(unittest.TestCase):
         self.assertEqual(len(config_id_mapping[42]), 2)
         self.assertTrue(self.file_paths[0] in config_id_mapping[42])
         self.assertTrue(self.file_paths[2] in config_id_mapping[42])
+
+
+class TestResultFileCatalog(unittest.TestCase):
+    """Test if the result file catalog correctly indexes result files."""
+
+    @run_in_test_environment()
+    def test_catalog_queries(self) -> None:
+        """Checks if result files can be queried by their properties."""
+        result_dir = Path("results/foo")
+        (result_dir / "CRE-CR-foo-bar-7bb9ef5f8c").mkdir(parents=True)
+        (
+            result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be_config-42_success.txt"
+        ).touch()
+        (
+            result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be_config-21_failed.txt"
+        ).touch()
+        (
+            result_dir / "CRE-TEF-foo-bar-3cd9ef5f8c_"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864bc_success.json"
+        ).touch()
+        (result_dir / "not_a_result_file.txt").touch()
+
+        catalog = ResultFileCatalog(result_dir)
+
+        self.assertEqual(len(catalog.entries()), 3)
+        self.assertEqual(len(catalog.entries("CRE", "CR")), 2)
+        self.assertEqual(len(catalog.entries(report_shorthand="TEF")), 1)
+        self.assertEqual(
+            catalog.entries("CRE", "CR", config_id=21)[0].file_status,
+            FileStatusExtension.FAILED
+        )
+        self.assertEqual(
+            len(
+                catalog.entries(
+                    commit_hash=ShortCommitHash("7bb9ef5f8c"),
+                    file_statuses=[FileStatusExtension.SUCCESS]
+                )
+            ), 1
+        )
+
+    @run_in_test_environment()
+    def test_catalog_ignores_symlinked_folders(self) -> None:
+        """Checks if symlinks to parent folders are not followed."""
+        result_dir = Path("results/foo")
+        (result_dir / "CRE-CR-foo-bar-7bb9ef5f8c").mkdir(parents=True)
+        (
+            result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be_config-42_success.txt"
+        ).touch()
+        (result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/parent"
+        ).symlink_to(result_dir.absolute(), target_is_directory=True)
+
+        catalog = ResultFileCatalog(result_dir)
+
+        self.assertEqual(len(catalog.entries("CRE", "CR")), 1)
+
+    @run_in_test_environment()
+    def test_catalog_update(self) -> None:
+        """Checks if only changed folders are rescanned."""
+        result_dir = Path("results/foo")
+        (result_dir / "CRE-CR-foo-bar-7bb9ef5f8c").mkdir(parents=True)
+        (
+            result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be_config-42_success.txt"
+        ).touch()
+
+        catalog = ResultFileCatalog(result_dir)
+        self.assertEqual(len(catalog.entries("CRE", "CR")), 1)
+
+        (
+            result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be_config-21_success.txt"
+        ).touch()
+        self.assertEqual(len(catalog.entries("CRE", "CR")), 2)
+
+        # age the folders so that their mtime can be trusted
+        for folder in [result_dir, result_dir / "CRE-CR-foo-bar-7bb9ef5f8c"]:
+            os.utime(folder, ns=(0, 0))
+        self.assertEqual(len(catalog.entries("CRE", "CR")), 2)
+
+        with mock.patch("os.scandir", wraps=os.scandir) as mocked_scandir:
+            self.assertEqual(len(catalog.entries("CRE", "CR")), 2)
+            mocked_scandir.assert_not_called()
+
+        (
+            result_dir / "CRE-CR-foo-bar-7bb9ef5f8c/"
+            "fdb09c5a-4cee-42d8-bbdc-4afe7a7864be_config-42_success.txt"
+        ).unlink()
+        self.assertEqual(len(catalog.entries("CRE", "CR")), 1)
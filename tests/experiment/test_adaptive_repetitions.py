@@ -0,0 +1,81 @@
+"""Test the adaptive repetition of measurements."""
+import itertools
+import math
+import typing as tp
+import unittest
+from unittest import mock
+
+from tests.helper_utils import run_in_test_environment
+from varats.experiments.vara.feature_perf_precision import AdaptiveRepetitions
+from varats.utils.settings import vara_cfg
+
+
+def _measure(
+    repetitions: AdaptiveRepetitions, durations: tp.Iterable[float]
+) -> int:
+    """Measure a single workload with the given durations until the
+    repetitions stop and return the number of repetitions."""
+    timestamps = itertools.chain.from_iterable(
+        (0.0, duration) for duration in durations
+    )
+    with mock.patch(
+        "varats.experiments.vara.feature_perf_precision.perf_counter",
+        side_effect=timestamps
+    ):
+        for _ in repetitions:
+            with repetitions.measure("workload"):
+                pass
+
+    return repetitions.precision().repetitions
+
+
+class TestAdaptiveRepetitions(unittest.TestCase):
+    """Test if measurements are repeated until they are precise enough."""
+
+    @run_in_test_environment()
+    def test_fixed_repetitions_without_target_precision(self) -> None:
+        """Check if measurements are repeated a fixed number of times if no
+        target precision is configured."""
+        repetitions = AdaptiveRepetitions.from_config(5)
+
+        self.assertEqual(_measure(repetitions, itertools.repeat(1.0)), 5)
+        self.assertFalse(repetitions.is_precise_enough())
+        self.assertEqual(repetitions.precision().precision, 0.0)
+
+    @run_in_test_environment()
+    def test_stop_when_precise_enough(self) -> None:
+        """Check if the repetitions stop as soon as the confidence interval is
+        narrow enough."""
+        vara_cfg()["experiment"]["repetition_target_precision"] = 0.05
+        vara_cfg()["experiment"]["min_repetitions"] = 3
+        vara_cfg()["experiment"]["max_repetitions"] = 10
+        repetitions = AdaptiveRepetitions.from_config(5)
+
+        self.assertEqual(
+            _measure(
+                repetitions, itertools.chain([1.0, 1.1], itertools.repeat(1.0))
+            ), 6
+        )
+        self.assertTrue(repetitions.is_precise_enough())
+
+        precision = repetitions.precision()
+        self.assertLessEqual(precision.precision, 0.05)
+        self.assertEqual(precision.confidence, AdaptiveRepetitions.CONFIDENCE)
+        self.assertEqual(list(precision.workload_precisions), ["workload"])
+
+    @run_in_test_environment()
+    def test_stop_at_max_repetitions(self) -> None:
+        """Check if noisy measurements are not repeated more often than the
+        maximal number of repetitions."""
+        repetitions = AdaptiveRepetitions(2, 6, 0.01)
+
+        self.assertEqual(_measure(repetitions, itertools.cycle([1.0, 3.0])), 6)
+        self.assertFalse(repetitions.is_precise_enough())
+        self.assertGreater(repetitions.precision().precision, 0.01)
+
+    def test_single_measurement_has_no_precision(self) -> None:
+        """Check if a single measurement does not count as precise."""
+        repetitions = AdaptiveRepetitions(1, 1)
+
+        self.assertEqual(_measure(repetitions, [1.0]), 1)
+        self.assertTrue(math.isinf(repetitions.workload_precision("workload")))
@@ -0,0 +1,138 @@
+"""Test the parallel compilation of patched project variants."""
+import os
+import typing as tp
+import unittest
+from pathlib import Path
+
+from benchbuild.utils.actions import StepResult
+from benchbuild.utils.cmd import git
+from plumbum import local
+
+from tests.helper_utils import run_in_test_environment
+from varats.experiment.steps.patched_variants import (
+    CompilePatchedVariants,
+    create_patched_variant,
+    PATCHED_VARIANTS_DIR,
+)
+from varats.project.varats_project import VProject
+from varats.provider.patch.patch_provider import Patch
+from varats.utils.settings import bb_cfg
+
+_PATCH = """diff --git a/value.txt b/value.txt
+--- a/value.txt
++++ b/value.txt
+@@ -1 +1 @@
+-baseline
++{shortname}
+"""
+
+
+class _DummyProject():
+    """Project that compiles by recording the value of its source file."""
+
+    name = "DummyProject"
+
+    def __init__(self, builddir: Path) -> None:
+        self.builddir = local.path(builddir)
+
+    @property
+    def source_of_primary(self) -> str:
+        return str(self.builddir / "src")
+
+    def compile(self) -> None:
+        source = Path(self.source_of_primary)
+        (source / "build.txt").write_text(
+            f"{(source / 'value.txt').read_text().strip()} {os.getpid()}"
+        )
+
+
+def _create_dummy_project(builddir: Path) -> VProject:
+    source = builddir / "src"
+    source.mkdir(parents=True)
+    (source / "value.txt").write_text("baseline\n")
+    git("init", "-q", source)
+    return tp.cast(VProject, _DummyProject(builddir))
+
+
+def _create_patch(shortname: str) -> Patch:
+    patch_path = Path(f"{shortname}.patch").absolute()
+    patch_path.write_text(_PATCH.format(shortname=shortname))
+    return Patch("DummyProject", shortname, "desc", patch_path)
+
+
+class TestPatchedVariants(unittest.TestCase):
+    """Test building patched variants of a project."""
+
+    @run_in_test_environment()
+    def test_variant_has_own_build_directory(self) -> None:
+        """Check if a variant only differs in its build directory and does not
+        share instance specific compile functions."""
+        project = _create_dummy_project(Path("build"))
+        project.compile = lambda: None  # type: ignore
+        variant = create_patched_variant(project, _create_patch("fast"))
+
+        self.assertEqual(variant.patch.shortname, "fast")
+        self.assertEqual(
+            Path(variant.project.builddir),
+            Path("build").absolute() / PATCHED_VARIANTS_DIR / "fast"
+        )
+        self.assertEqual(
+            Path(variant.project.source_of_primary),
+            Path(variant.project.builddir) / "src"
+        )
+        self.assertEqual(variant.project.name, project.name)
+        self.assertNotIn("compile", vars(variant.project))
+        self.assertEqual(Path(project.builddir), Path("build").absolute())
+
+    @run_in_test_environment()
+    def test_variants_are_compiled_in_parallel(self) -> None:
+        """Check if every variant is compiled with its patch applied in its own
+        build directory by a worker process."""
+        bb_cfg()["jobs"] = 4
+        project = _create_dummy_project(Path("build"))
+        variants = [
+            create_patched_variant(project, _create_patch(shortname))
+            for shortname in ["fast", "slow"]
+        ]
+
+        step = CompilePatchedVariants(project, variants, build_slots=2)
+        self.assertEqual(step(), StepResult.OK)
+
+        baseline_source = Path(project.source_of_primary)
+        baseline_value, baseline_pid = (baseline_source /
+                                        "build.txt").read_text().split()
+        self.assertEqual(baseline_value, "baseline")
+        self.assertEqual(int(baseline_pid), os.getpid())
+
+        for variant in variants:
+            variant_source = Path(variant.project.source_of_primary)
+            variant_value, variant_pid = (variant_source /
+                                          "build.txt").read_text().split()
+            self.assertEqual(variant_value, variant.patch.shortname)
+            self.assertNotEqual(int(variant_pid), os.getpid())
+            self.assertFalse(
+                (Path(variant.project.builddir) / PATCHED_VARIANTS_DIR).exists()
+            )
+
+        self.assertEqual((baseline_source / "value.txt").read_text(),
+                         "baseline\n")
+        self.assertEqual(bb_cfg()["jobs"].value, 4)
+
+    @run_in_test_environment()
+    def test_failing_variant_marks_step_as_failed(self) -> None:
+        """Check if a patch that cannot be applied fails the step without
+        stopping the other builds."""
+        project = _create_dummy_project(Path("build"))
+        broken_patch = _create_patch("broken")
+        broken_patch.path.write_text("not a patch\n")
+        variants = [
+            create_patched_variant(project, _create_patch("fast")),
+            create_patched_variant(project, broken_patch)
+        ]
+
+        step = CompilePatchedVariants(project, variants, build_slots=1)
+        self.assertEqual(step(), StepResult.ERROR)
+        for built_project in [project, variants[0].project]:
+            self.assertTrue(
+                (Path(built_project.source_of_primary) / "build.txt").exists()
+            )
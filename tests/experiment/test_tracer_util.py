@@ -0,0 +1,86 @@
+"""Test the utilities to attach tracers to binaries."""
+import unittest
+from pathlib import Path
+from time import monotonic
+
+from plumbum import BG, local, ProcessExecutionError
+
+from tests.helper_utils import run_in_test_environment
+from varats.experiment.tracer_util import (
+    create_bpftrace_script_with_ready_signal,
+    wait_for_tracer,
+)
+
+
+class TestCreateBpftraceScriptWithReadySignal(unittest.TestCase):
+    """Test the extension of bpftrace scripts with a ready signal."""
+
+    @run_in_test_environment()
+    def test_script_is_extended_with_ready_signal(self) -> None:
+        """Check if the copied script keeps the original probes and creates the
+        ready file in a BEGIN probe."""
+        script = Path("UsdtTefMarker.bt").absolute()
+        script.write_text("usdt:*:* { printf(\"probe\"); }\n")
+        tmp_dir = Path("tmp").absolute()
+        tmp_dir.mkdir()
+        (tmp_dir / "UsdtTefMarker.ready").touch()
+
+        ready_script, ready_file = create_bpftrace_script_with_ready_signal(
+            script, tmp_dir
+        )
+
+        self.assertEqual(ready_script, tmp_dir / "UsdtTefMarker.bt")
+        self.assertEqual(ready_file, tmp_dir / "UsdtTefMarker.ready")
+        self.assertFalse(ready_file.exists())
+
+        content = ready_script.read_text()
+        self.assertTrue(content.startswith(script.read_text()))
+        self.assertIn("BEGIN", content)
+        self.assertIn(f"system(\"touch {ready_file}\");", content)
+
+
+class TestWaitForTracer(unittest.TestCase):
+    """Test waiting for tracers that run in the background."""
+
+    @run_in_test_environment()
+    def test_return_once_tracer_is_ready(self) -> None:
+        """Check if waiting stops as soon as the tracer creates its ready
+        file."""
+        ready_file = Path("tracer.ready").absolute()
+        tracer = local["sh"]["-c",
+                             f"sleep 0.2; touch {ready_file}; sleep 1"] & BG
+
+        start = monotonic()
+        wait_for_tracer(tracer, ready_file, timeout=30)
+
+        self.assertLess(monotonic() - start, 10)
+        self.assertTrue(ready_file.exists())
+        self.assertFalse(tracer.poll())
+        tracer.wait()
+
+    @run_in_test_environment()
+    def test_tracer_terminates_before_ready(self) -> None:
+        """Check if a tracer that terminates without signalling readiness is
+        reported as error."""
+        ready_file = Path("tracer.ready").absolute()
+
+        with self.assertRaises(RuntimeError):
+            wait_for_tracer(local["true"] & BG, ready_file, timeout=30)
+
+        with self.assertRaises(ProcessExecutionError):
+            wait_for_tracer(local["false"] & BG, ready_file, timeout=30)
+
+    @run_in_test_environment()
+    def test_timeout_without_ready_signal(self) -> None:
+        """Check if the tracer is assumed to be ready after the timeout if it
+        does not signal readiness."""
+        tracer = local["sleep"]["5"] & BG
+
+        start = monotonic()
+        with self.assertLogs("varats.experiment.tracer_util", "WARNING"):
+            wait_for_tracer(tracer, Path("tracer.ready").absolute(), 0.2)
+        wait_for_tracer(tracer, None, 0.2)
+
+        self.assertLess(monotonic() - start, 4)
+        self.assertFalse(tracer.poll())
+        tracer.proc.kill()
@@ -0,0 +1,157 @@
+"""Test the commit map and its persisted index."""
+import typing as tp
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pygit2
+
+from tests.helper_utils import run_in_test_environment
+from varats.mapping.commit_map import CommitMap, CommitMapIndex
+from varats.utils.git_util import (
+    FullCommitHash,
+    ShortCommitHash,
+    full_commit_hashes_sorted_by_time_id,
+    short_commit_hashes_sorted_by_time_id,
+)
+
+
+def _commit(
+    repo: pygit2.Repository,
+    message: str,
+    commit_time: int,
+    ref: str = "HEAD",
+    parents: tp.Optional[tp.List[pygit2.Oid]] = None
+) -> pygit2.Oid:
+    signature = pygit2.Signature("Jon Doe", "jon@doe.com", commit_time, 0)
+    if parents is None:
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+    return repo.create_commit(
+        ref, signature, signature, message,
+        repo.TreeBuilder().write(), parents
+    )
+
+
+def _create_repo(path: Path) -> tp.Tuple[pygit2.Repository, tp.List[str]]:
+    """Create a repository with a linear history on master and one side
+    branch."""
+    repo = pygit2.init_repository(str(path))
+    commits = [str(_commit(repo, f"c{i}", 1000 + i)) for i in range(6)]
+    _commit(repo, "side", 2000, "refs/heads/side", [pygit2.Oid(hex=commits[2])])
+    return repo, commits
+
+
+class TestCommitMap(unittest.TestCase):
+    """Test CommitMap generation from a local repository."""
+
+    @run_in_test_environment()
+    def test_time_id(self) -> None:
+        """Test that time ids follow the commit order."""
+        _, commits = _create_repo(Path("repo"))
+        cmap = CommitMap(Path("repo"))
+
+        for time_id, commit in enumerate(commits):
+            self.assertEqual(cmap.time_id(FullCommitHash(commit)), time_id)
+        self.assertEqual(len(cmap.mapping_items()), 7)
+        self.assertEqual(len(cmap.mapping_items_master()), 6)
+        self.assertEqual(cmap.c_hash(3), FullCommitHash(commits[3]))
+        self.assertEqual(cmap.short_time_id(ShortCommitHash(commits[4])), 4)
+
+    @run_in_test_environment()
+    def test_range(self) -> None:
+        """Test that only commits in ]start..end] are mapped."""
+        _, commits = _create_repo(Path("repo"))
+        cmap = CommitMap(Path("repo"), end=commits[4], start=commits[1])
+
+        self.assertEqual({c_hash for c_hash, _ in cmap.mapping_items_master()},
+                         set(commits[2:5]))
+        self.assertNotIn(commits[1], dict(cmap.mapping_items()))
+        self.assertIn(commits[5], dict(cmap.mapping_items()))
+
+    @run_in_test_environment()
+    def test_index_is_persisted(self) -> None:
+        """Test that the index is stored and reused by other commit maps."""
+        _create_repo(Path("repo"))
+        CommitMap(Path("repo")).mapping_items()
+
+        key = CommitMapIndex.index_key(Path("repo"), "HEAD", None, "HEAD")
+        index = CommitMapIndex.load(
+            CommitMapIndex.index_path(Path("repo"), key), key
+        )
+        self.assertIsNotNone(index)
+        self.assertEqual(len(tp.cast(CommitMapIndex, index)), 7)
+
+    @run_in_test_environment()
+    def test_index_update(self) -> None:
+        """Test that new commits are appended to an existing index."""
+        repo, commits = _create_repo(Path("repo"))
+        CommitMap(Path("repo")).mapping_items()
+
+        new_commit = str(_commit(repo, "c6", 3000))
+        cmap = CommitMap(Path("repo"))
+
+        for time_id, commit in enumerate(commits):
+            self.assertEqual(cmap.time_id(FullCommitHash(commit)), time_id)
+        self.assertEqual(cmap.time_id(FullCommitHash(new_commit)), 7)
+        self.assertIn(new_commit, dict(cmap.mapping_items_master()))
+
+    @run_in_test_environment()
+    def test_index_update_with_old_commit(self) -> None:
+        """Test that the index is rebuilt if a new commit is older than indexed
+        commits, so time ids match a freshly built index."""
+        repo, commits = _create_repo(Path("repo"))
+        CommitMap(Path("repo")).mapping_items()
+
+        old_commit = str(_commit(repo, "old", 500, "refs/heads/old", []))
+        cmap = CommitMap(Path("repo"))
+
+        self.assertEqual(cmap.time_id(FullCommitHash(old_commit)), 0)
+        for time_id, commit in enumerate(commits, start=1):
+            self.assertEqual(cmap.time_id(FullCommitHash(commit)), time_id)
+
+    @run_in_test_environment()
+    def test_bulk_conversion(self) -> None:
+        """Test converting multiple hashes and time ids at once."""
+        _, commits = _create_repo(Path("repo"))
+        cmap = CommitMap(Path("repo"))
+
+        self.assertEqual(
+            list(cmap.time_ids([commits[3],
+                                FullCommitHash(commits[1])])), [3, 1]
+        )
+        self.assertEqual(
+            list(
+                cmap.short_time_ids(
+                    pd.Series([ShortCommitHash(commits[5]), commits[0][:4]])
+                )
+            ), [5, 0]
+        )
+        self.assertEqual(
+            cmap.c_hashes(np.array([2, 0])),
+            [FullCommitHash(commits[2]),
+             FullCommitHash(commits[0])]
+        )
+        self.assertRaises(KeyError, cmap.time_ids, ["0" * 40])
+        self.assertRaises(KeyError, cmap.c_hash, 42)
+
+    @run_in_test_environment()
+    def test_sorted_by_time_id(self) -> None:
+        """Test sorting commit hashes by their time ids."""
+        _, commits = _create_repo(Path("repo"))
+        cmap = CommitMap(Path("repo"))
+        full_hashes = [FullCommitHash(commit) for commit in commits]
+
+        self.assertEqual(
+            full_commit_hashes_sorted_by_time_id(reversed(full_hashes), cmap),
+            full_hashes
+        )
+        self.assertEqual(
+            short_commit_hashes_sorted_by_time_id([
+                full_hashes[4].to_short_commit_hash(),
+                full_hashes[2].to_short_commit_hash()
+            ], cmap), [
+                full_hashes[2].to_short_commit_hash(),
+                full_hashes[4].to_short_commit_hash()
+            ]
+        )
@@ -3,6 +3,7 @@ import typing as tp
 import unittest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest import mock
 
 from tests.helper_utils import run_in_test_environment, UnitTestFixtures
 from varats.experiments.base.just_compile import JustCompileReport
@@ -12,12 +13,15 @@ from varats.paper.paper_config import (
     get_loaded_paper_config,
     get_paper_config,
 )
+from varats.paper_mgmt import artefacts as artefacts_module
 from varats.paper_mgmt.artefacts import (
+    ArtefactFileInfo,
     initialize_artefact_types,
     Artefacts,
     Artefact,
     load_artefacts_from_file,
     load_artefacts,
+    generate_artefacts,
 )
 from varats.plot.plots import PlotArtefact, PlotConfig, CommonPlotOptions
 from varats.plots.case_study_overview import CaseStudyOverviewGenerator
@@ -196,3 +200,133 @@ class TestArtefacts(unittest.TestCase):
         cs_all = churn_all.plot_kwargs["case_study"]
         self.assertIsInstance(cs_all, tp.List)
         self.assertEqual(2, len(cs_all))
+
+
+class TestArtefactGeneration(unittest.TestCase):
+    """Test the generation of artefacts."""
+
+    @classmethod
+    def setUp(cls) -> None:
+        """Register the artefact types."""
+        initialize_plots()
+        initialize_tables()
+        initialize_artefact_types()
+
+    @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
+    def test_artefacts_grouped_by_project(self) -> None:
+        """Check if artefacts that share a project are grouped together."""
+        vara_cfg()['paper_config']['current_config'] = "test_artefacts_driver"
+        load_paper_config()
+        artefacts = load_artefacts(get_paper_config())
+
+        cs_overview_xz = tp.cast(
+            Artefact, artefacts.get_artefact("CS Overview (xz)")
+        )
+        self.assertEqual({"xz"}, cs_overview_xz.get_project_names())
+        paper_config_overview = tp.cast(
+            Artefact, artefacts.get_artefact("Paper Config Overview")
+        )
+        self.assertEqual(set(), paper_config_overview.get_project_names())
+
+        groups = getattr(artefacts_module,
+                         "_group_artefacts_by_project")(artefacts)
+        self.assertEqual([
+            ["CS Overview (xz)", "Repo Churn (all)"], ["Paper Config Overview"],
+            ["Correlation Table"]
+        ], [[artefact.name for artefact in group] for group in groups])
+
+    @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
+    def test_input_fingerprint(self) -> None:
+        """Check if the input fingerprint changes with the result files."""
+        vara_cfg()['paper_config']['current_config'] = "test_artefacts_driver"
+        load_paper_config()
+        artefacts = load_artefacts(get_paper_config())
+        cs_overview_xz = tp.cast(
+            Artefact, artefacts.get_artefact("CS Overview (xz)")
+        )
+        paper_config_overview = tp.cast(
+            Artefact, artefacts.get_artefact("Paper Config Overview")
+        )
+        cs_overview_fingerprint = cs_overview_xz.get_input_fingerprint()
+        pc_overview_fingerprint = paper_config_overview.get_input_fingerprint()
+        self.assertEqual(
+            cs_overview_fingerprint, cs_overview_xz.get_input_fingerprint()
+        )
+
+        result_dir = Path(str(vara_cfg()['result_dir'])) / "gravity"
+        result_dir.mkdir(parents=True)
+        (
+            result_dir / "JC-JC-gravity-gravity-b51227de55_"
+            "8bc2ac4c-b6e3-43d1-aff9-c6b32126b155_success.txt"
+        ).touch()
+
+        self.assertEqual(
+            cs_overview_fingerprint, cs_overview_xz.get_input_fingerprint()
+        )
+        self.assertNotEqual(
+            pc_overview_fingerprint,
+            paper_config_overview.get_input_fingerprint()
+        )
+
+    @staticmethod
+    def __create_artefact_mock(name: str, output_dir: Path) -> mock.Mock:
+        artefact = mock.Mock(spec=Artefact)
+        artefact.name = name
+        artefact.output_dir = output_dir
+        artefact.get_project_names.return_value = {"xz"}
+        artefact.get_input_fingerprint.return_value = f"{name}-fingerprint"
+        artefact.get_artefact_file_infos.return_value = [
+            ArtefactFileInfo(f"{name}.txt")
+        ]
+        artefact.generate_artefact.side_effect = lambda progress: (
+            output_dir / f"{name}.txt"
+        ).touch()
+        return artefact
+
+    @run_in_test_environment()
+    def test_failing_artefact_does_not_stop_generation(self) -> None:
+        """Check if all artefacts are generated even if one of them fails."""
+        artefacts = [
+            self.__create_artefact_mock(name, Path.cwd())
+            for name in ["first", "failing", "last"]
+        ]
+        artefacts[1].generate_artefact.side_effect = ValueError("broken")
+
+        results = generate_artefacts(artefacts, jobs=1)
+
+        self.assertEqual(["first", "failing", "last"],
+                         [result.name for result in results])
+        self.assertEqual([True, False, True],
+                         [result.succeeded for result in results])
+        self.assertIn("ValueError: broken", tp.cast(str, results[1].error))
+        for artefact in artefacts:
+            artefact.generate_artefact.assert_called_once()
+
+    @run_in_test_environment()
+    def test_up_to_date_artefacts_are_skipped(self) -> None:
+        """Check if only artefacts with changed inputs are generated again."""
+        first, second = [
+            self.__create_artefact_mock(name, Path.cwd())
+            for name in ["first", "second"]
+        ]
+        generate_artefacts([first, second], jobs=1)
+
+        second.get_input_fingerprint.return_value = "changed"
+        results = generate_artefacts([first, second], jobs=1)
+        self.assertEqual({
+            "first": True,
+            "second": False
+        }, {result.name: result.up_to_date for result in results})
+        first.generate_artefact.assert_called_once()
+        self.assertEqual(2, second.generate_artefact.call_count)
+
+        Path("first.txt").unlink()
+        results = generate_artefacts([first, second], jobs=1)
+        self.assertEqual({
+            "first": False,
+            "second": True
+        }, {result.name: result.up_to_date for result in results})
+        self.assertEqual(2, first.generate_artefact.call_count)
+
+        results = generate_artefacts([first, second], jobs=1, force=True)
+        self.assertFalse(any(result.up_to_date for result in results))
@@ -3,11 +3,16 @@
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import numpy as np
 
 from varats.experiment.experiment_util import ZippedReportFolder
 from varats.report.gnu_time_report import TimeReportAggregate
+from varats.report.measurement_precision import (
+    MeasurementPrecision,
+    store_measurement_precision,
+)
 
 GNU_TIME_OUTPUT1 = """	Command being timed: "sleep 2"
 	User time (seconds): 0.00
@@ -90,3 +95,61 @@ class TestTimeReportAggregate(unittest.TestCase):
                 np.std(time_aggregate.measurements_wall_clock_time)
             )
             self.assertEqual(mean_std, (3.0, 1.0))
+
+    def test_lazy_and_parallel_loading(self) -> None:
+        """Test if reports are only parsed on access and can be parsed in
+        parallel."""
+
+        num_reports = 4
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = Path(tmp_dir) / "TimeAggregateParallelTest.zip"
+            with ZippedReportFolder(tmp_file) as time_reports_dir:
+                for i in range(num_reports):
+                    (Path(time_reports_dir) /
+                     f"time_report_{i}.txt").write_text(
+                         GNU_TIME_OUTPUT1 if i % 2 else GNU_TIME_OUTPUT2
+                     )
+
+            with mock.patch(
+                "varats.report.gnu_time_report.TimeReport.__init__",
+                side_effect=AssertionError("Report was parsed eagerly.")
+            ):
+                time_aggregate = TimeReportAggregate(tmp_file)
+
+            time_aggregate.load_all_reports(jobs=2)
+            self.assertEqual(len(time_aggregate.reports()), num_reports)
+            self.assertEqual(
+                sorted(time_aggregate.measurements_wall_clock_time),
+                [2.0, 2.0, 4.0, 4.0]
+            )
+
+    def test_measurement_precision(self) -> None:
+        """Test if the recorded precision of the measurements is provided
+        without being parsed as a report."""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = Path(tmp_dir) / "TimeAggregatePrecisionTest.zip"
+            with ZippedReportFolder(tmp_file) as time_reports_dir:
+                for i in range(2):
+                    (Path(time_reports_dir) /
+                     f"time_report_{i}.txt").write_text(GNU_TIME_OUTPUT1)
+                store_measurement_precision(
+                    Path(time_reports_dir),
+                    MeasurementPrecision(2, 0.95, {"sleep": 0.01})
+                )
+
+            time_aggregate = TimeReportAggregate(tmp_file)
+            self.assertEqual(len(time_aggregate.reports()), 2)
+
+            precision = time_aggregate.measurement_precision
+            assert precision is not None
+            self.assertEqual(precision.repetitions, 2)
+            self.assertEqual(precision.confidence, 0.95)
+            self.assertEqual(precision.workload_precisions, {"sleep": 0.01})
+            self.assertEqual(precision.precision, 0.01)
+
+            self.assertIsNone(
+                TimeReportAggregate(Path(tmp_dir) / "Missing.zip"
+                                   ).measurement_precision
+            )
@@ -1,7 +1,11 @@
 """Test blame interaction graphs."""
 
+import typing as tp
 import unittest
+from unittest import mock
 
+import networkx as nx
+import pygit2
 import pytest
 
 from tests.helper_utils import run_in_test_environment, UnitTestFixtures
@@ -9,8 +13,9 @@ from varats.data.reports.blame_interaction_graph import (
     create_blame_interaction_graph,
     create_file_based_interaction_graph,
     get_author_data,
+    InteractionGraph,
 )
-from varats.data.reports.blame_report import BlameReport
+from varats.data.reports.blame_report import BlameReport, BlameTaintData
 from varats.experiments.vara.blame_report_experiment import (
     BlameReportExperiment,
 )
@@ -19,6 +24,12 @@ from varats.paper_mgmt.case_study import (
     newest_processed_revision_for_case_study,
 )
 from varats.projects.discover_projects import initialize_projects
+from varats.utils.git_util import (
+    CommitMetadataStore,
+    CommitRepoPair,
+    FullCommitHash,
+    UNCOMMITTED_COMMIT_HASH,
+)
 from varats.utils.settings import vara_cfg
 
 
@@ -115,3 +126,117 @@ class TestBlameInteractionGraphs(unittest.TestCase):
         self.assertEqual(author_data["neighbors"], set())
         self.assertEqual(0, len(author_data["in_attrs"]))
         self.assertEqual(0, len(author_data["out_attrs"]))
+
+
+class _StaticInteractionGraph(InteractionGraph):
+
+    def __init__(self, interaction_graph: nx.DiGraph):
+        super().__init__("test_project")
+        self.__interaction_graph = interaction_graph
+
+    @property
+    def _graph_id(self) -> str:
+        return f"static-{id(self.__interaction_graph)}"
+
+    def _interaction_graph(self) -> nx.DiGraph:
+        return self._cached_graph("ig", lambda: self.__interaction_graph)
+
+
+class TestAuthorInteractionGraph(unittest.TestCase):
+    """Test if interactions are grouped by author."""
+
+    @run_in_test_environment()
+    def test_author_interaction_graph(self) -> None:
+        """Test that nodes and edges are aggregated per author."""
+        repo = pygit2.init_repository("repo")
+        commits: tp.List[CommitRepoPair] = []
+        for author in ["Alice", "Bob", "Alice"]:
+            signature = pygit2.Signature(author, f"{author}@example.com")
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            commits.append(
+                CommitRepoPair(
+                    FullCommitHash(
+                        str(
+                            repo.create_commit(
+                                "HEAD", signature, signature, "update",
+                                repo.TreeBuilder().write(), parents
+                            )
+                        )
+                    ), "repo"
+                )
+            )
+        commits.append(CommitRepoPair(UNCOMMITTED_COMMIT_HASH, "repo"))
+        nodes = [BlameTaintData(commit) for commit in commits]
+
+        interaction_graph = nx.DiGraph()
+        interaction_graph.add_nodes_from([(node, {
+            "blame_taint_data": node
+        }) for node in nodes])
+        interaction_graph.add_edge(nodes[0], nodes[1], amount=2)
+        interaction_graph.add_edge(nodes[2], nodes[1], amount=3)
+        interaction_graph.add_edge(nodes[0], nodes[2], amount=4)
+        interaction_graph.add_edge(nodes[3], nodes[0], amount=1)
+
+        with mock.patch(
+            "varats.data.reports.blame_interaction_graph."
+            "get_commit_metadata_store",
+            return_value=CommitMetadataStore({"repo": repo})
+        ):
+            aig = _StaticInteractionGraph(interaction_graph
+                                         ).author_interaction_graph()
+
+        self.assertEqual(set(aig.nodes), {"Alice", "Bob", "Unknown"})
+        self.assertEqual(aig.nodes["Alice"]["num_commits"], 2)
+        self.assertEqual(
+            set(aig.nodes["Alice"]["commits"]), {commits[0], commits[2]}
+        )
+        self.assertEqual(
+            set(aig.edges), {("Alice", "Bob"), ("Unknown", "Alice")}
+        )
+        self.assertEqual(aig["Alice"]["Bob"]["amount"], 5)
+        self.assertEqual(
+            set(aig["Alice"]["Bob"]["interactions"]), {(commits[0], commits[1]),
+                                                       (commits[2], commits[1])}
+        )
+        self.assertEqual(aig["Unknown"]["Alice"]["amount"], 1)
+
+
+class TestInteractionGraphMemoization(unittest.TestCase):
+    """Test if derived interaction graphs are shared read-only graphs."""
+
+    @run_in_test_environment()
+    def test_graphs_are_memoized_and_frozen(self) -> None:
+        """Test that graphs are only created once and cannot be modified."""
+        commit_a = CommitRepoPair(FullCommitHash("a" * 40), "repo")
+        commit_b = CommitRepoPair(FullCommitHash("b" * 40), "repo")
+        nodes = [BlameTaintData(commit_a), BlameTaintData(commit_b)]
+        interaction_graph = nx.DiGraph()
+        interaction_graph.add_nodes_from([(node, {
+            "blame_taint_data": node
+        }) for node in nodes])
+        interaction_graph.add_edge(nodes[0], nodes[1], amount=2)
+        graph = _StaticInteractionGraph(interaction_graph)
+
+        big = graph.blame_interaction_graph()
+        self.assertIs(big, graph.blame_interaction_graph())
+        self.assertTrue(nx.is_frozen(big))
+        self.assertRaises(nx.NetworkXError, big.add_node, "new_node")
+
+        with mock.patch(
+            "varats.data.reports.blame_interaction_graph.nx.quotient_graph",
+            wraps=nx.quotient_graph
+        ) as mocked_quotient_graph:
+            cig = graph.commit_interaction_graph()
+            self.assertIs(cig, graph.commit_interaction_graph())
+            mocked_quotient_graph.assert_called_once()
+        self.assertTrue(nx.is_frozen(cig))
+        self.assertEqual(set(cig.edges), {(commit_a, commit_b)})
+        self.assertEqual(cig[commit_a][commit_b]["amount"], 2)
+
+        with mock.patch(
+            "varats.data.reports.blame_interaction_graph.nx.quotient_graph"
+        ) as mocked_quotient_graph:
+            cached_cig = _StaticInteractionGraph(interaction_graph
+                                                ).commit_interaction_graph()
+            mocked_quotient_graph.assert_not_called()
+        self.assertEqual(set(cached_cig.edges), set(cig.edges))
@@ -2,7 +2,10 @@
 
 import unittest
 from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
 
+from tests.helper_utils import run_in_test_environment
 from varats.provider.patch.patch_provider import Patch
 from varats.report.multi_patch_report import MultiPatchReport
 
@@ -74,3 +77,32 @@ class TestMultiPatchReport(unittest.TestCase):
             _parse_patch_shorthand_from_report_name(patched_report_name),
             patch_shortname
         )
+
+    @run_in_test_environment()
+    def test_reports_are_created_on_access(self) -> None:
+        """Test that only the accessed reports are extracted and parsed."""
+        with ZipFile("mpr.zip", "w") as archive:
+            archive.writestr("baseline_report.txt", "baseline")
+            for shortname in ["first", "second"]:
+                archive.writestr(
+                    MultiPatchReport.create_patched_report_name(
+                        Patch("MyPatch", shortname, "desc", Path()),
+                        "report.txt"
+                    ), shortname
+                )
+
+        report_type = mock.Mock(side_effect=lambda path: path.read_text())
+        multi_report = MultiPatchReport(Path("mpr.zip"), report_type)
+
+        self.assertEqual(["first", "second"], multi_report.get_patch_names())
+        report_type.assert_not_called()
+
+        self.assertEqual("second", multi_report.get_report_for_patch("second"))
+        self.assertEqual("second", multi_report.get_report_for_patch("second"))
+        self.assertIsNone(multi_report.get_report_for_patch("unknown"))
+        report_type.assert_called_once()
+
+        self.assertEqual("baseline", multi_report.get_baseline_report())
+        self.assertEqual(["first", "second"],
+                         list(multi_report.get_patched_reports()))
+        self.assertEqual(3, report_type.call_count)
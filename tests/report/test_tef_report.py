@@ -5,7 +5,13 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from varats.report.tef_report import TEFReport, TraceEvent, TraceEventType
+from tests.helper_utils import run_in_test_environment
+from varats.report.tef_report import (
+    TEFReport,
+    TraceEvent,
+    TraceEventType,
+    trace_event_type_from_id,
+)
 
 TRACE_EVENT_FORMAT_OUTPUT = """{
     "traceEvents": [{
@@ -216,7 +222,9 @@ class TestTEFReportParser(unittest.TestCase):
         """Load and prepare TEF report."""
         with mock.patch(
             'builtins.open',
-            new=mock.mock_open(read_data=TRACE_EVENT_FORMAT_OUTPUT)
+            new=mock.mock_open(
+                read_data=TRACE_EVENT_FORMAT_OUTPUT.encode("utf-8")
+            )
         ):
             cls.report = TEFReport(Path("fake_file_path"))
 
@@ -236,3 +244,45 @@ class TestTEFReportParser(unittest.TestCase):
         # Currently, not implemented so we should get an exception.
         with self.assertRaises(NotImplementedError):
             _ = self.report.stack_frames
+
+    def test_event_columns(self) -> None:
+        """Test if the trace events are stored in columnar form."""
+        columns = self.report.event_columns
+
+        self.assertEqual(len(columns), 8)
+        self.assertEqual([
+            self.report.name_id_mapper.infer_name(name_id)
+            for name_id in columns.name_id
+        ], ["Base", "Foo", "Foo", "Bar", "Bar", "Foo_2", "Foo_2", "Base"])
+        self.assertEqual(
+            list(self.report.name_id_mapper), ["Base", "Foo", "Bar", "Foo_2"]
+        )
+        self.assertEqual(
+            trace_event_type_from_id(columns.event_type[2]),
+            TraceEventType.DURATION_EVENT_END
+        )
+        self.assertEqual(columns.timestamp[7], 1637675341728008439)
+        self.assertEqual(columns.pid[0], 91098)
+
+
+class TestTEFReportLostEvents(unittest.TestCase):
+    """Tests if trace-event-format reports with lost events can be parsed."""
+
+    @run_in_test_environment()
+    def test_skip_lost_events(self) -> None:
+        """Test if lost event messages are skipped without changing the
+        file."""
+        report_content = TRACE_EVENT_FORMAT_OUTPUT.replace(
+            '"ph": "E",', '"ph": "E",\nLost 42 events\n', 1
+        )
+        report_path = Path("trace.json")
+        report_path.write_text(report_content)
+
+        report = TEFReport(report_path)
+
+        self.assertEqual(report_path.read_text(), report_content)
+        self.assertEqual(len(report.trace_events), 8)
+        self.assertEqual(
+            report.trace_events[2].event_type, TraceEventType.DURATION_EVENT_END
+        )
+        self.assertEqual(report.trace_events[2].name, "Foo")
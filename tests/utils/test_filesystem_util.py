@@ -0,0 +1,44 @@
+"""Test filesystem utilities."""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from tests.helper_utils import run_in_test_environment
+from varats.utils.filesystem_util import atomic_write
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Test atomically replacing files."""
+
+    @run_in_test_environment()
+    def test_concurrent_writes(self) -> None:
+        """Check if concurrent writers of one process do not interfere with
+        each other."""
+        path = Path("data.txt").absolute()
+
+        def write(value: int) -> None:
+            with atomic_write(path, "w") as data_file:
+                data_file.write(str(value) * 100000)
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(write, range(8)))
+
+        content = path.read_text()
+        self.assertEqual(len(content), 100000)
+        self.assertEqual(len(set(content)), 1)
+        self.assertEqual(list(Path.cwd().glob(".*.tmp")), [])
+
+    @run_in_test_environment()
+    def test_failed_write_keeps_file(self) -> None:
+        """Check if a failed write neither changes the file nor leaves a
+        temporary file behind."""
+        path = Path("data.bin").absolute()
+        path.write_bytes(b"old")
+
+        with self.assertRaises(ValueError):
+            with atomic_write(path) as data_file:
+                data_file.write(b"new")
+                raise ValueError
+
+        self.assertEqual(path.read_bytes(), b"old")
+        self.assertEqual(list(Path.cwd().glob(".*.tmp")), [])
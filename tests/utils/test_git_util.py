@@ -1,15 +1,22 @@
 """Test VaRA git utilities."""
+import re
+import tempfile
+import typing as tp
 import unittest
 from pathlib import Path
+from unittest import mock
 
+import pygit2
 from benchbuild.utils.revision_ranges import RevisionRange, SingleRevision
 
+from tests.helper_utils import run_in_test_environment
 from varats.project.project_util import (
     get_local_project_git,
     get_local_project_git_path,
     BinaryType,
 )
 from varats.projects.discover_projects import initialize_projects
+from varats.utils import git_util
 from varats.utils.git_util import (
     ChurnConfig,
     CommitRepoPair,
@@ -27,7 +34,10 @@ from varats.utils.git_util import (
     RevisionBinaryMap,
     get_submodule_head,
     calc_code_churn_range,
+    calc_repo_loc,
     RepositoryAtCommit,
+    CommitMetadataStore,
+    calc_repo_file_blames,
 )
 
 
@@ -520,6 +530,284 @@ class TestCodeChurnCalculation(unittest.TestCase):
         self.assertEqual(deletions, 11)
 
 
+def _commit_files(repo: pygit2.Repository, files: tp.Dict[str, str]) -> str:
+    """Write the given files to the work tree of a repo and commit them."""
+    for file_name, content in files.items():
+        file_path = Path(repo.workdir) / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    repo.index.add_all()
+    repo.index.write()
+    signature = pygit2.Signature("Jon Doe", "jon@doe.com")
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    return str(
+        repo.create_commit(
+            "HEAD", signature, signature, "update", repo.index.write_tree(),
+            parents
+        )
+    )
+
+
+class TestLocCalculation(unittest.TestCase):
+    """Test LOC calculation from git objects."""
+
+    def test_calc_repo_loc(self) -> None:
+        """Check if only non-empty lines of C-style files are counted."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo = pygit2.init_repository(tmp_dir)
+            first_commit = _commit_files(
+                repo, {
+                    "main.c": "int main() {\n\n  return 0;\n}\n",
+                    "README.md": "readme\n",
+                    "include/util.h": "#pragma once\nint foo();\n"
+                }
+            )
+            second_commit = _commit_files(
+                repo, {"src/util.cpp": "int foo() {\n  return 1;\n}\n"}
+            )
+
+            self.assertEqual(calc_repo_loc(Path(tmp_dir), first_commit), 5)
+            self.assertEqual(calc_repo_loc(Path(tmp_dir), second_commit), 8)
+            self.assertEqual(calc_repo_loc(Path(tmp_dir), "HEAD~"), 5)
+
+
+class TestCodeChurnStore(unittest.TestCase):
+    """Test the persisted code churn values."""
+
+    @run_in_test_environment()
+    def test_churn_is_only_calculated_for_new_commits(self) -> None:
+        """Check if cached churn values are reused for known commits."""
+        repo = pygit2.init_repository("repo")
+        first_commit = FullCommitHash(
+            _commit_files(repo, {"main.c": "int main() {\n}\n"})
+        )
+        second_commit = FullCommitHash(
+            _commit_files(repo, {"main.c": "int main() {\n  return 0;\n}\n"})
+        )
+        churn_config = ChurnConfig.create_c_language_config()
+
+        self.assertEqual(
+            calc_code_churn_range(
+                Path("repo"), churn_config, end_range=first_commit
+            ), {first_commit: (1, 2, 0)}
+        )
+
+        with mock.patch(
+            "varats.utils.git_util.__calc_code_churn_of_commits",
+            wraps=getattr(git_util, "__calc_code_churn_of_commits")
+        ) as mocked_calc:
+            churn = calc_code_churn_range(Path("repo"), churn_config)
+            mocked_calc.assert_called_once()
+            self.assertEqual(
+                list(mocked_calc.call_args.args[2]), [second_commit.hash]
+            )
+
+        self.assertEqual(
+            churn, {
+                first_commit: (1, 2, 0),
+                second_commit: (1, 1, 0)
+            }
+        )
+
+        with mock.patch(
+            "varats.utils.git_util.__calc_code_churn_of_commits"
+        ) as mocked_calc:
+            self.assertEqual(
+                calc_commit_code_churn(
+                    Path("repo"), second_commit, churn_config
+                ), (1, 1, 0)
+            )
+            mocked_calc.assert_not_called()
+
+
+class TestFileBlameStore(unittest.TestCase):
+    """Test the persisted per-file blame results."""
+
+    @run_in_test_environment()
+    def test_unchanged_files_are_not_blamed_again(self) -> None:
+        """Check if only new blobs are blamed at a later revision."""
+        repo = pygit2.init_repository("repo")
+        first_commit = FullCommitHash(
+            _commit_files(
+                repo, {
+                    "main.c": "int main() {\n\n  return 0;\n}\n",
+                    "util.h": "int foo();\n",
+                    "README.md": "readme\n"
+                }
+            )
+        )
+        second_commit = FullCommitHash(
+            _commit_files(repo, {"main.c": "int main() {\n  return 1;\n}\n"})
+        )
+        file_pattern = re.compile(r"\.(c|h)$")
+
+        self.assertEqual(
+            calc_repo_file_blames(Path("repo"), first_commit, file_pattern), {
+                "main.c": frozenset([first_commit]),
+                "util.h": frozenset([first_commit])
+            }
+        )
+
+        with mock.patch(
+            "varats.utils.git_util.__blame_file",
+            wraps=getattr(git_util, "__blame_file")
+        ) as mocked_blame:
+            blames = calc_repo_file_blames(
+                Path("repo"), second_commit, file_pattern
+            )
+            mocked_blame.assert_called_once()
+            self.assertEqual(mocked_blame.call_args.args[2], "main.c")
+
+        self.assertEqual(
+            blames, {
+                "main.c": frozenset([first_commit, second_commit]),
+                "util.h": frozenset([first_commit])
+            }
+        )
+
+    @run_in_test_environment()
+    def test_cached_blames_need_no_git_process(self) -> None:
+        """Check if blaming the files of a revision again does not start any git
+        process."""
+        repo = pygit2.init_repository("repo")
+        first_commit = FullCommitHash(
+            _commit_files(
+                repo, {
+                    "main.c": "int main() {\n  return 0;\n}\n",
+                    "src/util file.h": "int foo();\n"
+                }
+            )
+        )
+        second_commit = FullCommitHash(
+            _commit_files(repo, {"main.c": "int main() {\n  return 1;\n}\n"})
+        )
+        file_pattern = re.compile(r"\.(c|h)$")
+        expected_blames = {
+            "main.c": frozenset([first_commit, second_commit]),
+            "src/util file.h": frozenset([first_commit])
+        }
+
+        self.assertEqual(
+            calc_repo_file_blames(Path("repo"), second_commit, file_pattern),
+            expected_blames
+        )
+        with mock.patch("varats.utils.git_util.git") as mocked_git:
+            self.assertEqual(
+                calc_repo_file_blames(
+                    Path("repo"), second_commit, file_pattern
+                ), expected_blames
+            )
+            mocked_git.assert_not_called()
+            mocked_git.__getitem__.assert_not_called()
+
+    @run_in_test_environment()
+    def test_reverted_file_is_blamed_to_revert(self) -> None:
+        """Check if files with the same content as at an earlier revision are
+        blamed to the commit that restored the content."""
+        repo = pygit2.init_repository("repo")
+        first_commit = FullCommitHash(_commit_files(repo, {"main.c": "x\n"}))
+        _commit_files(repo, {"main.c": "y\n"})
+        revert_commit = FullCommitHash(_commit_files(repo, {"main.c": "x\n"}))
+        file_pattern = re.compile(r"\.c$")
+
+        self.assertEqual(
+            calc_repo_file_blames(Path("repo"), first_commit, file_pattern),
+            {"main.c": frozenset([first_commit])}
+        )
+        self.assertEqual(
+            calc_repo_file_blames(Path("repo"), revert_commit, file_pattern),
+            {"main.c": frozenset([revert_commit])}
+        )
+
+
+def _commit_as(
+    repo: pygit2.Repository,
+    author: str,
+    commit_time: int,
+    ref: str = "HEAD"
+) -> str:
+    """Create an empty commit of an author at the given time."""
+    signature = pygit2.Signature(author, f"{author}@example.com", commit_time)
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    return str(
+        repo.create_commit(
+            ref, signature, signature, "update",
+            repo.TreeBuilder().write(), parents
+        )
+    )
+
+
+class TestCommitMetadataStore(unittest.TestCase):
+    """Test the column store of commit metadata."""
+
+    @run_in_test_environment()
+    def test_batch_lookup(self) -> None:
+        """Check if the metadata of multiple commits is looked up at once."""
+        repo = pygit2.init_repository("repo")
+        commits = [
+            _commit_as(repo, "Alice", 1000),
+            _commit_as(repo, "Bob", 2000),
+            _commit_as(repo, "Alice", 3000)
+        ]
+        store = CommitMetadataStore({"repo": repo})
+
+        commit_ids = store.commit_ids([
+            CommitRepoPair(FullCommitHash(commit), "repo")
+            for commit in reversed(commits)
+        ])
+        self.assertEqual(
+            list(store.commit_times[commit_ids]), [3000, 2000, 1000]
+        )
+        self.assertEqual(
+            list(store.author_names[store.author_name_ids[commit_ids]]),
+            ["Alice", "Bob", "Alice"]
+        )
+        self.assertEqual(
+            list(store.author_emails[store.author_email_ids[commit_ids[:2]]]),
+            ["Alice@example.com", "Bob@example.com"]
+        )
+        self.assertEqual(list(store.commit_hashes[commit_ids]), commits[::-1])
+        self.assertEqual(
+            store.repository_names[store.repository_ids[commit_ids[0]]], "repo"
+        )
+        self.assertEqual(
+            store.parents(int(commit_ids[0])), [FullCommitHash(commits[1])]
+        )
+        self.assertRaises(
+            LookupError, store.commit_id,
+            CommitRepoPair(FullCommitHash(commits[0]), "other_repo")
+        )
+
+    @run_in_test_environment()
+    def test_history_is_persisted(self) -> None:
+        """Check if only new commits are walked and commits outside of the HEAD
+        history are resolved on demand."""
+        repo = pygit2.init_repository("repo")
+        _commit_as(repo, "Alice", 1000)
+        self.assertEqual(len(CommitMetadataStore({"repo": repo})), 1)
+
+        new_commit = _commit_as(repo, "Bob", 2000)
+        side_commit = _commit_as(repo, "Carol", 3000, "refs/heads/side")
+        with mock.patch.object(
+            pygit2.Repository, "walk", wraps=repo.walk
+        ) as mocked_walk:
+            store = CommitMetadataStore({"repo": repo})
+            mocked_walk.assert_called_once()
+        self.assertEqual(len(store), 2)
+
+        with mock.patch.object(pygit2.Repository, "walk") as mocked_walk:
+            store = CommitMetadataStore({"repo": repo})
+            mocked_walk.assert_not_called()
+        self.assertEqual(len(store), 2)
+
+        side_id = store.commit_id(
+            CommitRepoPair(FullCommitHash(side_commit), "repo")
+        )
+        self.assertEqual(side_id, 2)
+        self.assertEqual(store.commit_times[side_id], 3000)
+        self.assertEqual(store.parents(side_id), [FullCommitHash(new_commit)])
+
+
 class TestRevisionBinaryMap(unittest.TestCase):
     """Test if we can correctly setup and use the RevisionBinaryMap."""
 
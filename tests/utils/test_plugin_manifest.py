@@ -0,0 +1,222 @@
+"""Test plugin manifests."""
+import importlib
+import sys
+import typing as tp
+import unittest
+from pathlib import Path
+from types import ModuleType
+from unittest import mock
+
+from benchbuild.experiment import ExperimentRegistry
+
+from tests.helper_utils import run_in_test_environment
+from varats.data.discover_reports import (
+    get_report_type_entries,
+    initialize_reports,
+)
+from varats.experiments.discover_experiments import (
+    get_experiment_entries,
+    initialize_experiments,
+)
+from varats.plot.plots import PlotGenerator
+from varats.plots.discover_plots import (
+    get_plot_generator_entries,
+    initialize_plots,
+)
+from varats.report.report import BaseReport
+from varats.table.tables import TableGenerator
+from varats.tables.discover_tables import (
+    get_table_generator_entries,
+    initialize_tables,
+)
+from varats.utils import plugin_manifest
+from varats.utils.plugin_manifest import load_plugin_manifest, LazyRegistry
+
+_PLUGIN_MODULES = {
+    "__init__.py":
+        """
+REGISTRY = {}
+
+
+class Plugin:
+
+    def __init_subclass__(cls, plugin_name, **kwargs):
+        super().__init_subclass__(**kwargs)
+        REGISTRY[plugin_name] = cls
+""",
+    "first.py":
+        """
+from {package} import Plugin
+
+
+class First(Plugin, plugin_name="first"):
+    NAME = "First"
+
+
+class Helper:
+    pass
+""",
+    "nested/__init__.py":
+        "",
+    "nested/second.py":
+        """
+from {package}.first import First
+
+
+class Second(First, plugin_name="second"):
+    pass
+""",
+}
+
+
+def _create_plugin_package(package_name: str) -> ModuleType:
+    """Create a plugin package in the working directory and import it."""
+    for file_name, content in _PLUGIN_MODULES.items():
+        module_path = Path(package_name) / file_name
+        module_path.parent.mkdir(parents=True, exist_ok=True)
+        module_path.write_text(content.replace("{package}", package_name))
+
+    sys.path.insert(0, str(Path.cwd()))
+    try:
+        return importlib.import_module(package_name)
+    finally:
+        sys.path.pop(0)
+
+
+class TestPluginManifest(unittest.TestCase):
+    """Test the creation of plugin manifests."""
+
+    def tearDown(self) -> None:
+        for module_name in list(sys.modules):
+            if module_name.startswith("manifest_test_plugins"):
+                del sys.modules[module_name]
+        getattr(plugin_manifest, "__MANIFESTS").clear()
+
+    @run_in_test_environment()
+    def test_plugins_are_listed_without_import(self) -> None:
+        """Check if plugins are found without importing their modules."""
+        package = _create_plugin_package("manifest_test_plugins_list")
+        manifest = load_plugin_manifest(package)
+
+        registrations = manifest.registrations("plugin_name")
+        self.assertEqual(list(registrations), ["first", "second"])
+        self.assertEqual(
+            registrations["second"].module_name,
+            "manifest_test_plugins_list.nested.second"
+        )
+        self.assertEqual(registrations["first"].name, "First")
+        self.assertEqual([
+            entry.class_name for entry in manifest.subclasses(["Plugin"])
+        ], ["First", "Second"])
+        self.assertNotIn("manifest_test_plugins_list.first", sys.modules)
+
+    @run_in_test_environment()
+    def test_manifest_is_cached(self) -> None:
+        """Check if modules are only parsed again after they changed."""
+        package = _create_plugin_package("manifest_test_plugins_cache")
+        load_plugin_manifest(package)
+        getattr(plugin_manifest, "__MANIFESTS").clear()
+
+        with mock.patch.object(
+            plugin_manifest.ast, "parse", wraps=plugin_manifest.ast.parse
+        ) as mocked_parse:
+            manifest = load_plugin_manifest(package)
+            mocked_parse.assert_not_called()
+        self.assertEqual(
+            list(manifest.registrations("plugin_name")), ["first", "second"]
+        )
+        getattr(plugin_manifest, "__MANIFESTS").clear()
+
+        Path("manifest_test_plugins_cache/third.py").write_text(
+            "from manifest_test_plugins_cache import Plugin\n\n\n"
+            "class Third(Plugin, plugin_name='third'):\n    pass\n"
+        )
+        manifest = load_plugin_manifest(package)
+        self.assertEqual(
+            list(manifest.registrations("plugin_name")),
+            ["first", "second", "third"]
+        )
+
+
+class TestLazyRegistry(unittest.TestCase):
+    """Test the lazy access to plugin registries."""
+
+    def tearDown(self) -> None:
+        for module_name in list(sys.modules):
+            if module_name.startswith("manifest_test_plugins"):
+                del sys.modules[module_name]
+        getattr(plugin_manifest, "__MANIFESTS").clear()
+
+    @run_in_test_environment()
+    def test_only_accessed_plugins_are_imported(self) -> None:
+        """Check if accessing a plugin only imports its module."""
+        package = _create_plugin_package("manifest_test_plugins_lazy")
+        registry: tp.Dict[str, type] = getattr(package, "REGISTRY")
+        initialize_all = mock.Mock()
+        lazy_registry: LazyRegistry[type] = LazyRegistry(
+            registry,
+            load_plugin_manifest(package).registrations("plugin_name"),
+            initialize_all
+        )
+
+        self.assertEqual(list(lazy_registry), ["first", "second"])
+        self.assertIn("second", lazy_registry)
+        self.assertEqual(registry, {})
+
+        self.assertEqual(lazy_registry["first"].__name__, "First")
+        self.assertEqual(list(registry), ["first"])
+        self.assertNotIn(
+            "manifest_test_plugins_lazy.nested.second", sys.modules
+        )
+        initialize_all.assert_not_called()
+
+        self.assertRaises(KeyError, lambda: lazy_registry["unknown"])
+        initialize_all.assert_called_once()
+
+
+class TestToolSuiteManifests(unittest.TestCase):
+    """Test that the manifests of the tool suite list all plugins that are
+    registered by importing all plugin modules."""
+
+    def __assert_manifest_is_complete(
+        self, manifest_keys: tp.Iterable[str], registry: tp.Mapping[str, tp.Any]
+    ) -> None:
+        self.assertEqual({
+            key for key, value in registry.items()
+            if value.__module__.startswith("varats.")
+        }.difference(manifest_keys), set())
+
+    def test_report_manifest_is_complete(self) -> None:
+        """Check if all report types are listed."""
+        report_types = get_report_type_entries()
+        initialize_reports()
+        initialize_experiments()
+
+        self.__assert_manifest_is_complete(
+            report_types, BaseReport.REPORT_TYPES
+        )
+
+    def test_experiment_manifest_is_complete(self) -> None:
+        """Check if all experiments are listed."""
+        experiments = get_experiment_entries()
+        initialize_experiments()
+
+        self.__assert_manifest_is_complete(
+            experiments, ExperimentRegistry.experiments
+        )
+
+    def test_plot_manifest_is_complete(self) -> None:
+        """Check if all plot generators are listed."""
+        generators = get_plot_generator_entries()
+        initialize_plots()
+
+        self.__assert_manifest_is_complete(generators, PlotGenerator.GENERATORS)
+
+    def test_table_manifest_is_complete(self) -> None:
+        """Check if all table generators are listed."""
+        generators = get_table_generator_entries()
+        initialize_tables()
+
+        self.__assert_manifest_is_complete(
+            generators, TableGenerator.GENERATORS
+        )
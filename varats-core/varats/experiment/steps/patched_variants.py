@@ -0,0 +1,173 @@
+"""Experiment steps to build patched variants of a project in parallel."""
+import copy
+import logging
+import textwrap
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from benchbuild.utils.actions import ProjectStep, StepResult
+from benchbuild.utils.cmd import cp, rm
+from benchbuild.utils.settings import get_number_of_jobs
+from plumbum import local, ProcessExecutionError
+
+from varats.project.varats_project import VProject
+from varats.provider.patch.patch_provider import Patch
+from varats.utils.git_commands import apply_patch
+from varats.utils.settings import bb_cfg
+
+LOG = logging.getLogger(__name__)
+
+PATCHED_VARIANTS_DIR = "patched_variants"
+
+
+class PatchedVariant(tp.NamedTuple):
+    """A variant of a project with a patch applied that is built in its own
+    build directory."""
+
+    patch: Patch
+    project: VProject
+
+
+def create_patched_variant(project: VProject, patch: Patch) -> PatchedVariant:
+    """
+    Create a variant of a project that builds the project with the given patch
+    applied in a separate build directory inside the build directory of the
+    project.
+
+    The variant shares all settings, e.g., flags and extensions, with the
+    project, except for custom compile functions that are set on the project
+    instance, as these are bound to the original build directory.
+
+    Args:
+        project: the project to create the variant of
+        patch: the patch that is applied to the variant
+
+    Returns:
+        the patched variant
+    """
+    variant_project = copy.copy(project)
+    variant_project.__dict__.pop("compile", None)
+    variant_project.builddir = local.path(
+        project.builddir
+    ) / PATCHED_VARIANTS_DIR / patch.shortname
+    return PatchedVariant(patch, variant_project)
+
+
+def _materialize_patched_variant(
+    project: VProject, variant: PatchedVariant
+) -> None:
+    """Copy the sources of the project into the build directory of the variant
+    and apply the patch of the variant."""
+    variant_dir = Path(variant.project.builddir)
+    if variant_dir.exists():
+        rm("-rf", variant_dir)
+    variant_dir.mkdir(parents=True)
+
+    for entry in Path(project.builddir).iterdir():
+        if entry.name != PATCHED_VARIANTS_DIR:
+            cp("-a", entry, variant_dir)
+
+    apply_patch(Path(variant.project.source_of_primary), variant.patch.path)
+
+
+def _compile(project: VProject) -> StepResult:
+    """Compile a project in its build directory."""
+    try:
+        project.compile()
+    except Exception:  # pylint: disable=broad-except
+        LOG.exception(f"Could not compile {project.name} in {project.builddir}")
+        return StepResult.ERROR
+
+    return StepResult.OK
+
+
+_PENDING_VARIANT_BUILDS: tp.List[VProject] = []
+
+
+def _compile_pending_variant(index: int) -> StepResult:
+    """Compile a pending patched variant in a forked worker process."""
+    return _compile(_PENDING_VARIANT_BUILDS[index])
+
+
+class CompilePatchedVariants(ProjectStep):  # type: ignore
+    """
+    Compile a project and patched variants of it in parallel.
+
+    Every variant is built in its own build directory from a copy of the
+    project sources, so the builds do not interfere with each other. The
+    configured number of build jobs is split evenly between the build slots.
+
+    Args:
+        project: the project to compile
+        variants: the patched variants of the project
+        build_slots: maximum number of concurrent builds
+    """
+
+    NAME = "COMPILE_PATCHED_VARIANTS"
+    DESCRIPTION = "Compile the project and patched variants in parallel."
+
+    project: VProject
+
+    def __init__(
+        self, project: VProject, variants: tp.Sequence[PatchedVariant],
+        build_slots: int
+    ) -> None:
+        super().__init__(project)
+        self.__variants = variants
+        self.__build_slots = build_slots
+
+    def __call__(self) -> StepResult:
+        # all variants are copied before the project is compiled, so they do
+        # not contain any build artifacts
+        results: tp.List[StepResult] = []
+        variant_projects: tp.List[VProject] = []
+        for variant in self.__variants:
+            try:
+                _materialize_patched_variant(self.project, variant)
+                variant_projects.append(variant.project)
+            except (OSError, ProcessExecutionError):
+                LOG.exception(
+                    f"Could not create variant {variant.patch.shortname} of "
+                    f"{self.project.name}"
+                )
+                results.append(StepResult.ERROR)
+
+        build_slots = max(1, min(self.__build_slots, len(variant_projects) + 1))
+        if build_slots == 1:
+            results.append(_compile(self.project))
+            results.extend(
+                _compile(variant_project)
+                for variant_project in variant_projects
+            )
+        else:
+            jobs = get_number_of_jobs(bb_cfg())
+            bb_cfg()["jobs"] = max(1, jobs // build_slots)
+            _PENDING_VARIANT_BUILDS.extend(variant_projects)
+            try:
+                # workers need to be forked to inherit the pending builds, the
+                # project itself is compiled in this process to keep its state
+                with ProcessPoolExecutor(
+                    build_slots - 1, mp_context=get_context("fork")
+                ) as executor:
+                    variant_results = executor.map(
+                        _compile_pending_variant, range(len(variant_projects))
+                    )
+                    results.append(_compile(self.project))
+                    results.extend(variant_results)
+            finally:
+                _PENDING_VARIANT_BUILDS.clear()
+                bb_cfg()["jobs"] = jobs
+
+        self.status = max(results)
+        return self.status
+
+    def __str__(self, indent: int = 0) -> str:
+        variants = ", ".join(
+            variant.patch.shortname for variant in self.__variants
+        )
+        return textwrap.indent(
+            f"* {self.project.name}: Compile with patched variants "
+            f"[{variants}] using {self.__build_slots} build slots", indent * " "
+        )
@@ -0,0 +1,84 @@
+"""Utilities to attach tracers, e.g., bpftrace or BCC scripts, to binaries
+before the binaries are run."""
+import logging
+import shlex
+import typing as tp
+from pathlib import Path
+from time import monotonic, sleep
+
+from plumbum.commands.modifiers import Future
+
+LOG = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 0.05
+
+
+def create_bpftrace_script_with_ready_signal(
+    script: Path, tmp_dir: Path
+) -> tp.Tuple[Path, Path]:
+    """
+    Copy a bpftrace script into a directory and extend the copy to create a
+    ready file once bpftrace has attached all probes.
+
+    bpftrace only processes the actions of its probes after all probes are
+    attached, so the ready file is created by a ``system`` call of an
+    additional ``BEGIN`` probe. Scripts with this signal need to be run with
+    ``--unsafe``.
+
+    Args:
+        script: the bpftrace script
+        tmp_dir: directory for the extended script and the ready file, which
+                 should not be on a network file system
+
+    Returns:
+        the extended script and the ready file
+    """
+    ready_file = tmp_dir / f"{script.stem}.ready"
+    ready_file.unlink(missing_ok=True)
+
+    script_content = script.read_text()
+    ready_script = tmp_dir / script.name
+    ready_script.write_text(
+        f"{script_content}\n"
+        "BEGIN\n"
+        "{\n"
+        f"  system(\"touch {shlex.quote(str(ready_file))}\");\n"
+        "}\n"
+    )
+    return ready_script, ready_file
+
+
+def wait_for_tracer(
+    tracer: Future, ready_file: tp.Optional[Path], timeout: float
+) -> None:
+    """
+    Wait until a tracer that runs in the background is ready to trace.
+
+    If the tracer does not signal that it is ready in time, a warning is logged
+    and the tracer is assumed to be ready.
+
+    Args:
+        tracer: the running tracer
+        ready_file: file that the tracer creates once it is ready; tracers
+                    without a ready signal get ``timeout`` seconds to start
+        timeout: maximal time to wait for the tracer in seconds
+
+    Raises:
+        ProcessExecutionError: if the tracer failed before it was ready
+        RuntimeError: if the tracer terminated before it was ready
+    """
+    deadline = monotonic() + timeout
+    while ready_file is None or not ready_file.exists():
+        if tracer.poll():
+            tracer.wait()
+            raise RuntimeError("Tracer terminated before it was ready.")
+
+        remaining_time = deadline - monotonic()
+        if remaining_time <= 0:
+            if ready_file is not None:
+                LOG.warning(
+                    f"Tracer did not signal that it is ready within {timeout}s."
+                )
+            return
+
+        sleep(min(_POLL_INTERVAL, remaining_time))
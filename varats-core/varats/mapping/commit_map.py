@@ -1,33 +1,416 @@
 """Commit map module."""
+import hashlib
+import heapq
+import itertools
 import logging
+import struct
 import typing as tp
 from collections.abc import ItemsView
+from contextlib import contextmanager
 from pathlib import Path
 
-from benchbuild.utils.cmd import git, mkdir
-from plumbum import local
+import numpy as np
+import numpy.typing as npt
+import pygit2
 from pygtrie import CharTrie
 
 from varats.project.project_util import (
     get_local_project_git_path,
     get_primary_project_source,
 )
-from varats.utils.git_util import (
-    get_current_branch,
-    FullCommitHash,
-    ShortCommitHash,
-)
+from varats.utils.filesystem_util import atomic_write, lock_file
+from varats.utils.git_util import CommitHash, FullCommitHash, ShortCommitHash
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
+_OID_SIZE = 20
+_HEX_HASH_LENGTH = 2 * _OID_SIZE
+_NO_OID = bytes(_OID_SIZE)
+
 
 class AmbiguousCommitHash(Exception):
     """Raised if an ambiguous commit hash is encountered."""
 
 
+def _resolve_commit(repo: pygit2.Repository, rev: tp.Optional[str]) -> bytes:
+    if rev is None:
+        return _NO_OID
+    return tp.cast(bytes, repo.revparse_single(rev).peel(pygit2.Commit).id.raw)
+
+
+def _get_reference_tips(repo: pygit2.Repository,
+                        refspec: str) -> tp.List[bytes]:
+    """Commits referenced by `refspec` and all references, in the order `git log
+    --all` would visit them, if `refspec` was checked out."""
+    tips = [_resolve_commit(repo, refspec)]
+    for ref_name in sorted(repo.references):
+        try:
+            tips.append(repo.references[ref_name].peel(pygit2.Commit).id.raw)
+        except ValueError:
+            # references to trees or blobs do not contribute commits
+            continue
+    return list(dict.fromkeys(tips))
+
+
+def _walk_commits(
+    repo: pygit2.Repository,
+    push: tp.Iterable[bytes],
+    hide: tp.Iterable[bytes] = ()
+) -> tp.Iterator[bytes]:
+    walker = repo.walk(None, pygit2.GIT_SORT_NONE)
+    for oid in push:
+        walker.push(pygit2.Oid(raw=oid))
+    for oid in hide:
+        if oid != _NO_OID:
+            walker.hide(pygit2.Oid(raw=oid))
+    for commit in walker:
+        yield tp.cast(bytes, commit.id.raw)
+
+
+def _walk_commits_by_date(
+    repo: pygit2.Repository, tips: tp.Iterable[bytes],
+    known: tp.Container[bytes]
+) -> tp.Iterator[bytes]:
+    """
+    Walk all commits reachable from `tips` that are not `known`, newest first.
+
+    The walk reproduces the default order of `git log`, i.e., commits are
+    visited by commit date and ties are broken by the order in which commits
+    were discovered.
+    """
+    queue: tp.List[tp.Tuple[int, int, pygit2.Commit]] = []
+    discovered: tp.Set[bytes] = set()
+    discovery_order = itertools.count()
+
+    def discover(oid: pygit2.Oid) -> None:
+        if oid.raw in discovered or oid.raw in known:
+            return
+        discovered.add(oid.raw)
+        commit = repo[oid]
+        heapq.heappush(
+            queue, (-commit.commit_time, next(discovery_order), commit)
+        )
+
+    for tip in tips:
+        discover(pygit2.Oid(raw=tip))
+
+    while queue:
+        commit = heapq.heappop(queue)[2]
+        yield tp.cast(bytes, commit.id.raw)
+        for parent_id in commit.parent_ids:
+            discover(parent_id)
+
+
+class CommitMapIndex():
+    """
+    Persistent index of the commit history of a repository that backs a
+    :class:`CommitMap`.
+
+    The index contains all commits reachable from any reference of the
+    repository, ordered from oldest to newest, so that the position of a commit
+    is its time id. For every commit, flags record whether it is part of the
+    commit range of the map and of the range of the mapped branch.
+
+    Indices are stored as compact binary files in the data cache and are
+    memory-mapped when loaded. If the references of the repository changed
+    since the index was stored, only the newly reachable commits are walked and
+    appended, which keeps the time ids of already known commits stable.
+    """
+
+    VERSION = 1
+
+    IN_RANGE = 1
+    IN_BRANCH_RANGE = 2
+
+    __MAGIC = b"VARACMAP"
+    # magic, version, #commits, #tips, key digest, start commit, end commit
+    __HEADER = struct.Struct(f"<8sHQQ{_OID_SIZE}s{_OID_SIZE}s{_OID_SIZE}s")
+
+    def __init__(
+        self, oids: npt.NDArray[np.uint8], flags: npt.NDArray[np.uint8],
+        tips: tp.Iterable[bytes], start: bytes, end: bytes
+    ) -> None:
+        self.__oids = oids
+        self.__flags = flags
+        self.__tips = set(tips)
+        self.__start = start
+        self.__end = end
+
+    @property
+    def flags(self) -> npt.NDArray[np.uint8]:
+        """Range flags of all commits, indexed by time id."""
+        return self.__flags
+
+    def __len__(self) -> int:
+        return len(self.__oids)
+
+    def hashes(self) -> tp.List[str]:
+        """Hex commit hashes of all commits, indexed by time id."""
+        hex_oids = self.__oids.tobytes().hex()
+        return [
+            hex_oids[offset:offset + _HEX_HASH_LENGTH]
+            for offset in range(0, len(hex_oids), _HEX_HASH_LENGTH)
+        ]
+
+    @staticmethod
+    def index_key(
+        git_path: Path, refspec: str, start: tp.Optional[str], end: str
+    ) -> bytes:
+        """Digest identifying the index of a commit map configuration."""
+        key = f"{git_path.resolve()}\0{refspec}\0{start}\0{end}"
+        return hashlib.sha1(key.encode()).digest()
+
+    @staticmethod
+    def index_path(git_path: Path, key: bytes) -> Path:
+        """Location of an index file in the data cache."""
+        return Path(
+            str(vara_cfg()["data_cache"])
+        ) / "commit_maps" / f"{git_path.name}-{key.hex()[:16]}.cmap"
+
+    @classmethod
+    def load_or_build(
+        cls, git_path: Path, refspec: str, start: tp.Optional[str], end: str
+    ) -> 'CommitMapIndex':
+        """
+        Load the index for a commit map configuration, building or updating it
+        if it is missing or outdated.
+
+        Range of commits that are marked as part of the range: `]start..end]`
+
+        Args:
+            git_path: path to the git repository
+            refspec: the refspec the map is based on, i.e., `HEAD` in `end`
+                     refers to this refspec
+            start: commit before the first commit of the range
+            end: last commit of the range
+
+        Returns:
+            an up-to-date index
+        """
+        repo = pygit2.Repository(str(git_path))
+        start_oid = _resolve_commit(repo, start)
+        end_oid = _resolve_commit(repo, refspec if end == "HEAD" else end)
+        tips = _get_reference_tips(repo, refspec)
+
+        key = cls.index_key(git_path, refspec, start, end)
+        path = cls.index_path(git_path, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with lock_file(path.with_suffix(".lock")):
+            index = cls.load(path, key)
+            if index is not None:
+                if index.__tips == set(tips) and \
+                        index.__start == start_oid and index.__end == end_oid:
+                    return index
+
+                LOG.debug(f"Updating commit map index {path}")
+                index = index.__updated(repo, tips, start_oid, end_oid)
+
+            if index is None:
+                LOG.debug(f"Building commit map index {path}")
+                index = cls.__build(repo, tips, start_oid, end_oid)
+
+            index.store(path, key)
+            return index
+
+    @classmethod
+    def load(cls, path: Path, key: bytes) -> tp.Optional['CommitMapIndex']:
+        """
+        Load a stored index.
+
+        Args:
+            path: path to the index file
+            key: digest of the expected commit map configuration
+
+        Returns:
+            the index or ``None``, if the file is missing, was written by a
+            different index version, or belongs to a different configuration
+        """
+        if not path.exists():
+            return None
+
+        with open(path, "rb") as index_file:
+            header = index_file.read(cls.__HEADER.size)
+        if len(header) != cls.__HEADER.size:
+            return None
+
+        magic, version, num_commits, num_tips, stored_key, start, end = \
+            cls.__HEADER.unpack(header)
+        body_size = num_commits * (_OID_SIZE + 1) + num_tips * _OID_SIZE
+        if magic != cls.__MAGIC or version != cls.VERSION or \
+                stored_key != key or \
+                path.stat().st_size != cls.__HEADER.size + body_size:
+            return None
+
+        if body_size == 0:
+            data = np.zeros(0, dtype=np.uint8)
+        else:
+            data = np.memmap(
+                path, dtype=np.uint8, mode="r", offset=cls.__HEADER.size
+            )
+        flags_offset = num_commits * _OID_SIZE
+        tips_offset = flags_offset + num_commits
+        raw_tips = data[tips_offset:].tobytes()
+        return CommitMapIndex(
+            data[:flags_offset].reshape(num_commits, _OID_SIZE),
+            data[flags_offset:tips_offset], {
+                raw_tips[offset:offset + _OID_SIZE]
+                for offset in range(0, len(raw_tips), _OID_SIZE)
+            }, start, end
+        )
+
+    def store(self, path: Path, key: bytes) -> None:
+        """
+        Atomically write the index to a file.
+
+        Args:
+            path: path to the index file
+            key: digest of the commit map configuration
+        """
+        with atomic_write(path) as index_file:
+            index_file.write(
+                self.__HEADER.pack(
+                    self.__MAGIC, self.VERSION, len(self.__oids),
+                    len(self.__tips), key, self.__start, self.__end
+                )
+            )
+            index_file.write(self.__oids.tobytes())
+            index_file.write(self.__flags.tobytes())
+            index_file.write(b"".join(sorted(self.__tips)))
+
+    @classmethod
+    def __build(
+        cls, repo: pygit2.Repository, tips: tp.List[bytes], start: bytes,
+        end: bytes
+    ) -> 'CommitMapIndex':
+        commits = list(_walk_commits_by_date(repo, tips, set()))
+        commits.reverse()
+
+        flags = np.full(len(commits), cls.IN_RANGE, dtype=np.uint8)
+        index = CommitMapIndex(
+            np.frombuffer(b"".join(commits),
+                          dtype=np.uint8).reshape(len(commits), _OID_SIZE),
+            flags, tips, start, end
+        )
+        time_ids = {oid: time_id for time_id, oid in enumerate(commits)}
+        if start != _NO_OID:
+            index.__clear_range(repo, time_ids, [], start)
+        index.__mark_branch_range(repo, time_ids, [])
+        return index
+
+    def __updated(
+        self, repo: pygit2.Repository, tips: tp.List[bytes], start: bytes,
+        end: bytes
+    ) -> tp.Optional['CommitMapIndex']:
+        """Create an updated index or return ``None`` if the history was
+        rewritten and the index needs to be rebuilt."""
+        if start != self.__start:
+            return None
+
+        added_tips = [tip for tip in tips if tip not in self.__tips]
+        old_hashes = self.__oids.tobytes()
+        commits = [
+            old_hashes[offset:offset + _OID_SIZE]
+            for offset in range(0, len(old_hashes), _OID_SIZE)
+        ]
+        time_ids = {oid: time_id for time_id, oid in enumerate(commits)}
+        try:
+            for removed_tip in self.__tips.difference(tips):
+                if not any(
+                    repo.descendant_of(
+                        pygit2.Oid(raw=tip), pygit2.Oid(raw=removed_tip)
+                    ) for tip in added_tips
+                ):
+                    return None
+
+            new_commits = list(
+                _walk_commits_by_date(repo, added_tips, time_ids)
+            )
+            # new commits that are not newer than the indexed ones would be
+            # interleaved with them by a fresh walk, so appending them would
+            # shift the time ids of the indexed commits
+            if new_commits and commits and min(
+                repo[pygit2.Oid(raw=oid)].commit_time for oid in new_commits
+            ) <= repo[pygit2.Oid(raw=commits[-1])].commit_time:
+                return None
+        except (KeyError, ValueError, pygit2.GitError):
+            return None
+
+        new_commits.reverse()
+        time_ids.update({
+            oid: time_id
+            for time_id, oid in enumerate(new_commits, start=len(commits))
+        })
+        commits.extend(new_commits)
+
+        index = CommitMapIndex(
+            np.frombuffer(b"".join(commits),
+                          dtype=np.uint8).reshape(len(commits), _OID_SIZE),
+            np.concatenate([
+                self.__flags,
+                np.full(len(new_commits), self.IN_RANGE, dtype=np.uint8)
+            ]), tips, start, end
+        )
+        if start != _NO_OID:
+            index.__clear_range(repo, time_ids, self.__tips, start)
+
+        if end != self.__end:
+            is_fast_forward = end in time_ids and self.__end in time_ids and \
+                repo.descendant_of(pygit2.Oid(raw=end),
+                                   pygit2.Oid(raw=self.__end))
+            if is_fast_forward:
+                index.__mark_branch_range(repo, time_ids, [self.__end])
+            else:
+                index.__flags &= ~np.uint8(self.IN_BRANCH_RANGE)
+                index.__mark_branch_range(repo, time_ids, [])
+
+        return index
+
+    def __clear_range(
+        self, repo: pygit2.Repository, time_ids: tp.Dict[bytes, int],
+        known_tips: tp.Iterable[bytes], start: bytes
+    ) -> None:
+        """Exclude `start` and its ancestors that are not reachable from
+        `known_tips` from the range."""
+        for oid in _walk_commits(repo, [start], known_tips):
+            time_id = time_ids.get(oid)
+            if time_id is not None:
+                self.__flags[time_id] &= ~np.uint8(self.IN_RANGE)
+
+    def __mark_branch_range(
+        self, repo: pygit2.Repository, time_ids: tp.Dict[bytes, int],
+        hide: tp.List[bytes]
+    ) -> None:
+        for oid in _walk_commits(repo, [self.__end], hide + [self.__start]):
+            time_id = time_ids.get(oid)
+            if time_id is not None:
+                self.__flags[time_id] |= self.IN_BRANCH_RANGE
+
+
+_HashArrayTy = npt.NDArray[np.bytes_]
+
+
+def _to_hash_array(
+    c_hashes: tp.Iterable[tp.Union[CommitHash, str]]
+) -> _HashArrayTy:
+    hashes = [
+        c_hash.hash if isinstance(c_hash, CommitHash) else c_hash
+        for c_hash in c_hashes
+    ]
+    return np.array(hashes, dtype=f"S{_HEX_HASH_LENGTH}")
+
+
 class CommitMap():
     """Provides a mapping from commit hash to additional information."""
 
+    # Lookup tables that are created on first use: a dense table indexed by
+    # time id and the sorted hashes with their time ids for bulk conversions.
+    _index: tp.Optional[CommitMapIndex] = None
+    _id_to_hash: tp.Optional[_HashArrayTy] = None
+    _sorted_hashes: tp.Optional[_HashArrayTy] = None
+    _sorted_time_ids: tp.Optional[npt.NDArray[np.int64]] = None
+
     def __init__(
         self,
         git_path: Path,
@@ -41,6 +424,7 @@ class CommitMap():
         self.refspec = refspec
         self._hash_to_id = None
         self._hash_to_id_master = None
+        self._index = None
 
     @property
     def __hash_to_id(self) -> CharTrie:
@@ -55,43 +439,57 @@ class CommitMap():
         return self._hash_to_id_master
 
     def generate_hash_to_id(self, master: bool = False) -> CharTrie:
-        search_range = ""
-        if self.start is not None:
-            search_range += self.start + ".."
-        search_range += self.end
-
-        with local.cwd(self.git_path):
-            old_head = get_current_branch()
-            git("checkout", self.refspec)
-            full_out = git("--no-pager", "log", "--all", "--pretty=format:'%H'")
-            if master:
-                wanted_out = git(
-                    "--no-pager", "log", "--pretty=format:'%H'", search_range
-                )
-            else:
-                wanted_out = git(
-                    "--no-pager", "log", "--all", "--pretty=format:'%H'",
-                    search_range
-                )
+        """
+        Generate the mapping from commit hashes to time ids from the persisted
+        commit map index of the repository.
 
-            def format_stream() -> tp.Generator[str, None, None]:
-                wanted_cm = set()
-                for line in wanted_out.split('\n'):
-                    wanted_cm.add(line[1:-1])
+        Args:
+            master: only include commits of the mapped branch, i.e., ignore
+                    commits that are only reachable from other references
 
-                for number, line in enumerate(reversed(full_out.split('\n'))):
-                    line = line[1:-1]
-                    if line in wanted_cm:
-                        yield f"{number}, {line}\n"
+        Returns:
+            a trie that maps commit hashes to time ids
+        """
+        if self._index is None:
+            self._index = CommitMapIndex.load_or_build(
+                self.git_path, self.refspec, self.start, self.end
+            )
+
+        range_flag = CommitMapIndex.IN_BRANCH_RANGE if master \
+            else CommitMapIndex.IN_RANGE
+        hashes = self._index.hashes()
+        hash_to_id: CharTrie = CharTrie()
+        for time_id in np.flatnonzero(self._index.flags & range_flag):
+            hash_to_id[hashes[time_id]] = int(time_id)
+
+        return hash_to_id
+
+    def __lookup_tables(
+        self
+    ) -> tp.Tuple[_HashArrayTy, _HashArrayTy, npt.NDArray[np.int64]]:
+        if self._id_to_hash is None or self._sorted_hashes is None or \
+                self._sorted_time_ids is None:
+            hash_to_id = self.__hash_to_id
+            if self._index is not None:
+                time_ids = np.flatnonzero(
+                    self._index.flags & CommitMapIndex.IN_RANGE
+                ).astype(np.int64)
+                hashes = _to_hash_array(self._index.hashes())[time_ids]
+            else:
+                hashes = _to_hash_array(hash_to_id.keys())
+                time_ids = np.fromiter(
+                    hash_to_id.values(), dtype=np.int64, count=len(hashes)
+                )
 
-            hash_to_id: CharTrie = CharTrie()
-            for line in format_stream():
-                slices = line.strip().split(', ')
-                hash_to_id[slices[1]] = int(slices[0])
+            num_ids = int(time_ids.max()) + 1 if len(time_ids) else 0
+            self._id_to_hash = np.zeros(num_ids, dtype=f"S{_HEX_HASH_LENGTH}")
+            self._id_to_hash[time_ids] = hashes
 
-            git("checkout", old_head)
+            order = np.argsort(hashes)
+            self._sorted_hashes = hashes[order]
+            self._sorted_time_ids = time_ids[order]
 
-            return hash_to_id
+        return self._id_to_hash, self._sorted_hashes, self._sorted_time_ids
 
     def convert_to_full_or_warn(
         self, short_commit: ShortCommitHash
@@ -168,10 +566,97 @@ class CommitMap():
         Returns:
             commit hash
         """
-        for c_hash, t_id in self.__hash_to_id.items():
-            if t_id == time_id:
-                return FullCommitHash(tp.cast(str, c_hash))
-        raise KeyError
+        return self.c_hashes([time_id])[0]
+
+    def time_ids(
+        self, c_hashes: tp.Iterable[tp.Union[FullCommitHash, str]]
+    ) -> npt.NDArray[np.int64]:
+        """
+        Convert multiple commit hashes to their time ids at once, e.g., a
+        column of a data frame.
+
+        Args:
+            c_hashes: full commit hashes as commit hash objects or strings
+
+        Returns:
+            array with the unique time-ordered id of every commit
+        """
+        queries = _to_hash_array(c_hashes)
+        _, sorted_hashes, sorted_time_ids = self.__lookup_tables()
+        if len(queries) == 0:
+            return np.zeros(0, dtype=np.int64)
+        if len(sorted_hashes) == 0:
+            raise KeyError(queries[0].decode())
+
+        positions = np.minimum(
+            np.searchsorted(sorted_hashes, queries),
+            len(sorted_hashes) - 1
+        )
+        missing = sorted_hashes[positions] != queries
+        if missing.any():
+            raise KeyError(queries[missing][0].decode())
+
+        return sorted_time_ids[positions]
+
+    def short_time_ids(
+        self, c_hashes: tp.Iterable[tp.Union[CommitHash, str]]
+    ) -> npt.NDArray[np.int64]:
+        """
+        Convert multiple, possibly short, commit hashes to their time ids at
+        once, e.g., a column of a data frame.
+
+        Like :func:`short_time_id`, a warning is logged for ambiguous short
+        hashes.
+
+        Args:
+            c_hashes: commit hashes as commit hash objects or strings
+
+        Returns:
+            array with the unique time-ordered id of every commit
+        """
+        prefixes = _to_hash_array(c_hashes)
+        _, sorted_hashes, sorted_time_ids = self.__lookup_tables()
+        if len(prefixes) == 0:
+            return np.zeros(0, dtype=np.int64)
+        if len(sorted_hashes) == 0:
+            raise KeyError(prefixes[0].decode())
+
+        positions = np.searchsorted(sorted_hashes, prefixes)
+        candidates = np.minimum(positions, len(sorted_hashes) - 1)
+        missing = ~np.char.startswith(sorted_hashes[candidates], prefixes)
+        if missing.any():
+            raise KeyError(prefixes[missing][0].decode())
+
+        successors = np.minimum(positions + 1, len(sorted_hashes) - 1)
+        ambiguous = (positions + 1 < len(sorted_hashes)
+                    ) & np.char.startswith(sorted_hashes[successors], prefixes)
+        for prefix in prefixes[ambiguous]:
+            LOG.warning(f"Short commit hash is ambiguous: {prefix.decode()}.")
+
+        return sorted_time_ids[candidates]
+
+    def c_hashes(self, time_ids: npt.ArrayLike) -> tp.List[FullCommitHash]:
+        """
+        Get the hashes belonging to multiple time ids at once.
+
+        Args:
+            time_ids: unique time-ordered ids
+
+        Returns:
+            list of commit hashes in the order of the given ids
+        """
+        id_to_hash = self.__lookup_tables()[0]
+        queries = np.asarray(time_ids, dtype=np.int64).reshape(-1)
+        out_of_range = (queries < 0) | (queries >= len(id_to_hash))
+        if out_of_range.any():
+            raise KeyError(int(queries[out_of_range][0]))
+
+        hashes = id_to_hash[queries]
+        unmapped = hashes == b""
+        if unmapped.any():
+            raise KeyError(int(queries[unmapped][0]))
+
+        return [FullCommitHash(c_hash.decode()) for c_hash in hashes]
 
     def complete_c_hash(
         self, short_commit: ShortCommitHash
@@ -203,6 +688,10 @@ class CommitMap():
         return str(self.__hash_to_id)
 
 
+_CommitMapKeyTy = tp.Tuple[str, str, tp.Optional[str], str]
+__SHARED_COMMIT_MAPS: tp.Optional[tp.Dict[_CommitMapKeyTy, CommitMap]] = None
+
+
 def get_commit_map(
     project_name: str,
     end: str = "HEAD",
@@ -229,4 +718,34 @@ def get_commit_map(
     elif refspec is None:
         refspec = "HEAD"
 
-    return CommitMap(project_git_path, end, start, refspec)
+    if __SHARED_COMMIT_MAPS is None:
+        return CommitMap(project_git_path, end, start, refspec)
+
+    key = (project_name, end, start, refspec)
+    if key not in __SHARED_COMMIT_MAPS:
+        __SHARED_COMMIT_MAPS[key] = CommitMap(
+            project_git_path, end, start, refspec
+        )
+    return __SHARED_COMMIT_MAPS[key]
+
+
+@contextmanager
+def shared_commit_maps() -> tp.Iterator[None]:
+    """
+    Context in which :func:`get_commit_map` returns the same commit map for
+    the same arguments, so the lookup tables of a commit map are only created
+    once.
+
+    Use this when many independent users need the commit map of the same
+    project, e.g., when generating artefacts.
+    """
+    global __SHARED_COMMIT_MAPS  # pylint: disable=global-statement
+    if __SHARED_COMMIT_MAPS is not None:
+        yield
+        return
+
+    __SHARED_COMMIT_MAPS = {}
+    try:
+        yield
+    finally:
+        __SHARED_COMMIT_MAPS = None
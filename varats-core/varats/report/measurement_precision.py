@@ -0,0 +1,100 @@
+"""Precision that repeated measurements achieved, stored alongside the reports
+of the measurements."""
+import math
+import typing as tp
+from pathlib import Path
+
+from varats.utils.yaml_util import load_yaml, store_as_yaml
+
+MEASUREMENT_PRECISION_FILE_NAME = "measurement_precision.yaml"
+
+
+class MeasurementPrecision():
+    """
+    Precision of the mean wall-clock times of workloads that were measured
+    repeatedly.
+
+    The precision of a workload is the half-width of the confidence interval of
+    its mean wall-clock time relative to the mean, e.g., ``0.02`` if the mean
+    is known up to ±2%.
+
+    Args:
+        repetitions: number of times every workload was measured
+        confidence: confidence level of the confidence intervals
+        workload_precisions: achieved precision by workload
+    """
+
+    def __init__(
+        self, repetitions: int, confidence: float,
+        workload_precisions: tp.Dict[str, float]
+    ) -> None:
+        self.__repetitions = repetitions
+        self.__confidence = confidence
+        self.__workload_precisions = workload_precisions
+
+    @property
+    def repetitions(self) -> int:
+        """Number of times every workload was measured."""
+        return self.__repetitions
+
+    @property
+    def confidence(self) -> float:
+        """Confidence level of the confidence intervals."""
+        return self.__confidence
+
+    @property
+    def workload_precisions(self) -> tp.Dict[str, float]:
+        """Achieved precision by workload."""
+        return self.__workload_precisions
+
+    @property
+    def precision(self) -> float:
+        """Worst precision of all workloads, i.e., the largest relative
+        half-width of a confidence interval."""
+        return max(self.__workload_precisions.values(), default=math.inf)
+
+    def get_dict(self) -> tp.Dict[str, tp.Any]:
+        return {
+            "repetitions": self.__repetitions,
+            "confidence": self.__confidence,
+            "workload_precisions": self.__workload_precisions,
+        }
+
+    @staticmethod
+    def create_from_dict(
+        precision_dict: tp.Dict[str, tp.Any]
+    ) -> 'MeasurementPrecision':
+        return MeasurementPrecision(
+            int(precision_dict["repetitions"]),
+            float(precision_dict["confidence"]), {
+                str(workload): float(precision) for workload, precision in
+                precision_dict["workload_precisions"].items()
+            }
+        )
+
+
+def store_measurement_precision(
+    folder: Path, precision: MeasurementPrecision
+) -> None:
+    """
+    Store the precision of measurements in the folder that contains the
+    reports of the measurements.
+
+    Args:
+        folder: folder with the reports, e.g., a zipped report folder
+        precision: the achieved precision
+    """
+    store_as_yaml(folder / MEASUREMENT_PRECISION_FILE_NAME, [precision])
+
+
+def load_measurement_precision(file_path: Path) -> MeasurementPrecision:
+    """
+    Load the precision of measurements from a file.
+
+    Args:
+        file_path: path to the precision file
+
+    Returns:
+        the achieved precision
+    """
+    return MeasurementPrecision.create_from_dict(next(load_yaml(file_path)))
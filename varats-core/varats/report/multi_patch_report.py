@@ -1,9 +1,10 @@
 """MultiPatchReport to group together similar reports that where produced for
 differently patched projects."""
-import shutil
 import tempfile
 import typing as tp
+import weakref
 from pathlib import Path
+from zipfile import ZipFile
 
 from varats.provider.patch.patch_provider import Patch
 from varats.report.report import ReportTy, BaseReport
@@ -12,47 +13,77 @@ from varats.report.report import ReportTy, BaseReport
 class MultiPatchReport(
     BaseReport, tp.Generic[ReportTy], shorthand="MPR", file_type=".zip"
 ):
-    """Meta report to group together reports of the same type that where
-    produced with differently patched projects."""
+    """
+    Meta report to group together reports of the same type that where produced
+    with differently patched projects.
+
+    Only the member names of the archive are read on creation. The baseline and
+    patched reports are extracted and parsed when they are accessed the first
+    time.
+    """
+
+    PERSISTABLE = False
 
     def __init__(self, path: Path, report_type: tp.Type[ReportTy]) -> None:
         super().__init__(path)
+        self.__report_type = report_type
+        self.__base: tp.Optional[ReportTy] = None
         self.__patched_reports: tp.Dict[str, ReportTy] = {}
-        self.__base = None
 
-        with tempfile.TemporaryDirectory() as tmp_result_dir:
-            shutil.unpack_archive(path, extract_dir=tmp_result_dir)
-
-            for report in Path(tmp_result_dir).iterdir():
-                if self.is_baseline_report(report.name):
-                    self.__base = report_type(report)
-                elif self.is_patched_report(report.name):
-                    self.__patched_reports[
+        # Contained reports can access their files lazily, so the extracted
+        # files need to live as long as this report.
+        self.__tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.__finalizer = weakref.finalize(self, self.__tmpdir.cleanup)
+
+        self.__base_member: tp.Optional[str] = None
+        self.__patch_members: tp.Dict[str, str] = {}
+        with ZipFile(path) as archive:
+            for member in archive.infolist():
+                if member.is_dir() or "/" in member.filename:
+                    continue
+
+                if self.is_baseline_report(member.filename):
+                    self.__base_member = member.filename
+                elif self.is_patched_report(member.filename):
+                    self.__patch_members[
                         self._parse_patch_shorthand_from_report_name(
-                            report.name
-                        )] = report_type(report)
+                            member.filename
+                        )] = member.filename
+
+        if not self.__base_member or not self.__patch_members:
+            raise AssertionError(f"Reports where missing in the file {path=}")
 
-            if not self.__base or not self.__patched_reports:
-                raise AssertionError(
-                    f"Reports where missing in the file {path=}"
-                )
+    def __load_member(self, member: str) -> ReportTy:
+        with ZipFile(self.path) as archive:
+            report_path = Path(archive.extract(member, self.__tmpdir.name))
+        return self.__report_type(report_path)
 
     def get_baseline_report(self) -> ReportTy:
+        if self.__base is None:
+            self.__base = self.__load_member(tp.cast(str, self.__base_member))
         return self.__base
 
     def get_report_for_patch(self,
                              patch_shortname: str) -> tp.Optional[ReportTy]:
         """Get the report for a given patch shortname."""
-        if patch_shortname in self.__patched_reports:
-            return self.__patched_reports[patch_shortname]
+        if patch_shortname not in self.__patch_members:
+            return None
 
-        return None
+        if patch_shortname not in self.__patched_reports:
+            self.__patched_reports[patch_shortname] = self.__load_member(
+                self.__patch_members[patch_shortname]
+            )
+        return self.__patched_reports[patch_shortname]
 
     def get_patch_names(self) -> tp.List[str]:
-        return list(self.__patched_reports.keys())
+        return list(self.__patch_members.keys())
 
     def get_patched_reports(self) -> tp.ValuesView[ReportTy]:
-        return self.__patched_reports.values()
+        return {
+            patch_shortname:
+            tp.cast(ReportTy, self.get_report_for_patch(patch_shortname))
+            for patch_shortname in self.__patch_members
+        }.values()
 
     @staticmethod
     def create_baseline_report_name(base_file_name: str) -> str:
@@ -1,18 +1,24 @@
 """The Report module implements basic report functionalities and provides a
 minimal interface ``BaseReport`` to implement own reports."""
 import re
-import shutil
 import typing as tp
 import weakref
 from collections import defaultdict
 from enum import Enum
+from multiprocessing import Pool
 from os import stat_result
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from zipfile import ZipFile
 
 from plumbum import colors
 from plumbum.colorlib.styles import Color
 
+from varats.report.measurement_precision import (
+    MEASUREMENT_PRECISION_FILE_NAME,
+    MeasurementPrecision,
+    load_measurement_precision,
+)
 from varats.utils.git_util import ShortCommitHash
 
 
@@ -527,6 +533,13 @@ class BaseReport():
     SHORTHAND: str
     FILE_TYPE: str
 
+    # Version of the parsed report representation; increasing it invalidates
+    # parsed reports that were persisted by the data manager.
+    REPORT_VERSION: int = 1
+    # Whether parsed reports can be persisted, reports that depend on
+    # temporary files must disable this.
+    PERSISTABLE: bool = True
+
     def __init__(self, path: Path) -> None:
         self.__path = path
         self.__filename = ReportFilename(path)
@@ -715,9 +728,17 @@ class KeyedReportAggregate(
     file.
 
     The `key_func` is used to divide the parsed reports into different
-    categories/buckets.
+    categories/buckets. Reports are only extracted from the zip file and parsed
+    when the reports of their category are accessed the first time, use
+    :func:`load_all_reports` to parse all reports in parallel.
+
+    If the zip file contains the precision that repeated measurements achieved,
+    it is not treated as a report but provided as
+    :attr:`measurement_precision`.
     """
 
+    PERSISTABLE = False
+
     def __init__(
         self,
         path: Path,
@@ -732,14 +753,27 @@ class KeyedReportAggregate(
         self.__tmpdir = TemporaryDirectory()  # pylint: disable=R1732
         self.__finalizer = weakref.finalize(self, self.__tmpdir.cleanup)
 
-        # Extract archive and parse reports.
+        self.__report_type = report_type
+        self.__default_key = default_key
+
+        # Index the archive members, reports are extracted and parsed lazily.
+        self.__members: tp.Dict[KeyTy, tp.List[str]] = defaultdict(list)
+        self.__has_precision = False
         if self.path.exists():
-            shutil.unpack_archive(self.path, self.__tmpdir.name)
+            with ZipFile(self.path) as archive:
+                for member in archive.infolist():
+                    if member.is_dir() or "/" in member.filename.rstrip("/"):
+                        continue
 
-        self.__default_key = default_key
-        self.__reports: tp.Dict[KeyTy, tp.List[ReportTy]] = defaultdict(list)
-        for file in Path(self.__tmpdir.name).iterdir():
-            self.__reports[key_func(file)].append(report_type(file))
+                    if member.filename == MEASUREMENT_PRECISION_FILE_NAME:
+                        self.__has_precision = True
+                        continue
+
+                    self.__members[key_func(
+                        Path(self.__tmpdir.name) / member.filename
+                    )].append(member.filename)
+
+        self.__reports: tp.Dict[KeyTy, tp.List[ReportTy]] = {}
 
     def remove(self) -> None:
         self.__finalizer()
@@ -749,17 +783,70 @@ class KeyedReportAggregate(
         return not self.__finalizer.alive
 
     def keys(self) -> tp.Collection[KeyTy]:
-        return self.__reports.keys()
+        return self.__members.keys()
+
+    @property
+    def measurement_precision(self) -> tp.Optional[MeasurementPrecision]:
+        """Precision that the repeated measurements of the reports achieved, if
+        it was recorded."""
+        if not self.__has_precision:
+            return None
+
+        with ZipFile(self.path) as archive:
+            precision_file = archive.extract(
+                MEASUREMENT_PRECISION_FILE_NAME, self.__tmpdir.name
+            )
+        return load_measurement_precision(Path(precision_file))
+
+    def __extract_members(self, keys: tp.Iterable[KeyTy]) -> tp.List[Path]:
+        members = [member for key in keys for member in self.__members[key]]
+        if members:
+            with ZipFile(self.path) as archive:
+                for member in members:
+                    archive.extract(member, self.__tmpdir.name)
+
+        return [Path(self.__tmpdir.name) / member for member in members]
+
+    def load_all_reports(self, jobs: tp.Optional[int] = None) -> None:
+        """
+        Parses all reports that were not accessed so far in a process pool.
+
+        Args:
+            jobs: number of worker processes; defaults to the number of CPUs
+        """
+        missing_keys = [key for key in self.keys() if key not in self.__reports]
+        report_files = self.__extract_members(missing_keys)
+        if len(report_files) < 2 or jobs == 1:
+            parsed_reports = [
+                self.__report_type(report_file) for report_file in report_files
+            ]
+        else:
+            with Pool(jobs) as process_pool:
+                parsed_reports = process_pool.map(
+                    self.__report_type, report_files
+                )
+
+        parsed_reports_iter = iter(parsed_reports)
+        for key in missing_keys:
+            self.__reports[key] = [
+                next(parsed_reports_iter) for _ in self.__members[key]
+            ]
 
     def reports(self, key: tp.Optional[KeyTy] = None) -> tp.List[ReportTy]:
         """Returns the list of parsed reports."""
-        if key:
-            return self.__reports[key]
+        if not key:
+            if self.__default_key is None:
+                raise AssertionError("No key or default key was provided.")
+
+            key = self.__default_key
 
-        if self.__default_key is None:
-            raise AssertionError("No key or default key was provided.")
+        if key not in self.__reports:
+            self.__reports[key] = [
+                self.__report_type(report_file)
+                for report_file in self.__extract_members([key])
+            ]
 
-        return self.__reports[self.__default_key]
+        return self.__reports[key]
 
 
 def _key_id(_: Path) -> int:
@@ -8,6 +8,8 @@ from enum import Enum
 from pathlib import Path
 
 import ijson
+import numpy as np
+import numpy.typing as npt
 
 from varats.experiment.workload_util import WorkloadSpecificReportAggregate
 from varats.report.report import BaseReport, ReportAggregate
@@ -48,6 +50,64 @@ class TraceEventType(Enum):
         return str(self.value)
 
 
+__TRACE_EVENT_TYPES: tp.List[TraceEventType] = list(TraceEventType)
+__TRACE_EVENT_TYPE_IDS: tp.Dict[str, int] = {
+    trace_event_type.value: type_id
+    for type_id, trace_event_type in enumerate(__TRACE_EVENT_TYPES)
+}
+
+
+def trace_event_type_from_id(type_id: int) -> TraceEventType:
+    """
+    Converts an event type id, as stored in :class:`TraceEventColumns`, back to
+    its :class:`TraceEventType`.
+
+    Args:
+        type_id: id of the event type
+
+    Returns:
+        the corresponding trace event type
+    """
+    return __TRACE_EVENT_TYPES[type_id]
+
+
+def trace_event_type_id(trace_event_type: TraceEventType) -> int:
+    """
+    Converts a :class:`TraceEventType` to the id that is used to store it in
+    :class:`TraceEventColumns`.
+
+    Args:
+        trace_event_type: the trace event type
+
+    Returns:
+        the corresponding event type id
+    """
+    return __TRACE_EVENT_TYPE_IDS[trace_event_type.value]
+
+
+def _parse_event_type_id(raw_event_type: str) -> int:
+    if (type_id := __TRACE_EVENT_TYPE_IDS.get(raw_event_type)) is not None:
+        return type_id
+
+    raise LookupError("Could not find correct trace event type")
+
+
+class TraceEventColumns(tp.NamedTuple):
+    """Columnar representation of all trace events of a :class:`TEFReport`,
+    where the i-th entry of every array belongs to the i-th trace event."""
+
+    timestamp: npt.NDArray[np.int64]
+    pid: npt.NDArray[np.int64]
+    tid: npt.NDArray[np.int64]
+    uuid: npt.NDArray[np.uint64]
+    name_id: npt.NDArray[np.int32]
+    category_id: npt.NDArray[np.int32]
+    event_type: npt.NDArray[np.uint8]
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
 class TraceEvent():
     """Represents a trace event that was captured during the analysis of a
     target program."""
@@ -76,6 +136,40 @@ class TraceEvent():
             LOG.critical("Could not parse UUID/ID from trace event")
             self.__uuid: int = 0
 
+    @staticmethod
+    def from_columns(
+        columns: TraceEventColumns, index: int,
+        name_id_mapper: 'TEFReport.NameIDMapper',
+        category_mapper: 'TEFReport.NameIDMapper'
+    ) -> 'TraceEvent':
+        """
+        Creates the trace event object for one entry of the columnar event
+        storage of a :class:`TEFReport`.
+
+        Args:
+            columns: columnar trace event storage
+            index: index of the event in the columns
+            name_id_mapper: mapper to infer event names
+            category_mapper: mapper to infer event categories
+
+        Returns:
+            the trace event at the given index
+        """
+        trace_event = object.__new__(TraceEvent)
+        trace_event.__name_id_mapper = name_id_mapper
+        trace_event.__name_id = int(columns.name_id[index])
+        trace_event.__category = category_mapper.infer_name(
+            int(columns.category_id[index])
+        )
+        trace_event.__event_type = trace_event_type_from_id(
+            int(columns.event_type[index])
+        )
+        trace_event.__tracing_clock_timestamp = int(columns.timestamp[index])
+        trace_event.__pid = int(columns.pid[index])
+        trace_event.__tid = int(columns.tid[index])
+        trace_event.__uuid = int(columns.uuid[index])
+        return trace_event
+
     @property
     def name(self) -> str:
         return self.__name_id_mapper.infer_name(self.__name_id)
@@ -120,18 +214,89 @@ class TraceEvent():
         return f"{{ name={self.name}, uuid={self.uuid} }}"
 
 
+class _LostEventsFilter():
+    """File-like wrapper that removes the 'Lost N events' messages, which
+    tracers write into the middle of the json output, while the file is
+    read."""
+
+    __REMOVE_LOST_EVENTS = re.compile(rb'Lost \d+ events')
+
+    def __init__(self, file: tp.BinaryIO) -> None:
+        self.__file = file
+        self.__carry = b""
+        self.__found_lost_events = False
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next chunk of the file with all 'Lost N events' messages
+        removed, chunks always end at a line break."""
+        if size == 0:
+            return b""
+
+        data = self.__carry + self.__file.read(size)
+        line_end = data.rfind(b"\n")
+        while line_end == -1:
+            next_data = self.__file.read(size)
+            if not next_data:
+                break
+
+            data += next_data
+            line_end = data.rfind(b"\n")
+
+        if line_end == -1:
+            self.__carry = b""
+        else:
+            self.__carry = data[line_end + 1:]
+            data = data[:line_end + 1]
+
+        if b"Lost" in data:
+            if not self.__found_lost_events:
+                LOG.error("Events where lost during tracing, skipping them.")
+                self.__found_lost_events = True
+            data = self.__REMOVE_LOST_EVENTS.sub(b"", data)
+
+        return data
+
+
 class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
     """Report class to access trace event format files."""
 
     class NameIDMapper(tp.List[str]):
         """Helper class to map name IDs to names."""
 
+        def __init__(self, names: tp.Iterable[str] = ()) -> None:
+            super().__init__(names)
+            self.__name_ids: tp.Dict[str, int] = {}
+            for name_id, name in enumerate(self):
+                self.__name_ids.setdefault(name, name_id)
+
         def infer_name(self, name_id: int) -> str:
             return self[name_id]
 
+        def name_id(self, name: str) -> int:
+            """
+            Looks up the ID of a name and registers names that are not yet
+            known.
+
+            Args:
+                name: the name to look up
+
+            Returns:
+                the ID of the name
+            """
+            name_id = self.__name_ids.get(name)
+            if name_id is None:
+                name_id = len(self)
+                self.append(name)
+                self.__name_ids[name] = name_id
+
+            return name_id
+
     def __init__(self, path: Path) -> None:
         super().__init__(path)
         self.__name_id_mapper: TEFReport.NameIDMapper = TEFReport.NameIDMapper()
+        self.__category_mapper: TEFReport.NameIDMapper = \
+            TEFReport.NameIDMapper()
+        self.__trace_events: tp.Optional[tp.List[TraceEvent]] = None
         try:
             self._parse_json()
         except Exception as e:
@@ -144,8 +309,34 @@ class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
     def timestamp_unit(self) -> str:
         return self.__timestamp_unit
 
+    @property
+    def name_id_mapper(self) -> 'TEFReport.NameIDMapper':
+        """Mapper to infer the event names of the name IDs in
+        :attr:`event_columns`."""
+        return self.__name_id_mapper
+
+    @property
+    def category_mapper(self) -> 'TEFReport.NameIDMapper':
+        """Mapper to infer the event categories of the category IDs in
+        :attr:`event_columns`."""
+        return self.__category_mapper
+
+    @property
+    def event_columns(self) -> TraceEventColumns:
+        """All trace events of the report stored as columnar arrays, which
+        should be preferred over :attr:`trace_events` for large traces."""
+        return self.__event_columns
+
     @property
     def trace_events(self) -> tp.List[TraceEvent]:
+        if self.__trace_events is None:
+            self.__trace_events = [
+                TraceEvent.from_columns(
+                    self.__event_columns, index, self.__name_id_mapper,
+                    self.__category_mapper
+                ) for index in range(len(self.__event_columns))
+            ]
+
         return self.__trace_events
 
     @property
@@ -154,59 +345,62 @@ class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
             "Stack frame parsing is currently not implemented!"
         )
 
-    def _patch_errors_from_file(self) -> None:
-        with open(self.path, "r") as f:
-            data = f.read()
-
-        with open(self.path, "w") as f:
-            remove_lost_events = re.compile('Lost \d+ events')
-            for line in data.splitlines():
-                if "Lost" in line:
-                    LOG.error(
-                        "Events where lost during tracing, patching json file."
-                    )
-                    line = remove_lost_events.sub("", line)
-
-                f.write(line)
-
     def _parse_json(self) -> None:
-        trace_events: tp.List[TraceEvent] = []
-
-        self._patch_errors_from_file()
-
+        timestamps: tp.List[int] = []
+        pids: tp.List[int] = []
+        tids: tp.List[int] = []
+        uuids: tp.List[int] = []
+        name_ids: tp.List[int] = []
+        category_ids: tp.List[int] = []
+        event_types: tp.List[int] = []
+
+        def add_trace_event(trace_event: tp.Dict[str, tp.Any]) -> None:
+            name_ids.append(
+                self.__name_id_mapper.name_id(str(trace_event["name"]))
+            )
+            category_ids.append(
+                self.__category_mapper.name_id(str(trace_event["cat"]))
+            )
+            event_types.append(_parse_event_type_id(trace_event["ph"]))
+            timestamps.append(int(trace_event["ts"]))
+            pids.append(int(trace_event["pid"]))
+            tids.append(int(trace_event["tid"]))
+
+            if "UUID" in trace_event:
+                uuids.append(int(trace_event["UUID"]))
+            elif "ID" in trace_event:
+                uuids.append(int(trace_event["ID"]))
+            else:
+                LOG.critical("Could not parse UUID/ID from trace event")
+                uuids.append(0)
+
+        self.__timestamp_unit: str = ""
         with open(self.path, "rb") as f:
-            parser = ijson.parse(f)
-            trace_event: tp.Dict[str, str] = {}
+            trace_event: tp.Dict[str, tp.Any] = {}
             key = ""
-            for prefix, event, value in parser:
+            for prefix, event, value in ijson.parse(_LostEventsFilter(f)):
                 if event == "map_key":
                     key = value
-                if prefix.startswith("traceEvents.item"):
-                    if prefix == "traceEvents.item" and event == "start_map":
+                elif prefix == "traceEvents.item":
+                    if event == "start_map":
                         trace_event = {}
-                    if prefix == "traceEvents.item" and event == "end_map":
-                        if trace_event is not None:
-                            if trace_event["name"] in self.__name_id_mapper:
-                                name_id = self.__name_id_mapper.index(
-                                    trace_event["name"]
-                                )
-                            else:
-                                self.__name_id_mapper.append(
-                                    trace_event["name"]
-                                )
-                                name_id = len(self.__name_id_mapper) - 1
-                            trace_events.append(
-                                TraceEvent(
-                                    trace_event, name_id, self.__name_id_mapper
-                                )
-                            )
-
-                    elif event == "string" or event == "number":
+                    elif event == "end_map":
+                        add_trace_event(trace_event)
+                elif event in ("string", "number"):
+                    if prefix.startswith("traceEvents.item"):
                         trace_event[key] = value
-                elif prefix.startswith("timestampUnit"):
-                    if event == "string":
-                        self.__timestamp_unit: str = str(value)
-        self.__trace_events: tp.List[TraceEvent] = trace_events
+                    elif prefix == "timestampUnit":
+                        self.__timestamp_unit = str(value)
+
+        self.__event_columns = TraceEventColumns(
+            timestamp=np.array(timestamps, dtype=np.int64),
+            pid=np.array(pids, dtype=np.int64),
+            tid=np.array(tids, dtype=np.int64),
+            uuid=np.array(uuids, dtype=np.uint64),
+            name_id=np.array(name_ids, dtype=np.int32),
+            category_id=np.array(category_ids, dtype=np.int32),
+            event_type=np.array(event_types, dtype=np.uint8)
+        )
 
 
 class TEFReportAggregate(
@@ -7,6 +7,8 @@ revision specific files, e.g., to get all files of a specific report that have
 been processed successfully.
 """
 
+import os
+import time
 import typing as tp
 from collections import defaultdict
 from pathlib import Path
@@ -23,6 +25,7 @@ from varats.report.report import (
     ReportFilepath,
     ReportFilename,
 )
+from varats.utils.filesystem_util import RACY_MTIME_NS
 from varats.utils.git_util import ShortCommitHash, CommitHashTy, CommitHash
 from varats.utils.settings import vara_cfg
 
@@ -67,10 +70,189 @@ def filter_blocked_revisions(
     ]
 
 
+class ResultFileCatalog():
+    """
+    Index of all result files in the result folder of a project.
+
+    The catalog is built once and only rescans folders whose modification time
+    changed, so repeated queries do not need to walk the whole result tree and
+    parse every file name again.
+    """
+
+    class Entry(tp.NamedTuple):
+        """Parsed information about a single result file."""
+        report_filepath: ReportFilepath
+        experiment_shorthand: str
+        report_shorthand: str
+        commit_hash: ShortCommitHash
+        config_id: tp.Optional[int]
+        file_status: FileStatusExtension
+
+    class _Folder(tp.NamedTuple):
+        mtime_ns: int
+        scan_time_ns: int
+        sub_folders: tp.List[str]
+        entries: tp.List['ResultFileCatalog.Entry']
+
+    def __init__(self, result_dir: Path) -> None:
+        self.__result_dir = result_dir
+        self.__folders: tp.Dict[str, ResultFileCatalog._Folder] = {}
+        self.__entries: tp.Dict[tp.Tuple[str, str],
+                                tp.List[ResultFileCatalog.Entry]] = {}
+
+    @property
+    def result_dir(self) -> Path:
+        return self.__result_dir
+
+    def __scan_folder(
+        self, folder: str, mtime_ns: int
+    ) -> 'ResultFileCatalog._Folder':
+        scan_time_ns = time.time_ns()
+        sub_folders: tp.List[str] = []
+        entries: tp.List[ResultFileCatalog.Entry] = []
+        with os.scandir(folder) as dir_iter:
+            for dir_entry in dir_iter:
+                # symlinks are not followed, as they could point to a parent
+                if dir_entry.is_dir(follow_symlinks=False):
+                    sub_folders.append(dir_entry.path)
+                    continue
+
+                report_filepath = ReportFilepath.construct(
+                    Path(dir_entry.path), self.__result_dir
+                )
+                report_file = report_filepath.report_filename
+                if report_file.is_result_file():
+                    entries.append(
+                        ResultFileCatalog.Entry(
+                            report_filepath, report_file.experiment_shorthand,
+                            report_file.report_shorthand,
+                            report_file.commit_hash, report_file.config_id,
+                            report_file.file_status
+                        )
+                    )
+
+        return ResultFileCatalog._Folder(
+            mtime_ns, scan_time_ns, sub_folders, entries
+        )
+
+    def __is_up_to_date(
+        self, cached_folder: 'ResultFileCatalog._Folder', mtime_ns: int
+    ) -> bool:
+        # folders modified shortly before they were scanned could have been
+        # changed again without updating their mtime, so they are rescanned
+        return cached_folder.mtime_ns == mtime_ns and (
+            mtime_ns + RACY_MTIME_NS < cached_folder.scan_time_ns
+        )
+
+    def update(self) -> None:
+        """Rescan all folders of the result directory that changed since the
+        last update."""
+        folders: tp.Dict[str, ResultFileCatalog._Folder] = {}
+        changed = False
+        if self.__result_dir.exists():
+            unvisited_folders = [str(self.__result_dir)]
+            while unvisited_folders:
+                folder = unvisited_folders.pop()
+                if folder in folders:
+                    continue
+
+                cached_folder = self.__folders.get(folder)
+                try:
+                    mtime_ns = os.stat(folder).st_mtime_ns
+                    if cached_folder and self.__is_up_to_date(
+                        cached_folder, mtime_ns
+                    ):
+                        folders[folder] = cached_folder
+                    else:
+                        folders[folder] = self.__scan_folder(folder, mtime_ns)
+                        changed = True
+                except FileNotFoundError:
+                    continue
+
+                unvisited_folders.extend(folders[folder].sub_folders)
+
+        if changed or folders.keys() != self.__folders.keys():
+            self.__folders = folders
+            self.__entries = defaultdict(list)
+            for cached_folder in folders.values():
+                for entry in cached_folder.entries:
+                    self.__entries[
+                        (entry.experiment_shorthand,
+                         entry.report_shorthand)].append(entry)
+
+    def entries(
+        self,
+        experiment_shorthand: tp.Optional[str] = None,
+        report_shorthand: tp.Optional[str] = None,
+        commit_hash: tp.Optional[ShortCommitHash] = None,
+        config_id: tp.Optional[int] = None,
+        file_statuses: tp.Optional[tp.Iterable[FileStatusExtension]] = None
+    ) -> tp.List['ResultFileCatalog.Entry']:
+        """
+        Query the catalog for result files. Filters that are not given, or are
+        ``None``, match every result file.
+
+        Args:
+            experiment_shorthand: shorthand of the experiment that created the
+                                  result files
+            report_shorthand: shorthand of the report type of the result files
+            commit_hash: revision of the result files
+            config_id: configuration id of the result files
+            file_statuses: statuses the result files should have
+
+        Returns:
+            the catalog entries of all matching result files
+        """
+        self.update()
+
+        if experiment_shorthand is not None and report_shorthand is not None:
+            entries = self.__entries.get(
+                (experiment_shorthand, report_shorthand), []
+            )
+        else:
+            entries = [
+                entry
+                for (exp_shorthand,
+                     rep_shorthand), type_entries in self.__entries.items()
+                for entry in type_entries
+                if experiment_shorthand in (None, exp_shorthand) and
+                report_shorthand in (None, rep_shorthand)
+            ]
+
+        statuses = set(file_statuses) if file_statuses is not None else None
+        return [
+            entry for entry in entries
+            if (commit_hash is None or entry.commit_hash == commit_hash) and
+            (config_id is None or entry.config_id == config_id) and
+            (statuses is None or entry.file_status in statuses)
+        ]
+
+
+__RESULT_FILE_CATALOGS: tp.Dict[Path, ResultFileCatalog] = {}
+
+
+def get_result_file_catalog(project_name: str) -> ResultFileCatalog:
+    """
+    Returns the result file catalog of a project.
+
+    Args:
+        project_name: target project
+
+    Returns:
+        the result file catalog of the project
+    """
+    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
+    if res_dir not in __RESULT_FILE_CATALOGS:
+        __RESULT_FILE_CATALOGS[res_dir] = ResultFileCatalog(res_dir)
+
+    return __RESULT_FILE_CATALOGS[res_dir]
+
+
 def __get_result_files_dict(
     project_name: str,
     opt_experiment_type: tp.Optional[tp.Type["exp_u.VersionExperiment"]] = None,
-    opt_report_type: tp.Optional[tp.Type[BaseReport]] = None
+    opt_report_type: tp.Optional[tp.Type[BaseReport]] = None,
+    config_id: tp.Optional[int] = None
 ) -> tp.Dict[ShortCommitHash, tp.List[ReportFilepath]]:
     """
     Returns a dict that maps the commit_hash to a list of all result files of
@@ -81,38 +263,26 @@ def __get_result_files_dict(
         opt_experiment_type: the experiment type that created the result files
         opt_report_type: the report type of the result files;
                      defaults to experiment's main report
+        config_id: only include result files of this configuration
     """
-    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
-
     # maps commit hash -> list of res files (success or fail)
     result_files: tp.DefaultDict[ShortCommitHash,
                                  tp.List[ReportFilepath]] = defaultdict(list)
-    if not res_dir.exists():
-        return result_files
-    if opt_experiment_type is None:
-        condition: tp.Callable[[ReportFilename], bool] = lambda x: True
-    else:
-        experiment_type = opt_experiment_type
+
+    experiment_shorthand: tp.Optional[str] = None
+    report_shorthand: tp.Optional[str] = None
+    if opt_experiment_type is not None:
+        experiment_shorthand = opt_experiment_type.shorthand()
         if opt_report_type:
-            report_type = opt_report_type
+            report_shorthand = opt_report_type.shorthand()
         else:
-            report_type = experiment_type.report_spec().main_report
-
-        def matches_report_type(file: ReportFilename) -> bool:
-            return file.report_shorthand == report_type.shorthand(
-            ) and file.experiment_shorthand == experiment_type.shorthand()
-
-        condition = matches_report_type
-
-    for res_file in res_dir.rglob("*"):
-        if res_file.is_dir():
-            continue
+            report_shorthand = opt_experiment_type.report_spec(
+            ).main_report.shorthand()
 
-        report_filepath = ReportFilepath.construct(res_file, res_dir)
-        report_file = report_filepath.report_filename
-        if report_file.is_result_file() and condition(report_file):
-            commit_hash = report_file.commit_hash
-            result_files[commit_hash].append(report_filepath)
+    for entry in get_result_file_catalog(project_name).entries(
+        experiment_shorthand, report_shorthand, config_id=config_id
+    ):
+        result_files[entry.commit_hash].append(entry.report_filepath)
 
     return result_files
 
@@ -147,17 +317,10 @@ def __get_files_with_status(
     processed_revisions_paths = []
 
     result_files = __get_result_files_dict(
-        project_name, experiment_type, report_type
+        project_name, experiment_type, report_type, config_id
     )
 
     for value in result_files.values():
-        if config_id is not None:
-            value = [
-                x for x in value if x.report_filename.config_id == config_id
-            ]
-            if not value:
-                continue
-
         sorted_res_files = sorted(
             value, key=lambda x: x.stat().st_mtime, reverse=True
         )
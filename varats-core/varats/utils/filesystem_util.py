@@ -1,10 +1,17 @@
 """Utility functions for handling filesystem related tasks."""
 import fcntl
 import os.path
+import tempfile
+import time
 import typing as tp
 from contextlib import contextmanager
 from pathlib import Path
 
+# Files modified this shortly before they are read could be modified again
+# without changing their modification time, as file systems store modification
+# times with limited granularity.
+RACY_MTIME_NS = 2 * 10**9
+
 
 class FolderAlreadyPresentError(Exception):
     """Exception raised if an operation could not be performed because a folder
@@ -28,3 +35,49 @@ def lock_file(lock_path: Path,
     finally:
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         os.close(lock_fd)
+
+
+def is_racily_modified(file_path: Path) -> bool:
+    """
+    Checks whether a file was modified so recently that a later modification
+    might not change its modification time.
+
+    Args:
+        file_path: path to the file
+
+    Returns:
+        ``True``, if the file's modification time cannot be trusted yet
+    """
+    return time.time_ns() - file_path.stat().st_mtime_ns < RACY_MTIME_NS
+
+
+@contextmanager
+def atomic_write(path: Path,
+                 mode: str = "wb") -> tp.Generator[tp.IO[tp.Any], None, None]:
+    """
+    Open a temporary file next to ``path`` for writing that replaces ``path``
+    once it was written successfully, so readers never see partially written
+    files.
+
+    Args:
+        path: path of the file to write
+        mode: mode to open the file with, e.g., ``"w"`` for text files
+
+    Returns:
+        the opened temporary file
+    """
+    with tempfile.NamedTemporaryFile(
+        mode,
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False
+    ) as tmp_file:
+        try:
+            yield tmp_file
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+
+    os.replace(tmp_file.name, path)
@@ -1,18 +1,22 @@
 """Utility module for handling git repos."""
 import abc
+import hashlib
 import logging
+import pickle
 import re
 import typing as tp
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from itertools import chain
 from operator import attrgetter
 from pathlib import Path
 from types import TracebackType
 
+import numpy as np
 import pygit2
 from benchbuild.utils.cmd import git, grep
-from plumbum import local, TF, RETCODE
+from plumbum import TF, RETCODE
 
 from varats.project.project_util import (
     get_local_project_gits,
@@ -22,6 +26,8 @@ from varats.project.project_util import (
     ProjectBinaryWrapper,
     get_local_project_git_paths,
 )
+from varats.utils.filesystem_util import atomic_write, lock_file
+from varats.utils.settings import vara_cfg
 
 if tp.TYPE_CHECKING:
     from benchbuild.utils.revision_ranges import AbstractRevisionRange
@@ -124,13 +130,17 @@ def commit_hashes_sorted_lexicographically(
 def short_commit_hashes_sorted_by_time_id(
     commit_hashes: tp.Iterable[ShortCommitHash], commit_map: 'cm.CommitMap'
 ) -> tp.Iterable[ShortCommitHash]:
-    return sorted(commit_hashes, key=commit_map.short_time_id)
+    commit_hashes = list(commit_hashes)
+    order = np.argsort(commit_map.short_time_ids(commit_hashes), kind="stable")
+    return [commit_hashes[idx] for idx in order]
 
 
 def full_commit_hashes_sorted_by_time_id(
     commit_hashes: tp.Iterable[FullCommitHash], commit_map: 'cm.CommitMap'
 ) -> tp.Iterable[FullCommitHash]:
-    return sorted(commit_hashes, key=commit_map.time_id)
+    commit_hashes = list(commit_hashes)
+    order = np.argsort(commit_map.time_ids(commit_hashes), kind="stable")
+    return [commit_hashes[idx] for idx in order]
 
 
 ################################################################################
@@ -721,6 +731,275 @@ def map_commits(
     ]
 
 
+class CommitMetadataStore():
+    """
+    Column store for the metadata of all commits of a project's repositories.
+
+    Every known commit gets a dense commit id that indexes the metadata columns,
+    so analyses can look up the metadata of many commits at once instead of
+    materializing every commit with pygit2. The history reachable from the HEAD
+    of each repository is persisted in the data cache, so only commits added
+    since the last use are walked again. Commits outside of that history are
+    resolved on demand.
+    """
+
+    # (hash, author name, author email, author time, commit time, parents)
+    MetadataRowTy = tp.Tuple[str, str, str, int, int, tp.Tuple[str, ...]]
+
+    def __init__(self, repos: tp.Dict[str, pygit2.Repository]) -> None:
+        self.__repos = repos
+        self.__repository_names = list(repos)
+        self.__commit_index: tp.Dict[tp.Tuple[str, str], int] = {}
+        self.__author_name_index: tp.Dict[str, int] = {}
+        self.__author_email_index: tp.Dict[str, int] = {}
+        self.__rows: tp.List[tp.Tuple[int, CommitMetadataStore.MetadataRowTy,
+                                      int, int]] = []
+        self.__columns: tp.Optional[tp.Dict[str, np.ndarray]] = None
+
+        for repository_id, repo in enumerate(repos.values()):
+            for row in self.__load_history(repo):
+                self.__add_commit(repository_id, row)
+
+    @staticmethod
+    def __store_path(repo: pygit2.Repository) -> Path:
+        repo_path = Path(repo.path).resolve()
+        store_key = hashlib.sha1(str(repo_path).encode()).hexdigest()[:16]
+        repo_name = repo_path.parent.name if repo_path.name == ".git" \
+            else repo_path.name
+        return Path(
+            str(vara_cfg()["data_cache"])
+        ) / "commit_metadata" / f"{repo_name}-{store_key}.pickle"
+
+    @staticmethod
+    def __metadata_row(commit: pygit2.Commit) -> 'MetadataRowTy':
+        return (
+            str(commit.id), commit.author.name, commit.author.email,
+            commit.author.time, commit.commit_time,
+            tuple(str(parent_id) for parent_id in commit.parent_ids)
+        )
+
+    def __load_history(self,
+                       repo: pygit2.Repository) -> tp.List['MetadataRowTy']:
+        """Loads the metadata of all commits reachable from HEAD, walking only
+        commits that are missing from the persisted history."""
+        if repo.head_is_unborn:
+            return []
+
+        head = str(repo.revparse_single("HEAD").peel(pygit2.Commit).id)
+        store_path = self.__store_path(repo)
+        store_path.parent.mkdir(parents=True, exist_ok=True)
+        with lock_file(store_path.with_suffix(".lock")):
+            stored_head = ""
+            rows: tp.List[CommitMetadataStore.MetadataRowTy] = []
+            if store_path.exists():
+                try:
+                    with open(store_path, "rb") as store_file:
+                        stored_head, rows = pickle.load(store_file)
+                except (EOFError, pickle.UnpicklingError):
+                    LOG.warning(
+                        f"Ignoring corrupted commit metadata {store_path}."
+                    )
+
+            if stored_head == head:
+                return rows
+
+            walker = repo.walk(head, pygit2.GIT_SORT_NONE)
+            if stored_head and stored_head in repo:
+                walker.hide(stored_head)
+            known_commits = {row[0] for row in rows}
+            rows.extend(
+                self.__metadata_row(commit)
+                for commit in walker
+                if str(commit.id) not in known_commits
+            )
+
+            with atomic_write(store_path) as store_file:
+                pickle.dump((head, rows), store_file, pickle.HIGHEST_PROTOCOL)
+
+        return rows
+
+    def __add_commit(self, repository_id: int, row: 'MetadataRowTy') -> int:
+        key = (self.__repository_names[repository_id], row[0])
+        if key in self.__commit_index:
+            return self.__commit_index[key]
+
+        commit_id = len(self.__rows)
+        self.__commit_index[key] = commit_id
+        author_name_id = self.__author_name_index.setdefault(
+            row[1], len(self.__author_name_index)
+        )
+        author_email_id = self.__author_email_index.setdefault(
+            row[2], len(self.__author_email_index)
+        )
+        self.__rows.append(
+            (repository_id, row, author_name_id, author_email_id)
+        )
+        self.__columns = None
+        return commit_id
+
+    def __resolve(self, commit_repo_pair: CommitRepoPair) -> int:
+        repo = self.__repos.get(commit_repo_pair.repository_name, None)
+        commit = repo.get(commit_repo_pair.commit_hash.hash) if repo else None
+        if not commit:
+            raise LookupError(f"Could not find commit {commit_repo_pair}.")
+
+        return self.__add_commit(
+            self.__repository_names.index(commit_repo_pair.repository_name),
+            self.__metadata_row(commit)
+        )
+
+    def commit_id(self, commit_repo_pair: CommitRepoPair) -> int:
+        """
+        Looks up the dense id of a commit.
+
+        Args:
+            commit_repo_pair: the commit to look up
+
+        Returns:
+            the id of the commit in the metadata columns
+        """
+        commit_id = self.__commit_index.get((
+            commit_repo_pair.repository_name, commit_repo_pair.commit_hash.hash
+        ), None)
+        if commit_id is None:
+            return self.__resolve(commit_repo_pair)
+        return commit_id
+
+    def commit_ids(
+        self, commit_repo_pairs: tp.Iterable[CommitRepoPair]
+    ) -> np.ndarray:
+        """
+        Looks up the dense ids of multiple commits at once.
+
+        Args:
+            commit_repo_pairs: the commits to look up
+
+        Returns:
+            an array with the id of every given commit
+        """
+        return np.fromiter((
+            self.commit_id(commit_repo_pair)
+            for commit_repo_pair in commit_repo_pairs
+        ),
+                           dtype=np.int64)
+
+    def __column(self, name: str) -> np.ndarray:
+        if self.__columns is None:
+            rows = self.__rows
+            self.__columns = {
+                "repository_ids":
+                    np.fromiter((row[0] for row in rows),
+                                dtype=np.int32,
+                                count=len(rows)),
+                "commit_hashes":
+                    np.array([row[1][0] for row in rows], dtype=object),
+                "author_name_ids":
+                    np.fromiter((row[2] for row in rows),
+                                dtype=np.int32,
+                                count=len(rows)),
+                "author_email_ids":
+                    np.fromiter((row[3] for row in rows),
+                                dtype=np.int32,
+                                count=len(rows)),
+                "author_times":
+                    np.fromiter((row[1][3] for row in rows),
+                                dtype=np.int64,
+                                count=len(rows)),
+                "commit_times":
+                    np.fromiter((row[1][4] for row in rows),
+                                dtype=np.int64,
+                                count=len(rows)),
+                "author_names":
+                    np.array(list(self.__author_name_index), dtype=object),
+                "author_emails":
+                    np.array(list(self.__author_email_index), dtype=object),
+            }
+        return self.__columns[name]
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    @property
+    def repository_names(self) -> tp.List[str]:
+        """Names of the repositories, indexed by the repository ids."""
+        return list(self.__repository_names)
+
+    @property
+    def repository_ids(self) -> np.ndarray:
+        """Repository id of every commit."""
+        return self.__column("repository_ids")
+
+    @property
+    def commit_hashes(self) -> np.ndarray:
+        """Full hash of every commit."""
+        return self.__column("commit_hashes")
+
+    @property
+    def author_names(self) -> np.ndarray:
+        """Distinct author names, indexed by the author name ids."""
+        return self.__column("author_names")
+
+    @property
+    def author_name_ids(self) -> np.ndarray:
+        """Author name id of every commit."""
+        return self.__column("author_name_ids")
+
+    @property
+    def author_emails(self) -> np.ndarray:
+        """Distinct author emails, indexed by the author email ids."""
+        return self.__column("author_emails")
+
+    @property
+    def author_email_ids(self) -> np.ndarray:
+        """Author email id of every commit."""
+        return self.__column("author_email_ids")
+
+    @property
+    def author_times(self) -> np.ndarray:
+        """Author timestamp of every commit."""
+        return self.__column("author_times")
+
+    @property
+    def commit_times(self) -> np.ndarray:
+        """Commit timestamp of every commit."""
+        return self.__column("commit_times")
+
+    def parents(self, commit_id: int) -> tp.List[FullCommitHash]:
+        """
+        Looks up the parents of a commit.
+
+        Args:
+            commit_id: id of the commit
+
+        Returns:
+            the hashes of the commit's parents
+        """
+        return [
+            FullCommitHash(parent) for parent in self.__rows[commit_id][1][5]
+        ]
+
+
+__COMMIT_METADATA_STORES: tp.Dict[str, CommitMetadataStore] = {}
+
+
+def get_commit_metadata_store(project_name: str) -> CommitMetadataStore:
+    """
+    Returns the commit metadata store for the repositories of a project.
+
+    Args:
+        project_name: name of the given benchbuild project
+
+    Returns:
+        the commit metadata store of the project
+    """
+    if project_name not in __COMMIT_METADATA_STORES:
+        __COMMIT_METADATA_STORES[project_name] = CommitMetadataStore(
+            get_local_project_gits(project_name)
+        )
+
+    return __COMMIT_METADATA_STORES[project_name]
+
+
 GIT_LOG_MATCHER = re.compile(
     r"\'(?P<hash>.*)\'\n?" + r"( (?P<files>\d*) files? changed)?" +
     r"(, (?P<insertions>\d*) insertions?\(\+\))?" +
@@ -733,62 +1012,90 @@ GIT_DIFF_MATCHER = re.compile(
 )
 
 
-def __calc_code_churn_range_impl(
+def __get_churn_store_path(repo_path: Path, churn_config: ChurnConfig) -> Path:
+    """Location of the persisted churn values of a repository for the file
+    extensions selected by a churn config."""
+    extensions = "*" if churn_config.include_everything else ",".join(
+        churn_config.get_extensions_repr()
+    )
+    store_key = hashlib.sha1(f"{repo_path.resolve()}\0{extensions}".encode()
+                            ).hexdigest()[:16]
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "code_churn" / f"{repo_path.name}-{store_key}.pickle"
+
+
+def __load_churn_store(
+    store_path: Path
+) -> tp.Dict[str, tp.Tuple[int, int, int]]:
+    if not store_path.exists():
+        return {}
+
+    try:
+        with open(store_path, "rb") as store_file:
+            return tp.cast(
+                tp.Dict[str, tp.Tuple[int, int, int]], pickle.load(store_file)
+            )
+    except (EOFError, pickle.UnpicklingError):
+        LOG.warning(f"Ignoring corrupted churn store {store_path}.")
+        return {}
+
+
+def __store_churn_store(
+    store_path: Path, churn_values: tp.Dict[str, tp.Tuple[int, int, int]]
+) -> None:
+    with atomic_write(store_path) as store_file:
+        pickle.dump(churn_values, store_file, pickle.HIGHEST_PROTOCOL)
+
+
+def __get_revisions_in_churn_range(
     repo_path: Path,
-    churn_config: ChurnConfig,
     start_range: tp.Optional[FullCommitHash] = None,
     end_range: tp.Optional[FullCommitHash] = None
-) -> tp.Dict[FullCommitHash, tp.Tuple[int, int, int]]:
+) -> tp.List[str]:
+    """Revisions in `start~..end`, where the range is open if `start` has no
+    parent or is not specified and `end` defaults to HEAD."""
+    repo = pygit2.Repository(str(repo_path))
+    end_commit = repo.revparse_single(end_range.hash if end_range else "HEAD"
+                                     ).peel(pygit2.Commit)
+    walker = repo.walk(end_commit.id, pygit2.GIT_SORT_NONE)
+    if start_range:
+        start_commit = repo.revparse_single(start_range.hash
+                                           ).peel(pygit2.Commit)
+        if start_commit.parent_ids:
+            walker.hide(start_commit.parent_ids[0])
+
+    return [str(commit.id) for commit in walker]
+
+
+def __calc_code_churn_of_commits(
+    repo_path: Path, churn_config: ChurnConfig, revisions: tp.List[str]
+) -> tp.Dict[str, tp.Tuple[int, int, int]]:
     """
-    Calculates all churn values for the commits in the specified range.
-
-    [start..end]. If no range is supplied, the churn values of all commits are
-    calculated.
+    Calculates the churn values of specific commits with a single git call.
 
-    git log --pretty=format:'%H' --date=short --shortstat -- ':*.[enabled_exts]'
-
-    Args:
-        repo_path: path to the git repository
-        churn_config: churn config to customize churn generation
-        start_range: begin churn calculation at start commit
-        end_range: end churn calculation at end commit
+    git log --no-walk --stdin --pretty=format:'%H' --shortstat -l0
+        -- ':*.[enabled_exts]' < revisions
     """
-
-    churn_values: tp.Dict[FullCommitHash, tp.Tuple[int, int, int]] = {}
-    if start_range and start_range == get_initial_commit(repo_path):
-        start_range = None
-
-    if start_range is None and end_range is None:
-        revision_range = None
-    elif start_range is None:
-        revision_range = f"{end_range.hash}"  # type: ignore
-    elif end_range is None:
-        revision_range = f"{start_range.hash}~.."
-    else:
-        revision_range = f"{start_range.hash}~..{end_range.hash}"
-
-    repo_git = git[__get_git_path_arg(repo_path)]
-    log_base_params = ["log", "--pretty=%H"]
-    diff_base_params = ["log", "--pretty=format:'%H'", "--shortstat", "-l0"]
-    if revision_range:
-        log_base_params.append(revision_range)
-        diff_base_params.append(revision_range)
-
+    diff_base_params = [
+        "log", "--no-walk=unsorted", "--stdin", "--pretty=format:'%H'",
+        "--shortstat", "-l0"
+    ]
     if not churn_config.include_everything:
         diff_base_params.append("--")
         # builds a regex to select files that git includes into churn calc
         diff_base_params = diff_base_params + \
                            churn_config.get_extensions_repr('*.')
 
-    stdout = repo_git(diff_base_params)
-    revs = repo_git(log_base_params).strip().split()
+    stdout = (
+        git[__get_git_path_arg(repo_path), diff_base_params] <<
+        "\n".join(revisions) + "\n"
+    )()
 
     # initialize with 0 as otherwise commits without changes would be
     # missing from the churn data
-    for rev in revs:
-        churn_values[FullCommitHash(rev)] = (0, 0, 0)
+    churn_values = {rev: (0, 0, 0) for rev in revisions}
     for match in GIT_LOG_MATCHER.finditer(stdout):
-        commit_hash = FullCommitHash(match.group('hash'))
 
         def value_or_zero(match_result: tp.Any) -> int:
             if match_result is not None:
@@ -798,11 +1105,51 @@ def __calc_code_churn_range_impl(
         files_changed = value_or_zero(match.group('files'))
         insertions = value_or_zero(match.group('insertions'))
         deletions = value_or_zero(match.group('deletions'))
-        churn_values[commit_hash] = (files_changed, insertions, deletions)
+        churn_values[match.group('hash')
+                    ] = (files_changed, insertions, deletions)
 
     return churn_values
 
 
+def __calc_code_churn_range_impl(
+    repo_path: Path,
+    churn_config: ChurnConfig,
+    start_range: tp.Optional[FullCommitHash] = None,
+    end_range: tp.Optional[FullCommitHash] = None
+) -> tp.Dict[FullCommitHash, tp.Tuple[int, int, int]]:
+    """
+    Calculates all churn values for the commits in the specified range.
+
+    [start..end]. If no range is supplied, the churn values of all commits are
+    calculated.
+
+    Churn values are persisted per repository and churn config in the data
+    cache, so git is only invoked for commits that were not seen before.
+
+    Args:
+        repo_path: path to the git repository
+        churn_config: churn config to customize churn generation
+        start_range: begin churn calculation at start commit
+        end_range: end churn calculation at end commit
+    """
+    revs = __get_revisions_in_churn_range(repo_path, start_range, end_range)
+
+    store_path = __get_churn_store_path(repo_path, churn_config)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_file(store_path.with_suffix(".lock")):
+        churn_store = __load_churn_store(store_path)
+        missing_revs = [rev for rev in revs if rev not in churn_store]
+        if missing_revs:
+            churn_store.update(
+                __calc_code_churn_of_commits(
+                    repo_path, churn_config, missing_revs
+                )
+            )
+            __store_churn_store(store_path, churn_store)
+
+    return {FullCommitHash(rev): churn_store[rev] for rev in revs}
+
+
 def calc_code_churn_range(
     repo_path: Path,
     churn_config: tp.Optional[ChurnConfig] = None,
@@ -919,6 +1266,36 @@ def calc_repo_code_churn(
     return calc_code_churn_range(repo_path, churn_config)
 
 
+def calc_project_code_churn(
+    project_name: str,
+    churn_config: tp.Optional[ChurnConfig] = None
+) -> tp.Dict[str, tp.Dict[FullCommitHash, tp.Tuple[int, int, int]]]:
+    """
+    Calculates code churn for all repositories of a project, i.e., the main
+    repository and its submodules, in parallel.
+
+    Args:
+        project_name: name of the project
+        churn_config: churn config to customize churn generation
+
+    Returns:
+        dict from repository name to the churn triples of the repository,
+        where the commit hash points to (files changed, insertions, deletions)
+    """
+    churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    repo_paths = get_local_project_git_paths(project_name)
+    with ThreadPoolExecutor() as executor:
+        churn_futures = {
+            repo_name:
+            executor.submit(calc_repo_code_churn, repo_path, churn_config)
+            for repo_name, repo_path in repo_paths.items()
+        }
+        return {
+            repo_name: churn_future.result()
+            for repo_name, churn_future in churn_futures.items()
+        }
+
+
 def __print_calc_repo_code_churn(
     repo: pygit2.Repository,
     churn_config: tp.Optional[ChurnConfig] = None
@@ -965,10 +1342,45 @@ def __print_calc_repo_code_churn(
             print()
 
 
+# Lines of code of blobs and (per file pattern) trees. Git objects never change
+# for an object id, so the counts can be reused for all revisions that share
+# them.
+_BLOB_LOC_CACHE: tp.Dict[pygit2.Oid, int] = {}
+_TREE_LOC_CACHE: tp.Dict[tp.Tuple[pygit2.Oid, str], int] = {}
+
+
+def __calc_blob_loc(blob: pygit2.Blob) -> int:
+    if (loc := _BLOB_LOC_CACHE.get(blob.id)) is None:
+        lines = blob.data.decode(errors="replace").splitlines()
+        loc = len([line for line in lines if line])
+        _BLOB_LOC_CACHE[blob.id] = loc
+
+    return loc
+
+
+def __calc_tree_loc(tree: pygit2.Tree, file_pattern: tp.Pattern[str]) -> int:
+    cache_key = (tree.id, file_pattern.pattern)
+    if (loc := _TREE_LOC_CACHE.get(cache_key)) is None:
+        loc = 0
+        for entry in tree:
+            if isinstance(entry, pygit2.Tree):
+                loc += __calc_tree_loc(entry, file_pattern)
+            elif isinstance(entry, pygit2.Blob) and \
+                    file_pattern.match(entry.name):
+                loc += __calc_blob_loc(entry)
+        _TREE_LOC_CACHE[cache_key] = loc
+
+    return loc
+
+
 def calc_repo_loc(repo_path: Path, rev_range: str) -> int:
     """
     Calculate the LOC for a repository.
 
+    Line counts are read directly from the git objects and cached per blob and
+    tree, so only files that changed need to be counted again when calculating
+    the LOC for other revisions.
+
     Args:
         repo_path: path to the repository to calculate the LOC for
         rev_range: the revision range to use for LOC calculation
@@ -981,21 +1393,10 @@ def calc_repo_loc(repo_path: Path, rev_range: str) -> int:
         "|".join(churn_config.get_extensions_repr(r"^.*\.", r"$"))
     )
 
-    loc: int = 0
-    with local.cwd(repo_path):
-        files = git(
-            "ls-tree",
-            "-r",
-            "--name-only",
-            rev_range,
-        ).splitlines()
-
-        for file in files:
-            if file_pattern.match(file):
-                lines = git("show", f"{rev_range}:{file}").splitlines()
-                loc += len([line for line in lines if line])
-
-    return loc
+    repo = pygit2.Repository(str(repo_path))
+    return __calc_tree_loc(
+        repo.revparse_single(rev_range).peel(pygit2.Tree), file_pattern
+    )
 
 
 def calc_project_loc(project_name: str, revision: FullCommitHash) -> int:
@@ -1022,6 +1423,197 @@ def calc_project_loc(project_name: str, revision: FullCommitHash) -> int:
     return loc
 
 
+BLAME_LINE_REGEX = re.compile(r"^([0-9a-f]+)\s+(?:.+\s+)?[\d]+\) ?(.*)$")
+
+
+def __get_blame_store_path(repo_path: Path) -> Path:
+    """Location of the persisted per-file blame results of a repository."""
+    store_key = hashlib.sha1(str(repo_path.resolve()).encode()).hexdigest()[:16]
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "file_blame" / f"{repo_path.name}-{store_key}.pickle"
+
+
+_BlameKeyTy = tp.Tuple[str, str, str]
+
+
+class _BlameStore(tp.NamedTuple):
+    """Persisted per-file blame results of a repository."""
+
+    last_changes: tp.Dict[str, tp.Dict[str, str]]
+    """Last commit that changed a file by revision and file path."""
+    blames: tp.Dict[_BlameKeyTy, tp.Tuple[str, ...]]
+    """Blamed commits by blob id, file path, and last change of the file."""
+
+
+def __load_blame_store(store_path: Path) -> _BlameStore:
+    if not store_path.exists():
+        return _BlameStore({}, {})
+
+    try:
+        with open(store_path, "rb") as store_file:
+            last_changes, blames = pickle.load(store_file)
+        if isinstance(last_changes, dict) and isinstance(blames, dict):
+            return _BlameStore(last_changes, blames)
+    except (EOFError, TypeError, ValueError, pickle.UnpicklingError):
+        pass
+
+    LOG.warning(f"Ignoring corrupted or outdated blame store {store_path}.")
+    return _BlameStore({}, {})
+
+
+def __store_blame_store(store_path: Path, blame_store: _BlameStore) -> None:
+    with atomic_write(store_path) as store_file:
+        pickle.dump(tuple(blame_store), store_file, pickle.HIGHEST_PROTOCOL)
+
+
+def __list_blobs(
+    tree: pygit2.Tree,
+    file_pattern: tp.Pattern[str],
+    prefix: str = ""
+) -> tp.Iterator[tp.Tuple[str, str]]:
+    """Blob ids and paths of all files in a tree that match a pattern."""
+    for entry in tree:
+        path = f"{prefix}{entry.name}"
+        if isinstance(entry, pygit2.Tree):
+            yield from __list_blobs(entry, file_pattern, f"{path}/")
+        elif isinstance(entry, pygit2.Blob) and file_pattern.search(path):
+            yield str(entry.id), path
+
+
+def __last_changes_of_files(
+    repo_path: Path, revision: FullCommitHash, file_paths: tp.Set[str]
+) -> tp.Dict[str, str]:
+    """
+    Hashes of the last commits that changed the given files up to a revision.
+
+    All files are looked up in a single pass over the history, which stops as
+    soon as the last change of every file was found.
+    """
+    remaining_paths = set(file_paths)
+    last_changes: tp.Dict[str, str] = {}
+    log_process = git["-C",
+                      str(repo_path), "log", "-z", "--no-renames",
+                      "--name-only", "--format=%x01%H", revision.hash].popen()
+    try:
+        commit = ""
+        pending = b""
+        while remaining_paths and (chunk := log_process.stdout.read1()):
+            tokens = (pending + chunk).split(b"\0")
+            pending = tokens.pop()
+            for token in tokens:
+                if token.startswith(b"\x01"):
+                    commit = token[1:].decode()
+                    continue
+
+                path = token.lstrip(b"\n").decode(errors="surrogateescape")
+                if path in remaining_paths:
+                    remaining_paths.remove(path)
+                    last_changes[path] = commit
+    finally:
+        log_process.kill()
+        log_process.communicate()
+
+    return last_changes
+
+
+def __blame_file(repo_path: Path, revision: FullCommitHash,
+                 file_path: str) -> tp.Tuple[str, ...]:
+    """Hashes of the commits that last changed a non-empty line of a file."""
+    blame_lines: str = git(
+        "-C", str(repo_path), "blame", "-w", "-s", "-l", "--root",
+        revision.hash, "--", file_path
+    )
+
+    commits: tp.Set[str] = set()
+    for line in blame_lines.splitlines():
+        match = BLAME_LINE_REGEX.match(line)
+        if not match:
+            raise AssertionError
+
+        if match.group(2):
+            commits.add(match.group(1))
+    return tuple(sorted(commits))
+
+
+def calc_repo_file_blames(
+    repo_path: Path,
+    revision: FullCommitHash,
+    file_pattern: tp.Pattern[str],
+    max_workers: tp.Optional[int] = None
+) -> tp.Dict[str, tp.FrozenSet[FullCommitHash]]:
+    """
+    Blames all files of a repository revision that match a pattern.
+
+    Blame results are persisted per blob, path, and the last commit that
+    changed the file, as the same content can blame to different commits,
+    e.g., after a revert. The last changes of all files are determined once per
+    revision in a single pass over the history and are persisted as well, so
+    files that did not change between revisions are never blamed again. The
+    remaining files are blamed in parallel.
+
+    Args:
+        repo_path: path to the git repository
+        revision: revision to blame the files at
+        file_pattern: pattern that is searched for in the file paths
+        max_workers: maximum number of concurrent ``git blame`` processes
+
+    Returns:
+        dict from file path to the commits that last changed a non-empty line
+        of that file
+    """
+    repo = pygit2.Repository(str(repo_path))
+    files = list(
+        __list_blobs(repo.get(revision.hash).peel(pygit2.Tree), file_pattern)
+    )
+
+    store_path = __get_blame_store_path(repo_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_file(store_path.with_suffix(".lock")):
+        blame_store = __load_blame_store(store_path)
+
+    last_changes = blame_store.last_changes.get(revision.hash, {})
+    missing_paths = {path for _, path in files if path not in last_changes}
+    if missing_paths:
+        # files that only changed in merges have no last change of their own,
+        # so they are keyed by, and blamed again at, every revision
+        last_changes = {
+            **last_changes,
+            **{path: revision.hash for path in missing_paths},
+            **__last_changes_of_files(repo_path, revision, missing_paths)
+        }
+
+    blame_keys: tp.List[_BlameKeyTy] = [
+        (blob_id, path, last_changes[path]) for blob_id, path in files
+    ]
+    missing_keys = [key for key in blame_keys if key not in blame_store.blames]
+    new_blames: tp.Dict[_BlameKeyTy, tp.Tuple[str, ...]] = {}
+    if missing_keys:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            new_blames = dict(
+                zip(
+                    missing_keys,
+                    executor.map(
+                        lambda key: __blame_file(repo_path, revision, key[1]),
+                        missing_keys
+                    )
+                )
+            )
+
+    if missing_paths or new_blames:
+        with lock_file(store_path.with_suffix(".lock")):
+            blame_store = __load_blame_store(store_path)
+            blame_store.last_changes[revision.hash] = last_changes
+            blame_store.blames.update(new_blames)
+            __store_blame_store(store_path, blame_store)
+
+    return {
+        path:
+        frozenset(FullCommitHash(commit) for commit in blame_store.blames[key])
+        for key, (_, path) in zip(blame_keys, files)
+    }
+
+
 ################################################################################
 # Special git-specific classes
 
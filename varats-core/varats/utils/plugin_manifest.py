@@ -0,0 +1,296 @@
+"""
+Manifests of the plugins provided by a package, e.g., plot generators or
+reports.
+
+A manifest lists the classes that the modules of a plugin package define
+together with the literal values they register under. Manifests are created by
+parsing the module sources, so tools can list all plugins and import only the
+modules of the plugins that are actually used.
+"""
+import ast
+import hashlib
+import importlib
+import logging
+import pickle
+import pkgutil
+import typing as tp
+from pathlib import Path
+from types import ModuleType
+
+from varats.utils.filesystem_util import atomic_write
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+_MANIFEST_VERSION = 1
+
+ValueTy = tp.TypeVar("ValueTy")
+
+
+class PluginEntry(tp.NamedTuple):
+    """A top-level class defined in a module of a plugin package."""
+
+    module_name: str
+    class_name: str
+    base_names: tp.Tuple[str, ...]
+    """Unqualified names of the base classes."""
+    name: tp.Optional[str]
+    """Value of the ``NAME`` class attribute if it is a string literal."""
+    keywords: tp.Dict[str, tp.Optional[str]]
+    """Class keyword arguments, e.g., ``generator_name``, with their values if
+    they are string literals."""
+
+    def load(self) -> tp.Any:
+        """Import the module of the class, which registers the class, and
+        return the class."""
+        return getattr(
+            importlib.import_module(self.module_name), self.class_name
+        )
+
+
+class PluginManifest():
+    """Manifest of the classes defined in the modules of a plugin package."""
+
+    def __init__(self, entries: tp.List[PluginEntry]) -> None:
+        self.__entries = entries
+
+    @property
+    def entries(self) -> tp.List[PluginEntry]:
+        """All classes in the order in which the modules would be discovered
+        by ``pkgutil.walk_packages``."""
+        return self.__entries
+
+    def registrations(self, keyword: str) -> tp.Dict[str, PluginEntry]:
+        """
+        Look up the classes that pass a string literal as a class keyword.
+
+        Args:
+            keyword: name of the class keyword, e.g., ``generator_name``
+
+        Returns:
+            dict from keyword value to the class
+        """
+        registrations: tp.Dict[str, PluginEntry] = {}
+        for entry in self.__entries:
+            if (value := entry.keywords.get(keyword)) is not None:
+                registrations.setdefault(value, entry)
+        return registrations
+
+    def subclasses(self, base_names: tp.Iterable[str]) -> tp.List[PluginEntry]:
+        """
+        Look up the classes that derive from one of the given classes, either
+        directly or via other classes of the manifest.
+
+        Classes are identified by their unqualified names.
+
+        Args:
+            base_names: names of the base classes
+
+        Returns:
+            the derived classes
+        """
+        class_names = set(base_names)
+        subclass_indices: tp.Set[int] = set()
+        found_subclass = True
+        while found_subclass:
+            found_subclass = False
+            for index, entry in enumerate(self.__entries):
+                if index not in subclass_indices and \
+                        class_names.intersection(entry.base_names):
+                    subclass_indices.add(index)
+                    class_names.add(entry.class_name)
+                    found_subclass = True
+
+        return [
+            entry for index, entry in enumerate(self.__entries)
+            if index in subclass_indices
+        ]
+
+
+def __package_modules(package_path: tp.Iterable[str],
+                      prefix: str) -> tp.Iterator[tp.Tuple[str, Path]]:
+    """Walks a package like ``pkgutil.walk_packages`` but without importing
+    sub-packages."""
+    for module_info in pkgutil.iter_modules(package_path, prefix):
+        finder_path = Path(getattr(module_info.module_finder, "path"))
+        module_path = finder_path / module_info.name[len(prefix):]
+        if module_info.ispkg:
+            yield module_info.name, module_path / "__init__.py"
+            yield from __package_modules([str(module_path)],
+                                         f"{module_info.name}.")
+        elif module_path.with_suffix(".py").exists():
+            yield module_info.name, module_path.with_suffix(".py")
+
+
+def __string_literal(node: ast.expr) -> tp.Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def __base_name(node: ast.expr) -> str:
+    """Unqualified name of a base class, e.g., ``Base`` for ``pkg.Base[T]``."""
+    if isinstance(node, ast.Subscript):
+        return __base_name(node.value)
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ""
+
+
+def __module_entries(module_name: str,
+                     module_path: Path) -> tp.List[PluginEntry]:
+    try:
+        module = ast.parse(module_path.read_bytes(), str(module_path))
+    except (OSError, SyntaxError, ValueError) as error:
+        LOG.warning(f"Could not parse plugin module {module_path}: {error}")
+        return []
+
+    entries: tp.List[PluginEntry] = []
+    for class_def in module.body:
+        if not isinstance(class_def, ast.ClassDef):
+            continue
+
+        name: tp.Optional[str] = None
+        for statement in class_def.body:
+            if isinstance(statement, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "NAME"
+                for target in statement.targets
+            ):
+                name = __string_literal(statement.value)
+
+        entries.append(
+            PluginEntry(
+                module_name, class_def.name,
+                tuple(__base_name(base) for base in class_def.bases), name, {
+                    keyword.arg: __string_literal(keyword.value)
+                    for keyword in class_def.keywords
+                    if keyword.arg is not None
+                }
+            )
+        )
+    return entries
+
+
+def __get_manifest_path(package: ModuleType) -> Path:
+    package_paths = "\0".join(package.__path__)
+    package_key = hashlib.sha1(package_paths.encode()).hexdigest()[:16]
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "plugin_manifests" / f"{package.__name__}-{package_key}.pickle"
+
+
+__MANIFESTS: tp.Dict[str, PluginManifest] = {}
+
+
+def load_plugin_manifest(package: ModuleType) -> PluginManifest:
+    """
+    Load the manifest of a plugin package.
+
+    The manifest is cached in the data cache and only recreated if a module of
+    the package was added, removed, or changed.
+
+    Args:
+        package: the plugin package, e.g., ``varats.plots``
+
+    Returns:
+        the manifest of the package
+    """
+    if (manifest := __MANIFESTS.get(package.__name__)) is not None:
+        return manifest
+
+    modules = list(__package_modules(package.__path__, f"{package.__name__}."))
+    fingerprint = []
+    for module_name, module_path in modules:
+        module_stat = module_path.stat()
+        fingerprint.append(
+            (module_name, module_stat.st_mtime_ns, module_stat.st_size)
+        )
+
+    # entries are stored as plain tuples, so manifests of other versions can
+    # always be loaded and recognized as outdated
+    manifest_path = __get_manifest_path(package)
+    entries: tp.Optional[tp.List[PluginEntry]] = None
+    try:
+        with open(manifest_path, "rb") as manifest_file:
+            version, stored_fingerprint, stored_entries = pickle.load(
+                manifest_file
+            )
+        if version == _MANIFEST_VERSION and stored_fingerprint == fingerprint:
+            entries = [PluginEntry(*entry) for entry in stored_entries]
+    except (OSError, EOFError, TypeError, ValueError, pickle.UnpicklingError):
+        pass
+
+    if entries is None:
+        entries = [
+            entry for module_name, module_path in modules
+            for entry in __module_entries(module_name, module_path)
+        ]
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(manifest_path) as manifest_file:
+                pickle.dump((
+                    _MANIFEST_VERSION, fingerprint,
+                    [tuple(entry) for entry in entries]
+                ), manifest_file, pickle.HIGHEST_PROTOCOL)
+        except OSError as error:
+            LOG.debug(f"Could not store plugin manifest: {error}")
+
+    manifest = PluginManifest(entries)
+    __MANIFESTS[package.__name__] = manifest
+    return manifest
+
+
+class LazyRegistry(tp.Mapping[str, ValueTy]):
+    """
+    Read-only view of a plugin registry that imports plugins on first access.
+
+    The keys are the plugins listed in the manifests and the plugins that are
+    already registered. Looking up a plugin imports only its module; if the
+    plugin is not registered afterwards, all plugins are imported.
+
+    Args:
+        registry: the registry the plugins add themselves to on import
+        entries: manifest entries of the plugins by registry key
+        initialize_all: imports all plugins
+        include_key: selects the plugins that are part of the view
+    """
+
+    def __init__(
+        self,
+        registry: tp.Mapping[str, ValueTy],
+        entries: tp.Mapping[str, PluginEntry],
+        initialize_all: tp.Callable[[], None],
+        include_key: tp.Callable[[str], bool] = lambda key: True
+    ) -> None:
+        self.__registry = registry
+        self.__entries = entries
+        self.__initialize_all = initialize_all
+        self.__include_key = include_key
+
+    def __keys(self) -> tp.List[str]:
+        return [
+            key for key in dict.fromkeys([*self.__entries, *self.__registry])
+            if self.__include_key(key)
+        ]
+
+    def __getitem__(self, key: str) -> ValueTy:
+        if not self.__include_key(key):
+            raise KeyError(key)
+
+        if key not in self.__registry:
+            if (entry := self.__entries.get(key)) is not None:
+                entry.load()
+            if key not in self.__registry:
+                self.__initialize_all()
+        return self.__registry[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__keys()
+
+    def __iter__(self) -> tp.Iterator[str]:
+        return iter(self.__keys())
+
+    def __len__(self) -> int:
+        return len(self.__keys())
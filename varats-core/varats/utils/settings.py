@@ -39,6 +39,18 @@ def create_new_varats_config() -> s.Configuration:
                 "desc": "Local data cache to store preprocessed files.",
                 "default": os.getcwd() + "/data_cache",
             },
+            "report_cache_size": {
+                "desc":
+                    "Maximum size in MiB of the parsed reports persisted in "
+                    "the data cache, 0 disables persisting parsed reports.",
+                "default": 1024,
+            },
+            "data_cache_jobs": {
+                "desc":
+                    "Maximum number of worker processes that create missing "
+                    "entries of cached report tables.",
+                "default": 4,
+            },
             "result_dir": {
                 "desc": "Result folder for collected results",
                 "default": os.getcwd() + "/results",
@@ -189,6 +201,29 @@ def create_new_varats_config() -> s.Configuration:
             "default": str(Path.home()),
             "desc": "Location of directory containing workloads for binaries."
         },
+        "repetition_target_precision": {
+            "default": None,
+            "desc":
+                "Repeat measurements until the confidence interval of the mean "
+                "wall-clock time of every workload is within this fraction of "
+                "the mean, e.g., 0.02 for +-2%. If not set, measurements are "
+                "repeated a fixed number of times."
+        },
+        "min_repetitions": {
+            "default": 3,
+            "desc": "Minimal number of repetitions of adaptive measurements."
+        },
+        "max_repetitions": {
+            "default": 30,
+            "desc": "Maximal number of repetitions of adaptive measurements."
+        },
+        "patched_variant_build_slots": {
+            "default": 1,
+            "desc":
+                "Number of patched variants of a project that experiments "
+                "build in parallel, each in its own build directory. The "
+                "build jobs are split between the slots."
+        },
     }
 
     cfg['plots'] = {
@@ -30,6 +30,7 @@ setup(
         "pandas>=1.5.3",
         "plotly>=5.13.1",
         "plumbum>=1.6",
+        "pyarrow>=12.0.0",
         "pygit2>=1.10,<1.14.0",
         "PyGithub>=1.47",
         "pygraphviz>=1.7",
@@ -40,6 +41,7 @@ setup(
         "PyYAML>=6.0",
         "rich>=12.6",
         "scikit-learn>=1.2.2",
+        "scipy>=1.10.0",
         "seaborn>=0.13.0",
         "tabulate>=0.9",
         "varats-core>=13.0.5",
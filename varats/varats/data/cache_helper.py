@@ -1,13 +1,20 @@
 """Utility functions and class to allow easier caching of pandas dataframes and
 other data."""
 import logging
+import multiprocessing as mp
+import os
 import pickle
+import threading
+import time
 import typing as tp
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 
 import networkx as nx
 import pandas as pd
 
+from varats.utils.filesystem_util import lock_file
 from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
@@ -15,11 +22,18 @@ LOG = logging.getLogger(__name__)
 CACHE_ID_COL = 'cache_revision'
 CACHE_TIMESTAMP_COL = 'cache_timestamp'
 
+# Number of part files after which a cached dataframe is compacted into a
+# single file again.
+__MAX_CACHE_PARTS = 16
+
 
 def get_data_file_path(data_id: str, project_name: str) -> Path:
     """
     Compose the identifier and project into a file path that points to the
-    corresponding cache file in the cache directory.
+    corresponding cache in the cache directory.
+
+    Cached dataframes are stored as a folder of parquet files, where each file
+    contains complete cache entries.
 
     Args:
         data_id: identifier or identifier_name of the dataframe
@@ -27,48 +41,181 @@ def get_data_file_path(data_id: str, project_name: str) -> Path:
     """
     return Path(
         str(vara_cfg()["data_cache"])
+    ) / f"{data_id}-{project_name}.parquet"
+
+
+def __get_legacy_data_file_paths(data_id: str,
+                                 project_name: str) -> tp.List[Path]:
+    legacy_file_path = Path(
+        str(vara_cfg()["data_cache"])
     ) / f"{data_id}-{project_name}.csv.gz"
+    return [legacy_file_path, legacy_file_path.with_suffix("")]
 
 
-def load_cached_df_or_none(
+def __get_cache_parts(cache_path: Path) -> tp.List[Path]:
+    return sorted(cache_path.glob("part-*.parquet"))
+
+
+def __write_cache_part(cache_path: Path, dataframe: pd.DataFrame) -> Path:
+    """Atomically add a new part file to a cached dataframe."""
+    cache_path.mkdir(parents=True, exist_ok=True)
+    part_name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+    # files starting with '_' are ignored when the dataset is read
+    tmp_part_path = cache_path / f"_{part_name}"
+    dataframe.to_parquet(tmp_part_path, engine="pyarrow", index=False)
+    os.replace(tmp_part_path, cache_path / part_name)
+    return cache_path / part_name
+
+
+def __replace_cache_parts(cache_path: Path, dataframe: pd.DataFrame) -> None:
+    old_parts = __get_cache_parts(cache_path)
+    __write_cache_part(cache_path, dataframe)
+    for old_part in old_parts:
+        old_part.unlink()
+
+
+def __read_cache_parts(
+    cache_parts: tp.List[Path],
+    columns: tp.Optional[tp.List[str]] = None
+) -> pd.DataFrame:
+    return pd.concat([
+        pd.read_parquet(part, engine="pyarrow", columns=columns)
+        for part in cache_parts
+    ],
+                     ignore_index=True)
+
+
+@contextmanager
+def __locked_cache(
+    data_id: str,
+    project_name: str,
+    data_types: tp.Optional[tp.Dict[str, str]] = None
+) -> tp.Generator[Path, None, None]:
+    """Lock the cache of a dataframe and migrate it to the current format if
+    necessary."""
+    cache_path = get_data_file_path(data_id, project_name)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_file(cache_path.with_suffix(".lock")):
+        if not cache_path.exists():
+            __migrate_legacy_cache(data_id, project_name, data_types or {})
+
+        yield cache_path
+
+
+def __migrate_legacy_cache(
     data_id: str, project_name: str, data_types: tp.Dict[str, str]
+) -> None:
+    """Convert an existing csv cache file to the parquet cache format."""
+    for legacy_file_path in __get_legacy_data_file_paths(data_id, project_name):
+        if legacy_file_path.exists():
+            LOG.info(f"Migrating cache file {legacy_file_path} to parquet.")
+            # cache ids and timestamps of new entries are strings, so they must
+            # not be inferred as numbers, which parquet cannot combine later
+            legacy_df = pd.read_csv(
+                str(legacy_file_path),
+                index_col=0,
+                compression='infer',
+                dtype={
+                    **data_types, CACHE_ID_COL: str,
+                    CACHE_TIMESTAMP_COL: str
+                }
+            )
+            __replace_cache_parts(
+                get_data_file_path(data_id, project_name), legacy_df
+            )
+            legacy_file_path.unlink()
+            return
+
+
+def load_cached_df_or_none(
+    data_id: str,
+    project_name: str,
+    data_types: tp.Dict[str, str],
+    columns: tp.Optional[tp.List[str]] = None
 ) -> tp.Optional[pd.DataFrame]:
     """
     Load cached dataframe from disk, otherwise return None.
 
+    Caches in the old csv format are transparently migrated.
+
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
         data_types: dict of columns and types to pass to the dataframe loading
+        columns: only load these columns; defaults to all columns
     """
-
-    file_path = get_data_file_path(data_id, project_name)
-    if not file_path.exists():
-        # fall back to uncompressed file if present for seamless migration
-        # to cache file compression
-        if Path(str(file_path)[:-3]).exists():
-            file_path = Path(str(file_path)[:-3])
-        else:
+    with __locked_cache(data_id, project_name, data_types) as cache_path:
+        cache_parts = __get_cache_parts(cache_path)
+        if not cache_parts:
             return None
 
-    return pd.read_csv(
-        str(file_path), index_col=0, compression='infer', dtype=data_types
-    )
+        cached_df = __read_cache_parts(cache_parts, columns)
+
+    return cached_df.astype({
+        column: data_type
+        for column, data_type in data_types.items()
+        if column in cached_df.columns
+    })
 
 
 def cache_dataframe(
     data_id: str, project_name: str, dataframe: pd.DataFrame
 ) -> None:
     """
-    Cache a dataframe by persisting it to disk.
+    Cache a dataframe by persisting it to disk, replacing the previously cached
+    dataframe. The index of the dataframe is not persisted.
 
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
         dataframe: pandas dataframe to store
     """
-    file_path = get_data_file_path(data_id, project_name)
-    dataframe.to_csv(str(file_path), compression='infer')
+    with __locked_cache(data_id, project_name) as cache_path:
+        __replace_cache_parts(cache_path, dataframe)
+
+
+def update_cached_dataframe(
+    data_id: str, project_name: str, new_entries: pd.DataFrame,
+    removed_entries: tp.Collection[str]
+) -> None:
+    """
+    Update the entries of a cached dataframe, only rewriting the files that
+    contain changed entries.
+
+    Entries are identified by their ``cache_revision`` column. All rows of
+    entries that are present in ``new_entries`` or ``removed_entries`` are
+    removed from the cache before the new entries are added.
+
+    Args:
+        data_id: identifier or identifier_name of the dataframe
+        project_name: name of the project
+        new_entries: rows of new or changed entries
+        removed_entries: ids of entries to remove
+    """
+    outdated_entries = set(removed_entries)
+    if not new_entries.empty:
+        outdated_entries.update(new_entries[CACHE_ID_COL])
+
+    with __locked_cache(data_id, project_name) as cache_path:
+        for part in __get_cache_parts(cache_path):
+            part_ids = pd.read_parquet(
+                part, engine="pyarrow", columns=[CACHE_ID_COL]
+            )[CACHE_ID_COL]
+            if not part_ids.isin(outdated_entries).any():
+                continue
+
+            part_df = pd.read_parquet(part, engine="pyarrow")
+            part_df = part_df[~part_df[CACHE_ID_COL].isin(outdated_entries)]
+            if not part_df.empty:
+                __write_cache_part(cache_path, part_df)
+            part.unlink()
+
+        if not new_entries.empty:
+            __write_cache_part(cache_path, new_entries)
+
+        cache_parts = __get_cache_parts(cache_path)
+        if len(cache_parts) > __MAX_CACHE_PARTS:
+            __replace_cache_parts(cache_path, __read_cache_parts(cache_parts))
 
 
 InDataTy = tp.TypeVar("InDataTy")
@@ -85,16 +232,71 @@ def __create_cache_entry(
     return new_df
 
 
+# Entry creation function for worker processes, which inherit it when they
+# are forked, as entry creation functions are usually not picklable closures.
+__WORKER_CREATE_CACHE_ENTRY_DATA: tp.Optional[tp.Callable[[tp.Any],
+                                                          tp.Tuple[pd.DataFrame,
+                                                                   str,
+                                                                   str]]] = None
+
+# Worker processes are replaced after creating this many entries to release
+# memory, e.g., of reports cached in the data manager.
+__MAX_ENTRIES_PER_WORKER = 32
+
+
+def __create_cache_entry_in_worker(data: tp.Any) -> pd.DataFrame:
+    assert __WORKER_CREATE_CACHE_ENTRY_DATA is not None
+    return __create_cache_entry(__WORKER_CREATE_CACHE_ENTRY_DATA, data)
+
+
+def __create_cache_entries(
+    create_cache_entry_data: tp.Callable[[InDataTy], tp.Tuple[pd.DataFrame, str,
+                                                              str]],
+    data_entries: tp.List[InDataTy], jobs: tp.Optional[int]
+) -> tp.Iterator[tp.Tuple[InDataTy, pd.DataFrame]]:
+    """Create the cache entries for the given data items, in parallel worker
+    processes if more than one job is requested."""
+    if jobs is None:
+        jobs = int(vara_cfg()["data_cache_jobs"])
+    jobs = min(jobs, len(data_entries))
+
+    # Processes that are workers themselves, e.g., of parallel artefact
+    # generation, create entries sequentially so that the number of processes
+    # stays bounded, and forking is only safe without other running threads.
+    if jobs <= 1 or mp.parent_process() is not None or \
+            threading.active_count() > 1:
+        for data_entry in data_entries:
+            yield data_entry, __create_cache_entry(
+                create_cache_entry_data, data_entry
+            )
+        return
+
+    global __WORKER_CREATE_CACHE_ENTRY_DATA  # pylint: disable=global-statement
+    __WORKER_CREATE_CACHE_ENTRY_DATA = create_cache_entry_data
+    try:
+        with mp.get_context("fork").Pool(
+            jobs, maxtasksperchild=__MAX_ENTRIES_PER_WORKER
+        ) as process_pool:
+            yield from zip(
+                data_entries,
+                process_pool.imap(__create_cache_entry_in_worker, data_entries)
+            )
+    finally:
+        __WORKER_CREATE_CACHE_ENTRY_DATA = None
+
+
 def build_cached_report_table(
-    data_id: str, project_name: str, data_to_load: tp.List[InDataTy],
-    data_to_drop: tp.List[InDataTy], create_empty_df: tp.Callable[[],
-                                                                  pd.DataFrame],
+    data_id: str,
+    project_name: str,
+    data_to_load: tp.List[InDataTy],
+    data_to_drop: tp.List[InDataTy],
+    create_empty_df: tp.Callable[[], pd.DataFrame],
     create_cache_entry_data: tp.Callable[[InDataTy], tp.Tuple[pd.DataFrame, str,
                                                               str]],
-    get_entry_id: tp.Callable[[InDataTy],
-                              str], get_entry_timestamp: tp.Callable[[InDataTy],
-                                                                     str],
-    is_newer_timestamp: tp.Callable[[str, str], bool]
+    get_entry_id: tp.Callable[[InDataTy], str],
+    get_entry_timestamp: tp.Callable[[InDataTy], str],
+    is_newer_timestamp: tp.Callable[[str, str], bool],
+    jobs: tp.Optional[int] = 1
 ) -> pd.DataFrame:
     """
     Build up an automatically cached dataframe.
@@ -111,6 +313,8 @@ def build_cached_report_table(
                              to determine which of two data items is newer
         is_newer_timestamp: checks whether one data item is newer than another
                             based on their timestamps
+        jobs: number of worker processes used to create new entries;
+              ``None`` uses the ``data_cache_jobs`` setting
     """
 
     # mypy needs this
@@ -124,16 +328,22 @@ def build_cached_report_table(
     else:
         cached_df = optional_cached_df
 
+    # maps entry ids to the timestamp of their first cached row
+    cached_timestamps: tp.Dict[str, str] = dict(
+        reversed(
+            list(zip(cached_df[CACHE_ID_COL], cached_df[CACHE_TIMESTAMP_COL]))
+        )
+    )
+
     def is_missing_file(report_file: InDataTy) -> bool:
-        return not (cached_df[CACHE_ID_COL] == get_entry_id(report_file)).any()
+        return get_entry_id(report_file) not in cached_timestamps
 
     def is_newer_file(report_file: InDataTy) -> bool:
-        cached_entry = cached_df[cached_df[CACHE_ID_COL] ==
-                                 get_entry_id(report_file)][CACHE_TIMESTAMP_COL]
+        cached_timestamp = cached_timestamps.get(get_entry_id(report_file))
 
-        if len(cached_entry) > 0:
+        if cached_timestamp is not None:
             return is_newer_timestamp(
-                get_entry_timestamp(report_file), cached_entry.iloc[0]
+                get_entry_timestamp(report_file), cached_timestamp
             )
         # We found no existing entry, so it will never be considered for
         # updating and does not need to be deleted.
@@ -150,40 +360,41 @@ def build_cached_report_table(
     ]
 
     new_data_frames = []
-    for num, data_entry in enumerate(missing_entries):
-        LOG.info(
-            f"Creating missing entry ({(num + 1)}/"
-            f"{len(missing_entries)}): {data_entry}"
-        )
-        new_data_frames.append(
-            __create_cache_entry(create_cache_entry_data, data_entry)
-        )
-
-    new_df = pd.concat([cached_df] + new_data_frames,
-                       ignore_index=True,
-                       sort=False)
-
-    new_df.set_index(CACHE_ID_COL, inplace=True)
-    for num, data_entry in enumerate(updated_entries):
-        LOG.info(
-            f"Updating outdated entry "
-            f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
-        )
-        updated_entry = __create_cache_entry(
-            create_cache_entry_data, data_entry
+    for num, (data_entry, new_data_frame) in enumerate(
+        __create_cache_entries(
+            create_cache_entry_data, missing_entries + updated_entries, jobs
         )
-        updated_entry.set_index(CACHE_ID_COL, inplace=True)
-        new_df.update(updated_entry)
-    new_df.reset_index(inplace=True)
+    ):
+        if num < len(missing_entries):
+            LOG.info(
+                f"Created missing entry ({(num + 1)}/"
+                f"{len(missing_entries)}): {data_entry}"
+            )
+        else:
+            LOG.info(
+                f"Updated outdated entry "
+                f"({(num + 1 - len(missing_entries))}/"
+                f"{len(updated_entries)}): {data_entry}"
+            )
+        new_data_frames.append(new_data_frame)
 
     if len(failed_entries) > 0:
         LOG.info(f"Dropping {len(failed_entries)} entries")
-        new_df.drop(
-            new_df[new_df[CACHE_ID_COL].isin(failed_entries)].index,
-            inplace=True
+
+    new_entries_df = pd.concat(new_data_frames, ignore_index=True, sort=False
+                              ) if new_data_frames else cached_df.iloc[0:0]
+    if new_data_frames or failed_entries:
+        update_cached_dataframe(
+            data_id, project_name, new_entries_df, failed_entries
         )
 
-    cache_dataframe(data_id, project_name, new_df)
+    outdated_entries = set(failed_entries).union(new_entries_df[CACHE_ID_COL])
+    new_df = pd.concat([
+        cached_df[~cached_df[CACHE_ID_COL].isin(outdated_entries)],
+        new_entries_df
+    ],
+                       ignore_index=True,
+                       sort=False)
 
     return tp.cast(
         pd.DataFrame, new_df.loc[:, [
@@ -9,7 +9,10 @@ like in jupyter notebooks, where we sometimes re-execute triggers a file load.
 """
 
 import hashlib
+import inspect
+import logging
 import os
+import pickle
 import typing as tp
 from functools import partial
 from multiprocessing import Pool
@@ -19,6 +22,10 @@ from threading import Lock
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
 from varats.report.report import BaseReport, ReportFilepath
+from varats.utils.filesystem_util import atomic_write, is_racily_modified
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
 
 LoadableTy = tp.TypeVar('LoadableTy', bound=BaseReport)
 PathLikeTy = tp.TypeVar('PathLikeTy', Path, ReportFilepath)
@@ -43,6 +50,157 @@ def sha256_checksum(file_path: Path, block_size: int = 65536) -> str:
     return sha256.hexdigest()
 
 
+def report_cache_key(file_path: Path, report_type: tp.Type[BaseReport]) -> str:
+    """
+    Compute the key under which a parsed report is cached.
+
+    The key changes when the file, identified by its path, size, and
+    modification time, or the implementation of the report type changes.
+
+    Args:
+        file_path: path to the report file
+        report_type: type of the report class
+
+    Returns:
+        the cache key for the parsed report
+    """
+    file_stat = file_path.stat()
+    try:
+        type_stat = os.stat(inspect.getfile(report_type))
+        type_fingerprint = (type_stat.st_size, type_stat.st_mtime_ns)
+    except (OSError, TypeError):
+        type_fingerprint = (0, 0)
+
+    key = (
+        str(file_path.resolve()), file_stat.st_size, file_stat.st_mtime_ns,
+        f"{report_type.__module__}.{report_type.__qualname__}",
+        report_type.REPORT_VERSION, type_fingerprint
+    )
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+
+class ParsedReportCache():
+    """
+    Size-bounded cache of parsed reports that is persisted in the data cache
+    and shared between processes.
+
+    When the cache grows larger than its maximum size, the least recently used
+    reports are evicted.
+
+    Args:
+        cache_dir: directory to store the parsed reports in
+        max_size: maximum size of the cache in bytes
+    """
+
+    def __init__(self, cache_dir: Path, max_size: int) -> None:
+        self.__cache_dir = cache_dir
+        self.__max_size = max_size
+        self.__estimated_size: tp.Optional[int] = None
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.__cache_dir
+
+    def __entry_path(self, key: str) -> Path:
+        return self.__cache_dir / f"{key}.pickle"
+
+    def load(self, key: str) -> tp.Optional[tp.Any]:
+        """
+        Load a parsed report from the cache.
+
+        Args:
+            key: cache key of the report
+
+        Returns:
+            the parsed report or ``None`` if it is not cached
+        """
+        entry_path = self.__entry_path(key)
+        try:
+            with open(entry_path, "rb") as entry_file:
+                data = pickle.load(entry_file)
+            # mark the entry as recently used
+            os.utime(entry_path)
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            LOG.debug(f"Dropping unreadable cache entry {entry_path}.")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+    def store(self, key: str, data: tp.Any) -> None:
+        """
+        Persist a parsed report in the cache.
+
+        Args:
+            key: cache key of the report
+            data: the parsed report
+        """
+        try:
+            pickled_data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-except
+            LOG.debug(f"Could not pickle {type(data).__name__}, not caching.")
+            return
+
+        if len(pickled_data) > self.__max_size:
+            return
+
+        self.__cache_dir.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.__entry_path(key)) as entry_file:
+            entry_file.write(pickled_data)
+
+        if self.__estimated_size is not None:
+            self.__estimated_size += len(pickled_data)
+        if self.__estimated_size is None or \
+                self.__estimated_size > self.__max_size:
+            self.__evict()
+
+    def __evict(self) -> None:
+        """Remove least recently used entries until the cache fits into its
+        maximum size."""
+        entries: tp.List[tp.Tuple[int, int, Path]] = []
+        for entry_path in self.__cache_dir.glob("*.pickle"):
+            try:
+                entry_stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append(
+                (entry_stat.st_mtime_ns, entry_stat.st_size, entry_path)
+            )
+
+        total_size = sum(entry[1] for entry in entries)
+        for _, entry_size, entry_path in sorted(entries):
+            if total_size <= self.__max_size:
+                break
+
+            entry_path.unlink(missing_ok=True)
+            total_size -= entry_size
+
+        self.__estimated_size = total_size
+
+
+__PARSED_REPORT_CACHES: tp.Dict[tp.Tuple[Path, int], ParsedReportCache] = {}
+
+
+def get_parsed_report_cache() -> tp.Optional[ParsedReportCache]:
+    """
+    Returns the parsed report cache of the current data cache.
+
+    Returns:
+        the parsed report cache or ``None`` if persisting reports is disabled
+    """
+    max_size = int(vara_cfg()["report_cache_size"]) * 1024 * 1024
+    if max_size <= 0:
+        return None
+
+    cache_dir = Path(str(vara_cfg()["data_cache"])) / "parsed_reports"
+    if (cache_dir, max_size) not in __PARSED_REPORT_CACHES:
+        __PARSED_REPORT_CACHES[(cache_dir, max_size)
+                              ] = ParsedReportCache(cache_dir, max_size)
+
+    return __PARSED_REPORT_CACHES[(cache_dir, max_size)]
+
+
 class FileBlob(tp.Generic[LoadableTy]):
     """
     A FileBlob is a keyed data blob for everything that is loadable from a file
@@ -120,7 +278,13 @@ class DataManager():
     ) -> LoadableTy:
         # pylint: disable=invalid-name
         """Load a DataClass of type <DataClassTy> from a file."""
-        key = sha256_checksum(file_path)
+        if is_racily_modified(file_path):
+            # the file could change again without changing its cache key
+            report = DataClassTy(file_path)
+            self.loader_lock.acquire()  # pylint: disable=consider-using-with
+            return report
+
+        key = report_cache_key(file_path, DataClassTy)
 
         self.loader_lock.acquire()  # pylint: disable=consider-using-with
         if key in self.file_map:
@@ -128,10 +292,17 @@ class DataManager():
 
         self.loader_lock.release()
 
-        try:
-            new_blob = FileBlob(key, file_path, DataClassTy(file_path))
-        except Exception as e:
-            raise e
+        report_cache = get_parsed_report_cache(
+        ) if DataClassTy.PERSISTABLE else None
+        cached_report = report_cache.load(key) if report_cache else None
+        if isinstance(cached_report, DataClassTy):
+            report = cached_report
+        else:
+            report = DataClassTy(file_path)
+            if report_cache:
+                report_cache.store(key, report)
+
+        new_blob = FileBlob(key, file_path, report)
 
         self.loader_lock.acquire()  # pylint: disable=consider-using-with
         # unlocking in the happy path is performed by the loading function
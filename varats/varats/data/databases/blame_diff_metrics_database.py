@@ -36,7 +36,7 @@ from varats.revision.revisions import (
 from varats.utils.git_util import (
     ChurnConfig,
     calc_code_churn,
-    create_commit_lookup_helper,
+    get_commit_metadata_store,
     ShortCommitHash,
     FullCommitHash,
 )
@@ -301,7 +301,7 @@ class BlameDiffMetricsDatabase(
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
         repo = get_local_project_git(project_name)
-        commit_lookup = create_commit_lookup_helper(project_name)
+        commit_metadata = get_commit_metadata_store(project_name)
 
         def create_dataframe_layout() -> pd.DataFrame:
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
@@ -356,7 +356,7 @@ class BlameDiffMetricsDatabase(
                         count_interacting_commits(diff_between_head_pred),
                     'num_interacting_authors':
                         count_interacting_authors(
-                            diff_between_head_pred, commit_lookup
+                            diff_between_head_pred, commit_metadata
                         ),
                     "ci_degree_mean":
                         weighted_avg(
@@ -365,13 +365,13 @@ class BlameDiffMetricsDatabase(
                     "author_mean":
                         weighted_avg(
                             generate_author_degree_tuples(
-                                diff_between_head_pred, commit_lookup
+                                diff_between_head_pred, commit_metadata
                             )
                         ),
                     "avg_time_mean":
                         weighted_avg(
                             generate_avg_time_distribution_tuples(
-                                diff_between_head_pred, commit_lookup, 1
+                                diff_between_head_pred, commit_metadata, 1
                             )
                         ),
                     "ci_degree_max":
@@ -381,13 +381,13 @@ class BlameDiffMetricsDatabase(
                     "author_max":
                         combine_max(
                             generate_author_degree_tuples(
-                                diff_between_head_pred, commit_lookup
+                                diff_between_head_pred, commit_metadata
                             )
                         ),
                     "avg_time_max":
                         combine_max(
                             generate_max_time_distribution_tuples(
-                                diff_between_head_pred, commit_lookup, 1
+                                diff_between_head_pred, commit_metadata, 1
                             )
                         ),
                     'year':
@@ -25,7 +25,7 @@ from varats.revision.revisions import (
     get_failed_revisions_files,
     get_processed_revisions_files,
 )
-from varats.utils.git_util import create_commit_lookup_helper
+from varats.utils.git_util import get_commit_metadata_store
 
 MAX_TIME_BUCKET_SIZE = 1
 AVG_TIME_BUCKET_SIZE = 1
@@ -88,7 +88,7 @@ class BlameInteractionDegreeDatabase(
         cls, project_name: str, commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
-        commit_lookup = create_commit_lookup_helper(project_name)
+        commit_metadata = get_commit_metadata_store(project_name)
 
         def create_dataframe_layout() -> pd.DataFrame:
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
@@ -116,7 +116,7 @@ class BlameInteractionDegreeDatabase(
             total_amounts_of_all_libs = calc_total_amounts()
 
             list_of_author_degree_occurrences = generate_author_degree_tuples(
-                report, commit_lookup
+                report, commit_metadata
             )
             author_degrees, author_amounts = _split_tuple_values_in_lists_tuple(
                 list_of_author_degree_occurrences
@@ -124,14 +124,14 @@ class BlameInteractionDegreeDatabase(
             author_total = sum(author_amounts)
 
             list_of_max_time_deltas = generate_max_time_distribution_tuples(
-                report, commit_lookup, MAX_TIME_BUCKET_SIZE
+                report, commit_metadata, MAX_TIME_BUCKET_SIZE
             )
             (max_time_buckets, max_time_amounts
             ) = _split_tuple_values_in_lists_tuple(list_of_max_time_deltas)
             total_max_time_amounts = sum(max_time_amounts)
 
             list_of_avg_time_deltas = generate_avg_time_distribution_tuples(
-                report, commit_lookup, AVG_TIME_BUCKET_SIZE
+                report, commit_metadata, AVG_TIME_BUCKET_SIZE
             )
             (avg_time_buckets, avg_time_amounts
             ) = _split_tuple_values_in_lists_tuple(list_of_avg_time_deltas)
@@ -244,11 +244,16 @@ class BlameInteractionDegreeDatabase(
         # cls.CACHE_ID is set by superclass
         # pylint: disable=E1101
         data_frame = build_cached_report_table(
-            cls.CACHE_ID, project_name, report_files, failed_report_files,
-            create_dataframe_layout, create_data_frame_for_report,
+            cls.CACHE_ID,
+            project_name,
+            report_files,
+            failed_report_files,
+            create_dataframe_layout,
+            create_data_frame_for_report,
             lambda path: path.report_filename.commit_hash.hash,
             lambda path: str(path.stat().st_mtime_ns),
-            lambda a, b: int(a) > int(b)
+            lambda a, b: int(a) > int(b),
+            jobs=None
         )
 
         return data_frame
@@ -1,6 +1,7 @@
 """Module for the base Database class."""
 import abc
 import typing as tp
+from contextlib import contextmanager
 
 import pandas as pd
 from pygtrie import CharTrie
@@ -12,6 +13,31 @@ from varats.utils.git_util import ShortCommitHash
 
 AvailableColumns = tp.TypeVar("AvailableColumns")
 
+_SHARED_DATAFRAMES: tp.Optional[tp.Dict[tp.Tuple[tp.Any, ...],
+                                        pd.DataFrame]] = None
+
+
+@contextmanager
+def shared_databases() -> tp.Iterator[None]:
+    """
+    Context in which the dataframes loaded by an :class:`EvaluationDatabase`
+    are kept in memory and shared between all users that request the same data
+    with the same commit map and case study.
+
+    Combine this with :func:`~varats.mapping.commit_map.shared_commit_maps`,
+    as dataframes are only shared for identical commit map objects.
+    """
+    global _SHARED_DATAFRAMES  # pylint: disable=global-statement
+    if _SHARED_DATAFRAMES is not None:
+        yield
+        return
+
+    _SHARED_DATAFRAMES = {}
+    try:
+        yield
+    finally:
+        _SHARED_DATAFRAMES = None
+
 
 class EvaluationDatabase(abc.ABC):
     """
@@ -61,12 +87,42 @@ class EvaluationDatabase(abc.ABC):
             a pandas dataframe with all the cached data
         """
 
+    @classmethod
+    def __load_shared_dataframe(
+        cls, project_name: str, commit_map: CommitMap,
+        case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
+    ) -> pd.DataFrame:
+        if _SHARED_DATAFRAMES is None:
+            return cls._load_dataframe(
+                project_name, commit_map, case_study, **kwargs
+            )
+
+        key = (
+            cls, project_name, commit_map, case_study,
+            tuple(sorted(kwargs.items()))
+        )
+        try:
+            data = _SHARED_DATAFRAMES.get(key)
+        except TypeError:
+            # unhashable arguments, the data cannot be shared
+            return cls._load_dataframe(
+                project_name, commit_map, case_study, **kwargs
+            )
+
+        if data is None:
+            data = cls._load_dataframe(
+                project_name, commit_map, case_study, **kwargs
+            )
+            _SHARED_DATAFRAMES[key] = data
+        # users modify the returned dataframe
+        return data.copy()
+
     @classmethod
     def __get_data_for_case_study(
         cls, project_name: str, columns: tp.List[str], commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
-        data: pd.DataFrame = cls._load_dataframe(
+        data = cls.__load_shared_dataframe(
             project_name, commit_map, case_study, **kwargs
         )
 
@@ -1,9 +1,12 @@
 """Shared data aggregation function for analyzing feature performance."""
 import abc
 import logging
+import os
 import traceback
 import typing as tp
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -11,6 +14,7 @@ from cliffs_delta import cliffs_delta  # type: ignore
 from scipy.stats import ttest_ind
 
 import varats.experiments.vara.feature_perf_precision as fpp
+from varats.data.data_manager import report_cache_key
 from varats.data.metrics import ConfusionMatrix
 from varats.data.reports.performance_influence_trace_report import (
     PerfInfluenceTraceReport,
@@ -28,8 +32,10 @@ from varats.report.tef_report import (
     TraceEvent,
     TraceEventType,
     TEFReportAggregate,
+    trace_event_type_id,
 )
 from varats.revision.revisions import get_processed_revisions_files
+from varats.utils.filesystem_util import is_racily_modified
 from varats.utils.git_util import FullCommitHash
 
 LOG = logging.getLogger(__name__)
@@ -43,8 +49,9 @@ def get_interactions_from_fr_string(interactions: str, sep: str = ",") -> str:
     )
     interactions_list = interactions.split(sep)
 
-    # Features cannot interact with itself, so remove duplicates
-    interactions_list = list(set(interactions_list))
+    # Features cannot interact with itself, so remove duplicates, sorting
+    # ensures that one interaction is always represented by the same string
+    interactions_list = sorted(set(interactions_list))
 
     # Ignore interactions with base, but do not remove base if it's the only
     # feature
@@ -60,81 +67,103 @@ def get_feature_performance_from_tef_report(
     tef_report: TEFReport,
 ) -> tp.Dict[str, int]:
     """Extract feature performance from a TEFReport."""
-    open_events: tp.List[TraceEvent] = []
-
-    feature_performances: tp.Dict[str, int] = {}
-
-    def get_matching_event(
-        open_events: tp.List[TraceEvent], closing_event: TraceEvent
-    ) -> tp.Optional[TraceEvent]:
-        for event in open_events:
-            if (
-                event.uuid == closing_event.uuid and
-                event.pid == closing_event.pid and
-                event.tid == closing_event.tid
-            ):
-                open_events.remove(event)
-                return event
+    feature_performances: tp.Dict[str, int] = defaultdict(int)
+
+    if "Feature" not in tef_report.category_mapper:
+        return {}
+
+    columns = tef_report.event_columns
+    begin_type_id = trace_event_type_id(TraceEventType.DURATION_EVENT_BEGIN)
+    end_type_id = trace_event_type_id(TraceEventType.DURATION_EVENT_END)
+    feature_events = np.flatnonzero(
+        (columns.category_id == tef_report.category_mapper.name_id("Feature")) &
+        ((columns.event_type == begin_type_id) |
+         (columns.event_type == end_type_id))
+    )
 
-        LOG.debug(
-            f"Could not find matching start for Event {repr(closing_event)}."
-        )
+    # Open events are identified by their position in the trace, events
+    # are matched with the most recently opened event with the same
+    # (uuid, pid, tid) key.
+    open_events: tp.Dict[tp.Tuple[int, int, int], tp.List[int]] = {}
+    open_event_names: tp.Dict[int, int] = {}
+    open_name_counts: tp.Dict[int, int] = defaultdict(int)
+    open_names: tp.FrozenSet[int] = frozenset()
+
+    interaction_strings: tp.Dict[tp.FrozenSet[int], str] = {}
+
+    def get_interaction_string(name_ids: tp.FrozenSet[int]) -> str:
+        if (interaction_string := interaction_strings.get(name_ids)) is None:
+            interaction_string = get_interactions_from_fr_string(
+                ",".join(
+                    tef_report.name_id_mapper.infer_name(name_id)
+                    for name_id in name_ids
+                )
+            )
+            interaction_strings[name_ids] = interaction_string
 
-        return None
+        return interaction_string
+
+    def get_trace_event(event_idx: int) -> TraceEvent:
+        return TraceEvent.from_columns(
+            columns, event_idx, tef_report.name_id_mapper,
+            tef_report.category_mapper
+        )
 
     found_missing_open_event = False
-    for trace_event in tef_report.trace_events:
-        if trace_event.category == "Feature":
-            if trace_event.event_type == TraceEventType.DURATION_EVENT_BEGIN:
-                # insert event at the top of the list
-                open_events.insert(0, trace_event)
-            elif trace_event.event_type == TraceEventType.DURATION_EVENT_END:
-                opening_event = get_matching_event(open_events, trace_event)
-                if not opening_event:
-                    found_missing_open_event = True
-                    continue
+    for event_idx, event_type, name_id, timestamp, uuid, pid, tid in zip(
+        feature_events.tolist(), columns.event_type[feature_events].tolist(),
+        columns.name_id[feature_events].tolist(),
+        columns.timestamp[feature_events].tolist(),
+        columns.uuid[feature_events].tolist(),
+        columns.pid[feature_events].tolist(),
+        columns.tid[feature_events].tolist()
+    ):
+        event_key = (uuid, pid, tid)
+        if event_type == begin_type_id:
+            open_events.setdefault(event_key, []).append(event_idx)
+            open_event_names[event_idx] = name_id
+            open_name_counts[name_id] += 1
+            if open_name_counts[name_id] == 1:
+                open_names = open_names | {name_id}
+            continue
 
-                end_timestamp = trace_event.timestamp
-                begin_timestamp = opening_event.timestamp
-
-                # Subtract feature duration from parent duration such that
-                # it is not counted twice, similar to behavior in
-                # Performance-Influence models.
-                interactions = [event.name for event in open_events]
-                if open_events:
-                    # Parent is equivalent to interaction of all open
-                    # events.
-                    interaction_string = get_interactions_from_fr_string(
-                        ",".join(interactions)
-                    )
-                    if interaction_string in feature_performances:
-                        feature_performances[interaction_string] -= (
-                            end_timestamp - begin_timestamp
-                        )
-                    else:
-                        feature_performances[interaction_string] = -(
-                            end_timestamp - begin_timestamp
-                        )
-
-                interaction_string = get_interactions_from_fr_string(
-                    ",".join(interactions + [trace_event.name])
-                )
+        matching_events = open_events.get(event_key)
+        if not matching_events:
+            LOG.debug(
+                "Could not find matching start for Event "
+                f"{repr(get_trace_event(event_idx))}."
+            )
+            found_missing_open_event = True
+            continue
 
-                current_performance = feature_performances.get(
-                    interaction_string, 0
-                )
-                feature_performances[interaction_string] = (
-                    current_performance + end_timestamp - begin_timestamp
-                )
+        opening_event_idx = matching_events.pop()
+        opening_name_id = open_event_names.pop(opening_event_idx)
+        open_name_counts[opening_name_id] -= 1
+        if open_name_counts[opening_name_id] == 0:
+            open_names = open_names - {opening_name_id}
+
+        duration = timestamp - int(columns.timestamp[opening_event_idx])
+
+        # Subtract feature duration from parent duration such that
+        # it is not counted twice, similar to behavior in
+        # Performance-Influence models.
+        if open_event_names:
+            # Parent is equivalent to interaction of all open events.
+            feature_performances[get_interaction_string(open_names)] -= duration
 
-    if open_events:
+        interaction_string = get_interaction_string(open_names | {name_id})
+        feature_performances[interaction_string] += duration
+
+    if open_event_names:
         LOG.error("Not all events have been correctly closed.")
-        LOG.debug(f"Events = {open_events}.")
+        LOG.debug(
+            f"Events = {[get_trace_event(idx) for idx in open_event_names]}."
+        )
 
     if found_missing_open_event:
         LOG.error("Not all events have been correctly opened.")
 
-    return feature_performances
+    return dict(feature_performances)
 
 
 class Profiler():
@@ -333,43 +362,125 @@ class Profiler():
         """Checks if there was a regression between the old an new data."""
 
 
-class VXray(Profiler):
-    """Profiler mapper implementation for the vara tef tracer."""
+class PatchedPIMs():
+    """
+    Performance-influence models of the baseline and of all patches of a
+    :class:`~varats.report.multi_patch_report.MultiPatchReport`.
 
-    def __init__(self) -> None:
-        super().__init__(
-            "WXray", fpp.TEFProfileRunner, fpp.TEFProfileOverheadRunner,
-            fpp.MPRTEFAggregate
+    Each model maps a feature or interaction to its measured times, one value
+    per repetition.
+
+    Args:
+        baseline_pim: model of the unpatched project
+        patch_pims: models of the patched projects by patch shortname
+    """
+
+    def __init__(
+        self, baseline_pim: tp.DefaultDict[str, tp.List[int]],
+        patch_pims: tp.Dict[str, tp.DefaultDict[str, tp.List[int]]]
+    ) -> None:
+        self.__baseline_pim = baseline_pim
+        self.__patch_pims = patch_pims
+
+    @property
+    def baseline_pim(self) -> tp.DefaultDict[str, tp.List[int]]:
+        """Performance-influence model of the unpatched project."""
+        return self.__baseline_pim
+
+    def get_pim_for_patch(
+        self, patch_name: str
+    ) -> tp.Optional[tp.DefaultDict[str, tp.List[int]]]:
+        """Get the performance-influence model for a given patch shortname."""
+        return self.__patch_pims.get(patch_name)
+
+
+class PIMProfiler(Profiler):
+    """
+    Profiler that measures the performance of features, i.e., that produces a
+    performance-influence model per repetition.
+
+    The models of all patches are extracted at once from a result file and are
+    shared between all regression checks on that file, see
+    :func:`load_patched_pims`.
+    """
+
+    @staticmethod
+    @abc.abstractmethod
+    def aggregate_pims(
+        reports: tp.Iterable[tp.Any]
+    ) -> tp.DefaultDict[str, tp.List[int]]:
+        """Collect the performance-influence models of the given reports, i.e.,
+        the repetitions of one measurement."""
+
+    def extract_patched_pims(self, report_path: Path) -> PatchedPIMs:
+        """
+        Extract the performance-influence models of the baseline and all
+        patches from a result file of this profiler.
+
+        Use :func:`load_patched_pims` to get the cached models.
+
+        Args:
+            report_path: path to the result file
+
+        Returns:
+            the models of the baseline and all patches
+        """
+        multi_report = tp.cast(
+            MultiPatchReport[tp.Any], self.report_type(report_path)
+        )
+
+        return PatchedPIMs(
+            self.aggregate_pims(multi_report.get_baseline_report().reports()), {
+                patch_name: self.aggregate_pims(
+                    tp.cast(
+                        tp.Any, multi_report.get_report_for_patch(patch_name)
+                    ).reports()
+                ) for patch_name in multi_report.get_patch_names()
+            }
         )
 
     def is_regression(
         self, report_path: ReportFilepath, patch_name: str
     ) -> bool:
         """Checks if there was a regression between the old an new data."""
-        multi_report = MultiPatchReport(
-            report_path.full_path(), TEFReportAggregate
-        )
+        patched_pims = load_patched_pims(self, report_path.full_path())
 
-        old_acc_pim: tp.DefaultDict[str, tp.List[int]] = defaultdict(list)
-        for old_tef_report in multi_report.get_baseline_report().reports():
-            pim = get_feature_performance_from_tef_report(old_tef_report)
-            for feature, value in pim.items():
-                old_acc_pim[feature].append(value)
-
-        new_acc_pim: tp.DefaultDict[str, tp.List[int]] = defaultdict(list)
-        opt_mr = multi_report.get_report_for_patch(patch_name)
-        if not opt_mr:
+        new_acc_pim = patched_pims.get_pim_for_patch(patch_name)
+        if new_acc_pim is None:
             raise NotImplementedError()
 
-        for new_tef_report in opt_mr.reports():
-            pim = get_feature_performance_from_tef_report(new_tef_report)
-            for feature, value in pim.items():
-                new_acc_pim[feature].append(value)
+        return self.pim_regression_check(patched_pims.baseline_pim, new_acc_pim)
+
+
+def _aggregate_tef_pims(
+    reports: tp.Iterable[TEFReport]
+) -> tp.DefaultDict[str, tp.List[int]]:
+    acc_pim: tp.DefaultDict[str, tp.List[int]] = defaultdict(list)
+    for tef_report in reports:
+        pim = get_feature_performance_from_tef_report(tef_report)
+        for feature, value in pim.items():
+            acc_pim[feature].append(value)
 
-        return self.pim_regression_check(old_acc_pim, new_acc_pim)
+    return acc_pim
 
 
-class PIMTracer(Profiler):
+class VXray(PIMProfiler):
+    """Profiler mapper implementation for the vara tef tracer."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "WXray", fpp.TEFProfileRunner, fpp.TEFProfileOverheadRunner,
+            fpp.MPRTEFAggregate
+        )
+
+    @staticmethod
+    def aggregate_pims(
+        reports: tp.Iterable[TEFReport]
+    ) -> tp.DefaultDict[str, tp.List[int]]:
+        return _aggregate_tef_pims(reports)
+
+
+class PIMTracer(PIMProfiler):
     """Profiler mapper implementation for the vara performance-influence-model
     tracer."""
 
@@ -380,8 +491,8 @@ class PIMTracer(Profiler):
         )
 
     @staticmethod
-    def __aggregate_pim_data(
-        reports: tp.List[PerfInfluenceTraceReport]
+    def aggregate_pims(
+        reports: tp.Iterable[PerfInfluenceTraceReport]
     ) -> tp.DefaultDict[str, tp.List[int]]:
         acc_pim: tp.DefaultDict[str, tp.List[int]] = defaultdict(list)
         for old_pim_report in reports:
@@ -400,28 +511,8 @@ class PIMTracer(Profiler):
 
         return acc_pim
 
-    def is_regression(
-        self, report_path: ReportFilepath, patch_name: str
-    ) -> bool:
-        """Checks if there was a regression between the old an new data."""
-        multi_report = MultiPatchReport(
-            report_path.full_path(), PerfInfluenceTraceReportAggregate
-        )
-
-        old_acc_pim = self.__aggregate_pim_data(
-            multi_report.get_baseline_report().reports()
-        )
 
-        opt_mr = multi_report.get_report_for_patch(patch_name)
-        if not opt_mr:
-            raise NotImplementedError()
-
-        new_acc_pim = self.__aggregate_pim_data(opt_mr.reports())
-
-        return self.pim_regression_check(old_acc_pim, new_acc_pim)
-
-
-class EbpfTraceTEF(Profiler):
+class EbpfTraceTEF(PIMProfiler):
     """Profiler mapper implementation for the vara tef tracer."""
 
     def __init__(self) -> None:
@@ -430,31 +521,148 @@ class EbpfTraceTEF(Profiler):
             fpp.TEFProfileOverheadRunner, fpp.MPRTEFAggregate
         )
 
-    def is_regression(
-        self, report_path: ReportFilepath, patch_name: str
-    ) -> bool:
-        """Checks if there was a regression between the old an new data."""
-        multi_report = MultiPatchReport(
-            report_path.full_path(), TEFReportAggregate
-        )
+    @staticmethod
+    def aggregate_pims(
+        reports: tp.Iterable[TEFReport]
+    ) -> tp.DefaultDict[str, tp.List[int]]:
+        return _aggregate_tef_pims(reports)
 
-        old_acc_pim: tp.DefaultDict[str, tp.List[int]] = defaultdict(list)
-        for old_tef_report in multi_report.get_baseline_report().reports():
-            pim = get_feature_performance_from_tef_report(old_tef_report)
-            for feature, value in pim.items():
-                old_acc_pim[feature].append(value)
 
-        new_acc_pim: tp.DefaultDict[str, tp.List[int]] = defaultdict(list)
-        opt_mr = multi_report.get_report_for_patch(patch_name)
-        if not opt_mr:
-            raise NotImplementedError()
+# Models of the most recently used result files by profiler and path, together
+# with the cache key of the result file they were extracted from.
+__PATCHED_PIMS: tp.OrderedDict[tp.Tuple[str, str],
+                               tp.Tuple[str, PatchedPIMs]] = OrderedDict()
+__MAX_PATCHED_PIMS = 256
+
+
+def __get_patched_pims_path_key(profiler: PIMProfiler,
+                                report_path: Path) -> tp.Tuple[str, str]:
+    return (type(profiler).__qualname__, str(report_path))
+
+
+def __get_cached_patched_pims(
+    profiler: PIMProfiler, report_path: Path, cache_key: str
+) -> tp.Optional[PatchedPIMs]:
+    path_key = __get_patched_pims_path_key(profiler, report_path)
+    if (cache_entry := __PATCHED_PIMS.get(path_key)) is None:
+        return None
+
+    cached_key, patched_pims = cache_entry
+    if cached_key != cache_key:
+        # the result file changed, so its old models are never used again
+        del __PATCHED_PIMS[path_key]
+        return None
 
-        for new_tef_report in opt_mr.reports():
-            pim = get_feature_performance_from_tef_report(new_tef_report)
-            for feature, value in pim.items():
-                new_acc_pim[feature].append(value)
+    __PATCHED_PIMS.move_to_end(path_key)
+    return patched_pims
+
+
+def __cache_patched_pims(
+    profiler: PIMProfiler, report_path: Path, cache_key: str,
+    patched_pims: PatchedPIMs
+) -> None:
+    """Keep the models of a result file in memory, replacing the models of
+    older versions of the file and evicting the least recently used ones."""
+    path_key = __get_patched_pims_path_key(profiler, report_path)
+    __PATCHED_PIMS[path_key] = (cache_key, patched_pims)
+    __PATCHED_PIMS.move_to_end(path_key)
+    while len(__PATCHED_PIMS) > __MAX_PATCHED_PIMS:
+        __PATCHED_PIMS.popitem(last=False)
+
+
+def load_patched_pims(profiler: PIMProfiler, report_path: Path) -> PatchedPIMs:
+    """
+    Load the performance-influence models of the baseline and all patches from
+    a result file of a profiler.
+
+    The models are extracted once per result file and are kept in memory until
+    the file changes or the models of other result files displace them.
+
+    Args:
+        profiler: the profiler that produced the result file
+        report_path: path to the result file
+
+    Returns:
+        the models of the baseline and all patches
+    """
+    if is_racily_modified(report_path):
+        return profiler.extract_patched_pims(report_path)
+
+    cache_key = report_cache_key(report_path, profiler.report_type)
+    if (
+        patched_pims :=
+        __get_cached_patched_pims(profiler, report_path, cache_key)
+    ) is None:
+        patched_pims = profiler.extract_patched_pims(report_path)
+        __cache_patched_pims(profiler, report_path, cache_key, patched_pims)
+
+    return patched_pims
+
+
+def _extract_patched_pims_or_none(
+    profiler: PIMProfiler, report_path: Path
+) -> tp.Optional[PatchedPIMs]:
+    """Extract models in a worker process; errors are reported when the models
+    are loaded again by the regression check."""
+    try:
+        return profiler.extract_patched_pims(report_path)
+    except Exception:  # pylint: disable=broad-except
+        return None
 
-        return self.pim_regression_check(old_acc_pim, new_acc_pim)
+
+def __prefetch_patched_pims(
+    case_studies: tp.List[CaseStudy], profilers: tp.List[Profiler],
+    jobs: tp.Optional[int]
+) -> None:
+    """Extract the performance-influence models of all result files that are
+    needed to evaluate the given case studies in parallel."""
+    pending: tp.Dict[tp.Tuple[str, str], tp.Tuple[PIMProfiler, Path, str]] = {}
+    for case_study in case_studies:
+        rev = case_study.revisions[0]
+        for profiler in profilers:
+            if not isinstance(profiler, PIMProfiler):
+                continue
+
+            for config_id in case_study.get_config_ids_for_revision(rev):
+                for report_file in get_processed_revisions_files(
+                    case_study.project_name,
+                    profiler.experiment,
+                    profiler.report_type,
+                    get_case_study_file_name_filter(case_study),
+                    config_id=config_id
+                ):
+                    report_path = report_file.full_path()
+                    if is_racily_modified(report_path):
+                        continue
+                    cache_key = report_cache_key(
+                        report_path, profiler.report_type
+                    )
+                    if __get_cached_patched_pims(
+                        profiler, report_path, cache_key
+                    ) is None:
+                        pending[
+                            __get_patched_pims_path_key(profiler, report_path)
+                        ] = (profiler, report_path, cache_key)
+
+    # models that would be evicted before they are used are not prefetched
+    to_extract = list(pending.values())[:__MAX_PATCHED_PIMS]
+    jobs = min(jobs or os.cpu_count() or 1, len(to_extract))
+    if jobs <= 1:
+        return
+
+    profilers_to_extract, report_paths, cache_keys = zip(*to_extract)
+    with ProcessPoolExecutor(jobs) as executor:
+        for pim_profiler, report_path, cache_key, patched_pims in zip(
+            profilers_to_extract, report_paths, cache_keys,
+            executor.map(
+                _extract_patched_pims_or_none, profilers_to_extract,
+                report_paths
+            )
+        ):
+            if patched_pims is not None:
+                __cache_patched_pims(
+                    pim_profiler, report_path, cache_key, patched_pims
+                )
 
 
 class Baseline(Profiler):
@@ -756,10 +964,28 @@ class OverheadData:
 
 
 def load_precision_data(
-    case_studies: tp.List[CaseStudy], profilers: tp.List[Profiler]
+    case_studies: tp.List[CaseStudy],
+    profilers: tp.List[Profiler],
+    jobs: tp.Optional[int] = None
 ) -> pd.DataFrame:
-    """Loads precision measurement data for the given cases studies and computes
-    precision and recall for the different profilers."""
+    """
+    Loads precision measurement data for the given cases studies and computes
+    precision and recall for the different profilers.
+
+    The performance-influence models of the result files of all configurations
+    are extracted in parallel before the patches are evaluated.
+
+    Args:
+        case_studies: the case studies to evaluate
+        profilers: the profilers to evaluate
+        jobs: number of processes used to extract the models; defaults to the
+              number of CPUs
+
+    Returns:
+        a dataframe with one row per case study, patch, and profiler
+    """
+    __prefetch_patched_pims(case_studies, profilers, jobs)
+
     table_rows_plot = []
     for case_study in case_studies:
         for patch_name in get_patch_names(case_study):
@@ -1,10 +1,59 @@
 """This modules handles auto discovering of reports from the tool suite."""
 
+import typing as tp
+
+from varats import experiment as __CORE_EXPERIMENT__
+from varats import experiments as __EXPERIMENTS__
 from varats import report as __CORE_REPORTS__
 from varats.data import reports as __REPORTS__
+from varats.report.report import BaseReport
+from varats.utils.plugin_manifest import (
+    load_plugin_manifest,
+    LazyRegistry,
+    PluginEntry,
+)
 
 
 def initialize_reports() -> None:
     # Discover and initialize all Reports
     __REPORTS__.discover()
     __CORE_REPORTS__.discover()
+
+
+def __initialize_all_report_types() -> None:
+    initialize_reports()
+    __EXPERIMENTS__.discover()
+
+
+def get_report_type_entries() -> tp.Dict[str, PluginEntry]:
+    """
+    Look up the report types of the tool suite by their class name without
+    importing them.
+
+    Besides the report packages, experiments and experiment utilities can also
+    define their own report types.
+
+    Returns:
+        mapping from class name to the manifest entry of the report type
+    """
+    return {
+        entry.class_name: entry for package in
+        [__REPORTS__, __CORE_REPORTS__, __EXPERIMENTS__, __CORE_EXPERIMENT__]
+        for entry in load_plugin_manifest(package).entries
+        if "file_type" in entry.keywords
+    }
+
+
+def get_report_types() -> tp.Mapping[str, tp.Type[BaseReport]]:
+    """
+    Look up the report types of the tool suite by their class name.
+
+    Report modules are only imported when a report type is accessed.
+
+    Returns:
+        mapping from class name to report type
+    """
+    return LazyRegistry(
+        BaseReport.REPORT_TYPES, get_report_type_entries(),
+        __initialize_all_report_types
+    )
@@ -3,12 +3,11 @@ import abc
 import itertools
 import re
 import typing as tp
-from copy import deepcopy
-from pathlib import Path
 from typing import TypedDict
 
 import networkx as nx
-from benchbuild.utils.cmd import git
+import numpy as np
+from scipy import sparse
 
 from varats.data.cache_helper import build_cached_graph
 from varats.data.reports.blame_report import (
@@ -25,11 +24,12 @@ from varats.report.report import ReportFilename, ReportFilepath
 from varats.revision.revisions import get_processed_revisions_files
 from varats.utils.git_util import (
     CommitRepoPair,
-    create_commit_lookup_helper,
+    get_commit_metadata_store,
     ChurnConfig,
     UNCOMMITTED_COMMIT_HASH,
     FullCommitHash,
     get_submodule_head,
+    calc_repo_file_blames,
 )
 
 if tp.TYPE_CHECKING:
@@ -86,19 +86,54 @@ class CAIGEdgeAttrs(TypedDict):
 
 
 class InteractionGraph(abc.ABC):
-    """Graph/Network built from interaction data."""
+    """
+    Graph/Network built from interaction data.
+
+    All graphs are memoized per instance and in the graph cache. They are
+    frozen, as they are shared between all callers, so callers that need to
+    modify a graph have to ``copy()`` it first.
+    """
 
     def __init__(self, project_name: str):
         self.__project_name = project_name
+        self.__cached_graphs: tp.Dict[str, nx.DiGraph] = {}
 
     @property
     def project_name(self) -> str:
         return self.__project_name
 
+    @property
+    @abc.abstractmethod
+    def _graph_id(self) -> str:
+        """Identifier of the interaction data in the graph cache."""
+
     @abc.abstractmethod
     def _interaction_graph(self) -> nx.DiGraph:
         pass
 
+    def _cached_graph(
+        self, graph_kind: str, create_graph: tp.Callable[[], nx.DiGraph]
+    ) -> nx.DiGraph:
+        """
+        Look up a graph of this interaction data or create and cache it.
+
+        Args:
+            graph_kind: kind of the graph, e.g., ``cig`` for the commit
+                        interaction graph
+            create_graph: function that creates the graph
+
+        Returns:
+            the frozen graph
+        """
+        if (graph := self.__cached_graphs.get(graph_kind)) is None:
+            graph = nx.freeze(
+                build_cached_graph(
+                    f"{graph_kind}-{self._graph_id}", create_graph
+                )
+            )
+            self.__cached_graphs[graph_kind] = graph
+        return graph
+
     def blame_interaction_graph(self) -> nx.DiGraph:
         """
         Return a digraph with blame data as nodes and interactions as edges.
@@ -112,9 +147,9 @@ class InteractionGraph(abc.ABC):
           - amount: how often this interaction was found
 
         Returns:
-            the blame interaction graph
+            the frozen blame interaction graph
         """
-        return deepcopy(self._interaction_graph())
+        return self._interaction_graph()
 
     def commit_interaction_graph(self) -> nx.DiGraph:
         """
@@ -129,8 +164,11 @@ class InteractionGraph(abc.ABC):
           - amount: how often this interaction was found
 
         Returns:
-            the commit interaction graph
+            the frozen commit interaction graph
         """
+        return self._cached_graph("cig", self.__create_commit_interaction_graph)
+
+    def __create_commit_interaction_graph(self) -> nx.DiGraph:
         interaction_graph = self._interaction_graph()
 
         def edge_data(
@@ -178,59 +216,65 @@ class InteractionGraph(abc.ABC):
           - amount: how often an interaction between two authors was found
 
         Returns:
-            the author interaction graph
+            the frozen author interaction graph
         """
-        interaction_graph = self._interaction_graph()
-        commit_lookup = create_commit_lookup_helper(self.project_name)
+        return self._cached_graph("aig", self.__create_author_interaction_graph)
 
-        def partition(node_u: BIGNodeTy, node_v: BIGNodeTy) -> bool:
-            if UNCOMMITTED_COMMIT_HASH in (
-                node_u.commit.commit_hash, node_v.commit.commit_hash
-            ):
-                return node_u.commit == node_v.commit
-            return str(commit_lookup(node_u.commit).author.name
-                      ) == str(commit_lookup(node_v.commit).author.name)
-
-        def edge_data(
-            partition_a: tp.Set[BIGNodeTy], partition_b: tp.Set[BIGNodeTy]
-        ) -> AIGEdgeAttrs:
-            amount = 0
-            interactions: tp.List[tp.Tuple[CommitRepoPair, CommitRepoPair]] = []
-            for source in partition_a:
-                for sink in partition_b:
-                    if interaction_graph.has_edge(source, sink):
-                        amount += int(interaction_graph[source][sink]["amount"])
-                        interactions.append((source.commit, sink.commit))
-
-            return {"amount": amount, "interactions": interactions}
-
-        def node_data(nodes: tp.Set[BIGNodeTy]) -> AIGNodeAttrs:
-            authors = {
-                str(commit_lookup(node.commit).author.name)
-                if node.commit.commit_hash != UNCOMMITTED_COMMIT_HASH else
-                "Unknown" for node in nodes
-            }
-            assert len(authors) == 1, "Some node has more then one author."
-            return {
-                "author": next(iter(authors)),
-                "num_commits": len(nodes),
-                "commits": [node.commit for node in nodes]
-            }
+    def __create_author_interaction_graph(self) -> nx.DiGraph:
+        interaction_graph = self._interaction_graph()
+        node_authors = self._commit_authors([
+            node.commit for node in interaction_graph.nodes
+        ])
+
+        aig = nx.DiGraph()
+        for node in interaction_graph.nodes:
+            author = node_authors[node.commit]
+            if author not in aig:
+                aig.add_node(author, author=author, num_commits=0, commits=[])
+            author_attrs = tp.cast(AIGNodeAttrs, aig.nodes[author])
+            author_attrs["num_commits"] += 1
+            author_attrs["commits"].append(node.commit)
+
+        for source, sink, amount in interaction_graph.edges(data="amount"):
+            source_author = node_authors[source.commit]
+            sink_author = node_authors[sink.commit]
+            # interactions within the same author are not part of the graph
+            if source_author == sink_author:
+                continue
+
+            if not aig.has_edge(source_author, sink_author):
+                aig.add_edge(
+                    source_author, sink_author, amount=0, interactions=[]
+                )
+            edge_attrs = tp.cast(AIGEdgeAttrs, aig[source_author][sink_author])
+            edge_attrs["amount"] += int(amount)
+            edge_attrs["interactions"].append((source.commit, sink.commit))
 
-        aig = nx.quotient_graph(
-            interaction_graph,
-            partition=partition,
-            edge_data=edge_data,
-            node_data=node_data,
-            create_using=nx.DiGraph
-        )
-        relabel_dict: tp.Dict[tp.FrozenSet[BIGNodeTy], str] = {}
-        for node in aig.nodes:
-            relabel_dict[node] = tp.cast(AIGNodeAttrs,
-                                         aig.nodes[node])["author"]
-        nx.relabel_nodes(aig, relabel_dict, copy=False)
         return aig
 
+    def _commit_authors(
+        self, commits: tp.Iterable[CommitRepoPair]
+    ) -> tp.Dict[CommitRepoPair, str]:
+        """Looks up the author names of commits, where uncommitted changes
+        belong to the author ``Unknown``."""
+        commit_authors: tp.Dict[CommitRepoPair, str] = {}
+        known_commits: tp.List[CommitRepoPair] = []
+        for commit in set(commits):
+            if commit.commit_hash == UNCOMMITTED_COMMIT_HASH:
+                commit_authors[commit] = "Unknown"
+            else:
+                known_commits.append(commit)
+
+        if known_commits:
+            commit_metadata = get_commit_metadata_store(self.project_name)
+            author_names = commit_metadata.author_names[
+                commit_metadata.author_name_ids[
+                    commit_metadata.commit_ids(known_commits)]]
+            commit_authors.update(
+                zip(known_commits, (str(name) for name in author_names))
+            )
+        return commit_authors
+
     def commit_author_interaction_graph(
         self,
         outgoing_interactions: bool = True,
@@ -253,16 +297,27 @@ class InteractionGraph(abc.ABC):
             incoming_interactions: whether to include incoming interactions
 
         Returns:
-            the commit-author interaction graph
+            the frozen commit-author interaction graph
         """
-        commit_interaction_graph = self.commit_interaction_graph()
-        commit_lookup = create_commit_lookup_helper(self.project_name)
+        graph_kind = "caig"
+        if outgoing_interactions:
+            graph_kind += "-out"
+        if incoming_interactions:
+            graph_kind += "-in"
+
+        return self._cached_graph(
+            graph_kind, lambda: self.__create_commit_author_interaction_graph(
+                outgoing_interactions, incoming_interactions
+            )
+        )
 
-        commit_author_mapping = {
-            commit: commit_lookup(commit).author.name
-            if commit.commit_hash != UNCOMMITTED_COMMIT_HASH else "Unknown"
-            for commit in (list(commit_interaction_graph.nodes))
-        }
+    def __create_commit_author_interaction_graph(
+        self, outgoing_interactions: bool, incoming_interactions: bool
+    ) -> nx.DiGraph:
+        commit_interaction_graph = self.commit_interaction_graph()
+        commit_author_mapping = self._commit_authors(
+            commit_interaction_graph.nodes
+        )
         caig = nx.DiGraph()
         # add commits as nodes
         caig.add_nodes_from([(commit, {
@@ -306,7 +361,12 @@ class BlameInteractionGraph(InteractionGraph):
     def __init__(self, project_name: str, report_file: ReportFilepath):
         super().__init__(project_name)
         self.__report_file = report_file
-        self.__cached_interaction_graph: tp.Optional[nx.DiGraph] = None
+
+    @property
+    def _graph_id(self) -> str:
+        filename = self.__report_file.report_filename
+        return f"{filename.experiment_shorthand}-{self.project_name}-" \
+               f"{filename.commit_hash.hash}"
 
     def _interaction_graph(self) -> nx.DiGraph:
 
@@ -342,13 +402,7 @@ class BlameInteractionGraph(InteractionGraph):
             ])
             return interaction_graph
 
-        if not self.__cached_interaction_graph:
-            filename = self.__report_file.report_filename
-            self.__cached_interaction_graph = build_cached_graph(
-                f"ig-{filename.experiment_shorthand}-{self.project_name}-"
-                f"{filename.commit_hash.hash}", create_graph
-            )
-        return self.__cached_interaction_graph
+        return self._cached_graph("ig", create_graph)
 
 
 class CallgraphBasedInteractionGraph(InteractionGraph):
@@ -357,7 +411,11 @@ class CallgraphBasedInteractionGraph(InteractionGraph):
     def __init__(self, project_name: str, report_file: ReportFilepath):
         super().__init__(project_name)
         self.__report_file = report_file
-        self.__cached_interaction_graph: tp.Optional[nx.DiGraph] = None
+
+    @property
+    def _graph_id(self) -> str:
+        filename = self.__report_file.report_filename
+        return f"callgraph-{self.project_name}-{filename.commit_hash.hash}"
 
     def _interaction_graph(self) -> nx.DiGraph:
 
@@ -385,11 +443,7 @@ class CallgraphBasedInteractionGraph(InteractionGraph):
 
             return interaction_graph
 
-        if not self.__cached_interaction_graph:
-            self.__cached_interaction_graph = build_cached_graph(
-                f"ig-callgraph-{self.project_name}", create_graph
-            )
-        return self.__cached_interaction_graph
+        return self._cached_graph("ig", create_graph)
 
 
 def _nodes_for_func_entry(
@@ -410,7 +464,10 @@ class FileBasedInteractionGraph(InteractionGraph):
     def __init__(self, project_name: str, head_commit: FullCommitHash):
         super().__init__(project_name)
         self.__head_commit = head_commit
-        self.__cached_interaction_graph: tp.Optional[nx.DiGraph] = None
+
+    @property
+    def _graph_id(self) -> str:
+        return f"file-{self.project_name}-{self.__head_commit.hash}"
 
     def _interaction_graph(self) -> nx.DiGraph:
 
@@ -424,67 +481,55 @@ class FileBasedInteractionGraph(InteractionGraph):
                 )
             )
 
-            blame_regex = re.compile(r"^([0-9a-f]+)\s+(?:.+\s+)?[\d]+\) ?(.*)$")
-
+            # incidence matrix between files (rows) and commits (columns)
+            commit_ids: tp.Dict[tp.Tuple[FullCommitHash, str], int] = {}
+            file_ids: tp.List[int] = []
+            file_commit_ids: tp.List[int] = []
+            num_files = 0
             for repo_name in repos:
                 repo_path = get_local_project_git_path(
                     self.project_name, repo_name
                 )
-                project_git = git["-C", str(repo_path)]
                 head_commit = get_submodule_head(
                     self.project_name, repo_name, self.__head_commit
                 )
 
-                file_names = project_git(
-                    "ls-tree", "--full-tree", "--name-only", "-r", head_commit
-                ).split("\n")
-                files: tp.List[Path] = [
-                    repo_path / path
-                    for path in file_names
-                    if file_pattern.search(path)
-                ]
-                for file in files:
-                    nodes: tp.Set[BIGNodeTy] = set()
-                    blame_lines: str = project_git(
-                        "blame", "-w", "-s", "-l", "--root", head_commit, "--",
-                        str(file.relative_to(repo_path))
-                    )
-
-                    for line in blame_lines.strip().split("\n"):
-                        match = blame_regex.match(line)
-                        if not match:
-                            raise AssertionError
-
-                        if match.group(2):
-                            nodes.add(
-                                BlameTaintData(
-                                    CommitRepoPair(
-                                        FullCommitHash(match.group(1)),
-                                        repo_name
-                                    )
-                                )
-                            )
-
-                    for node in nodes:
-                        interaction_graph.add_node(node, blame_taint_data=node)
-                    for commit_a, commit_b in itertools.product(
-                        nodes, repeat=2
-                    ):
-                        if commit_a != commit_b:
-                            if not interaction_graph.has_edge(
-                                commit_a, commit_b
-                            ):
-                                interaction_graph.add_edge(
-                                    commit_a, commit_b, amount=0
-                                )
-                            interaction_graph[commit_a][commit_b]["amount"] += 1
+                file_blames = calc_repo_file_blames(
+                    repo_path, head_commit, file_pattern
+                )
+                for commits in file_blames.values():
+                    for commit in commits:
+                        file_ids.append(num_files)
+                        file_commit_ids.append(
+                            commit_ids.setdefault((commit, repo_name),
+                                                  len(commit_ids))
+                        )
+                    num_files += 1
+
+            nodes: tp.List[BIGNodeTy] = [
+                BlameTaintData(CommitRepoPair(commit, repo_name))
+                for commit, repo_name in commit_ids
+            ]
+            for node in nodes:
+                interaction_graph.add_node(node, blame_taint_data=node)
+
+            occurrences = np.ones(len(file_ids), dtype=np.int64)
+            incidence = sparse.csr_matrix(
+                (occurrences, (file_ids, file_commit_ids)),
+                shape=(num_files, len(nodes))
+            )
+            # number of files in which two commits occur together
+            co_occurrences = (incidence.T @ incidence).tocoo()
+            interaction_graph.add_edges_from(
+                (nodes[commit_a], nodes[commit_b], {
+                    "amount": int(amount)
+                }) for commit_a, commit_b, amount in zip(
+                    co_occurrences.row, co_occurrences.col, co_occurrences.data
+                ) if commit_a != commit_b
+            )
             return interaction_graph
 
-        if not self.__cached_interaction_graph:
-            self.__cached_interaction_graph = build_cached_graph(
-                f"ig-file-{self.project_name}", create_graph
-            )
-        return self.__cached_interaction_graph
+        return self._cached_graph("ig", create_graph)
 
 
 def create_blame_interaction_graph(
@@ -1,26 +1,29 @@
 """Module for BlameReport, a collection of blame interactions."""
+import hashlib
+import json
 import logging
+import os
+import time
 import typing as tp
 from collections import defaultdict
 from copy import deepcopy
-from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
 import numpy as np
-import pygit2
 import yaml
 
 from varats.base.version_header import VersionHeader
 from varats.report.report import BaseReport
+from varats.utils.filesystem_util import atomic_write, RACY_MTIME_NS
 from varats.utils.git_util import (
-    map_commits,
     CommitRepoPair,
-    CommitLookupTy,
+    CommitMetadataStore,
     FullCommitHash,
     ShortCommitHash,
     UNCOMMITTED_COMMIT_HASH,
 )
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
@@ -421,41 +424,491 @@ class BlameTaintScope(Enum):
         }[value]
 
 
+class BlameReportTables(tp.NamedTuple):
+    """
+    Compact column representation of the blame interactions of a report.
+
+    Repositories, commits, taints, and functions are interned into tables and
+    referenced by their index. The interactions of function ``f`` are the
+    indices ``function_interaction_offsets[f]`` up to
+    ``function_interaction_offsets[f + 1]`` and the interacting taints of
+    interaction ``i`` are stored in the same way in ``interacting_taints``
+    using ``interaction_taint_offsets``, as are the callees and commits of
+    functions. Taints without a region or function use the index -1.
+    """
+    repository_names: tp.List[str]
+    commit_hashes: tp.List[str]
+    commit_repositories: np.ndarray
+    taint_function_names: tp.List[str]
+    taint_commits: np.ndarray
+    taint_regions: np.ndarray
+    taint_functions: np.ndarray
+    function_names: tp.List[str]
+    function_demangled_names: tp.List[str]
+    function_file_names: tp.List[tp.Optional[str]]
+    function_num_instructions: np.ndarray
+    function_interaction_offsets: np.ndarray
+    function_callee_offsets: np.ndarray
+    callees: tp.List[str]
+    function_commit_offsets: np.ndarray
+    function_commits: np.ndarray
+    interaction_base_taints: np.ndarray
+    interaction_taint_offsets: np.ndarray
+    interacting_taints: np.ndarray
+    interaction_amounts: np.ndarray
+
+    @staticmethod
+    def create_blame_report_tables(
+        raw_result_map: tp.Dict[str, tp.Dict[str, tp.Any]]
+    ) -> 'BlameReportTables':
+        """Creates :class:`BlameReportTables` from the result map of the
+        corresponding yaml document."""
+        repository_index: tp.Dict[str, int] = {}
+        commit_index: tp.Dict[tp.Tuple[str, str], int] = {}
+        commit_columns: tp.Tuple[tp.List[str], tp.List[int]] = ([], [])
+        taint_function_index: tp.Dict[str, int] = {}
+        taint_index: tp.Dict[tp.Tuple[int, tp.Optional[int], tp.Optional[str]],
+                             int] = {}
+        taint_columns: tp.Tuple[tp.List[int], tp.List[int],
+                                tp.List[int]] = ([], [], [])
+        # taint objects are only created to sort interacting taints like
+        # BlameInstInteractions does
+        taint_objects: tp.List[BlameTaintData] = []
+
+        def intern_commit(commit_hash: str, repository_name: str) -> int:
+            commit_id = commit_index.get((commit_hash, repository_name), None)
+            if commit_id is None:
+                commit_id = len(commit_columns[0])
+                commit_index[(commit_hash, repository_name)] = commit_id
+                commit_columns[0].append(FullCommitHash(commit_hash).hash)
+                commit_columns[1].append(
+                    repository_index.setdefault(
+                        repository_name, len(repository_index)
+                    )
+                )
+            return commit_id
+
+        def intern_taint(raw_taint: tp.Union[str, tp.Dict[str, tp.Any]]) -> int:
+            # be backwards compatible with blame report version 4
+            if isinstance(raw_taint, str):
+                commit_hash, *repo = raw_taint.split('-', maxsplit=1)
+                repository_name = repo[0] if repo else "Unknown"
+                key = (intern_commit(commit_hash, repository_name), None, None)
+            else:
+                repository_name = raw_taint["repository"]
+                key = (
+                    intern_commit(raw_taint["commit"], repository_name),
+                    raw_taint.get("region"), raw_taint.get("function")
+                )
+
+            taint_id = taint_index.get(key, None)
+            if taint_id is None:
+                taint_id = len(taint_objects)
+                taint_index[key] = taint_id
+                taint_objects.append(
+                    BlameTaintData(
+                        CommitRepoPair(
+                            FullCommitHash(commit_columns[0][key[0]]),
+                            repository_name
+                        ), key[1], key[2]
+                    )
+                )
+                taint_columns[0].append(key[0])
+                taint_columns[1].append(-1 if key[1] is None else key[1])
+                taint_columns[2].append(
+                    -1 if key[2] is None else taint_function_index.
+                    setdefault(key[2], len(taint_function_index))
+                )
+            return taint_id
+
+        function_columns: tp.Tuple[tp.List[str], tp.List[str],
+                                   tp.List[tp.Optional[str]],
+                                   tp.List[int]] = ([], [], [], [])
+        interaction_offsets, callee_offsets, commit_offsets = [0], [0], [0]
+        callees: tp.List[str] = []
+        function_commits: tp.List[int] = []
+        base_taints: tp.List[int] = []
+        taint_offsets = [0]
+        interacting_taints: tp.List[int] = []
+        amounts: tp.List[int] = []
+
+        for name, raw_function_entry in raw_result_map.items():
+            function_columns[0].append(name)
+            function_columns[1].append(
+                str(raw_function_entry['demangled-name'])
+            )
+            function_columns[2].append(raw_function_entry.get('file'))
+            function_columns[3].append(
+                int(raw_function_entry['num-instructions'])
+            )
+
+            for raw_inst_entry in raw_function_entry['insts']:
+                base_taints.append(intern_taint(raw_inst_entry['base-hash']))
+                interacting_taints.extend(
+                    sorted([
+                        intern_taint(raw_taint)
+                        for raw_taint in raw_inst_entry['interacting-hashes']
+                    ],
+                           key=taint_objects.__getitem__)
+                )
+                taint_offsets.append(len(interacting_taints))
+                amounts.append(int(raw_inst_entry['amount']))
+            interaction_offsets.append(len(base_taints))
+
+            callees.extend(
+                str(callee) for callee in raw_function_entry.get("callees", [])
+            )
+            callee_offsets.append(len(callees))
+            function_commits.extend(
+                intern_commit(raw_commit["commit"], raw_commit["repository"])
+                for raw_commit in raw_function_entry.get("commits", [])
+            )
+            commit_offsets.append(len(function_commits))
+
+        return BlameReportTables(
+            repository_names=list(repository_index),
+            commit_hashes=commit_columns[0],
+            commit_repositories=np.array(commit_columns[1], dtype=np.int32),
+            taint_function_names=list(taint_function_index),
+            taint_commits=np.array(taint_columns[0], dtype=np.int32),
+            taint_regions=np.array(taint_columns[1], dtype=np.int64),
+            taint_functions=np.array(taint_columns[2], dtype=np.int32),
+            function_names=function_columns[0],
+            function_demangled_names=function_columns[1],
+            function_file_names=function_columns[2],
+            function_num_instructions=np.array(
+                function_columns[3], dtype=np.int64
+            ),
+            function_interaction_offsets=np.array(
+                interaction_offsets, dtype=np.int64
+            ),
+            function_callee_offsets=np.array(callee_offsets, dtype=np.int64),
+            callees=callees,
+            function_commit_offsets=np.array(commit_offsets, dtype=np.int64),
+            function_commits=np.array(function_commits, dtype=np.int32),
+            interaction_base_taints=np.array(base_taints, dtype=np.int32),
+            interaction_taint_offsets=np.array(taint_offsets, dtype=np.int64),
+            interacting_taints=np.array(interacting_taints, dtype=np.int32),
+            interaction_amounts=np.array(amounts, dtype=np.int64)
+        )
+
+
+class _BlameFunctionEntryView(tp.Mapping[str, BlameResultFunctionEntry]):
+    """
+    Offers the function entries of :class:`BlameReportTables` as objects.
+
+    Function entries are created on access and not kept, only the commit and
+    taint objects they reference are shared between all entries.
+    """
+
+    def __init__(self, tables: BlameReportTables) -> None:
+        self.__tables = tables
+        self.__function_index = {
+            name: idx for idx, name in enumerate(tables.function_names)
+        }
+        self.__commits: tp.Optional[tp.List[CommitRepoPair]] = None
+        self.__taints: tp.Optional[tp.List[BlameTaintData]] = None
+
+    def __interned_objects(
+        self
+    ) -> tp.Tuple[tp.List[CommitRepoPair], tp.List[BlameTaintData]]:
+        if self.__commits is None or self.__taints is None:
+            tables = self.__tables
+            self.__commits = [
+                CommitRepoPair(
+                    FullCommitHash(commit_hash),
+                    tables.repository_names[repository_id]
+                ) for commit_hash, repository_id in
+                zip(tables.commit_hashes, tables.commit_repositories.tolist())
+            ]
+            self.__taints = [
+                BlameTaintData(
+                    self.__commits[commit_id],
+                    None if region_id < 0 else region_id,
+                    None if function_id < 0 else
+                    tables.taint_function_names[function_id]
+                ) for commit_id, region_id, function_id in zip(
+                    tables.taint_commits.tolist(), tables.taint_regions.tolist(
+                    ), tables.taint_functions.tolist()
+                )
+            ]
+        return self.__commits, self.__taints
+
+    def __getitem__(self, name: str) -> BlameResultFunctionEntry:
+        function_idx = self.__function_index[name]
+        tables = self.__tables
+        commits, taints = self.__interned_objects()
+
+        interactions = []
+        taint_offsets = tables.interaction_taint_offsets
+        for interaction_idx in range(
+            tables.function_interaction_offsets[function_idx],
+            tables.function_interaction_offsets[function_idx + 1]
+        ):
+            interactions.append(
+                BlameInstInteractions(
+                    taints[tables.interaction_base_taints[interaction_idx]], [
+                        taints[taint_id] for taint_id in tables.
+                        interacting_taints[taint_offsets[interaction_idx]:
+                                           taint_offsets[interaction_idx +
+                                                         1]].tolist()
+                    ], int(tables.interaction_amounts[interaction_idx])
+                )
+            )
+
+        callee_offsets = tables.function_callee_offsets
+        commit_offsets = tables.function_commit_offsets
+        return BlameResultFunctionEntry(
+            name, tables.function_demangled_names[function_idx],
+            tables.function_file_names[function_idx], interactions,
+            int(tables.function_num_instructions[function_idx]), tables.
+            callees[callee_offsets[function_idx]:callee_offsets[function_idx +
+                                                                1]],
+            [
+                commits[commit_id] for commit_id in tables.function_commits[
+                    commit_offsets[function_idx]:commit_offsets[function_idx +
+                                                                1]].tolist()
+            ]
+        )
+
+    def __iter__(self) -> tp.Iterator[str]:
+        return iter(self.__function_index)
+
+    def __len__(self) -> int:
+        return len(self.__function_index)
+
+
+class _BlameReportSidecar():
+    """
+    Binary sidecar of a blame report that stores its parsed tables, so the
+    yaml file does not need to be parsed again.
+
+    A sidecar starts with a json header, which records the size and
+    modification time of the yaml file it was created from, followed by the
+    raw arrays of the :class:`BlameReportTables`. Arrays are memory-mapped
+    when a sidecar is loaded and string tables are stored as NUL-separated
+    utf-8 blobs.
+    """
+
+    MAGIC = b"VaRA-BRT"
+    FORMAT_VERSION = 1
+    ALIGNMENT = 64
+
+    class Content(tp.NamedTuple):
+        """Parsed content of a blame report that is stored in a sidecar."""
+        version: int
+        meta_data: BlameReportMetaData
+        scope: BlameTaintScope
+        tables: BlameReportTables
+
+    @staticmethod
+    def sidecar_path(report_path: Path) -> Path:
+        report_key = hashlib.sha1(str(report_path.resolve()).encode()
+                                 ).hexdigest()
+        return Path(
+            str(vara_cfg()["data_cache"])
+        ) / "blame_report_tables" / f"{report_key}.brt"
+
+    @staticmethod
+    def __data_offset(header_size: int) -> int:
+        alignment = _BlameReportSidecar.ALIGNMENT
+        return -(
+            -(len(_BlameReportSidecar.MAGIC) + 8 + header_size) // alignment
+        ) * alignment
+
+    @staticmethod
+    def load(report_path: Path,
+             report_stat: os.stat_result) -> tp.Optional['Content']:
+        """Loads the sidecar of a report if it was created from the current
+        version of the report file."""
+        sidecar_path = _BlameReportSidecar.sidecar_path(report_path)
+        try:
+            with open(sidecar_path, "rb") as sidecar_file:
+                if sidecar_file.read(
+                    len(_BlameReportSidecar.MAGIC)
+                ) != _BlameReportSidecar.MAGIC:
+                    return None
+                header_size = int.from_bytes(sidecar_file.read(8), "little")
+                header = json.loads(sidecar_file.read(header_size))
+        except (OSError, ValueError):
+            return None
+
+        if (
+            header.get("format_version") != _BlameReportSidecar.FORMAT_VERSION
+            or header["source_size"] != report_stat.st_size or
+            header["source_mtime_ns"] != report_stat.st_mtime_ns
+        ):
+            return None
+
+        data_offset = _BlameReportSidecar.__data_offset(header_size)
+        columns: tp.Dict[str, tp.Any] = {}
+        for name, (num_strings, dtype, shape,
+                   offset) in header["columns"].items():
+            if 0 in shape:
+                column = np.empty(shape, dtype=dtype)
+            else:
+                column = np.memmap(
+                    sidecar_path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=data_offset + offset,
+                    shape=tuple(shape)
+                )
+            if num_strings > 0:
+                columns[name] = column.tobytes().decode().split("\0")
+            elif num_strings == 0:
+                columns[name] = []
+            else:
+                columns[name] = column
+
+        has_file_names = columns.pop("has_function_file_names")
+        columns["function_file_names"] = [
+            file_name if has_file_name else None for file_name, has_file_name in
+            zip(columns["function_file_names"], has_file_names.tolist())
+        ]
+        return _BlameReportSidecar.Content(
+            header["version"], BlameReportMetaData(**header["meta_data"]),
+            BlameTaintScope[header["scope"]], BlameReportTables(**columns)
+        )
+
+    @staticmethod
+    def store(
+        report_path: Path, report_stat: os.stat_result, content: 'Content'
+    ) -> None:
+        """Stores the sidecar of a report, unless the report file could still
+        change without changing its modification time."""
+        mtime_age_ns = time.time_ns() - report_stat.st_mtime_ns
+        if mtime_age_ns < RACY_MTIME_NS:
+            return
+
+        # string tables are stored with their length, arrays with -1
+        columns: tp.Dict[str, tp.Tuple[int, np.ndarray]] = {}
+        for name, value in content.tables._asdict().items():
+            if isinstance(value, np.ndarray):
+                columns[name] = (-1, value)
+            else:
+                columns[name] = (
+                    len(value),
+                    np.frombuffer(
+                        "\0".join(string or "" for string in value).encode(),
+                        dtype=np.uint8
+                    )
+                )
+        columns["has_function_file_names"] = (
+            -1,
+            np.array([
+                file_name is not None
+                for file_name in content.tables.function_file_names
+            ],
+                     dtype=bool)
+        )
+
+        alignment = _BlameReportSidecar.ALIGNMENT
+        header_columns: tp.Dict[str, tp.Tuple[int, str, tp.List[int], int]] = {}
+        data_size = 0
+        for name, (num_strings, column) in columns.items():
+            header_columns[name] = (
+                num_strings, column.dtype.str, list(column.shape), data_size
+            )
+            data_size += -(-column.nbytes // alignment) * alignment
+
+        meta_data = content.meta_data
+        header = json.dumps({
+            "format_version": _BlameReportSidecar.FORMAT_VERSION,
+            "source_size": report_stat.st_size,
+            "source_mtime_ns": report_stat.st_mtime_ns,
+            "version": content.version,
+            "meta_data": {
+                "num_functions":
+                    meta_data.num_functions,
+                "num_instructions":
+                    meta_data.num_instructions,
+                "num_phasar_empty_tracked_vars":
+                    meta_data.num_empty_tracked_vars,
+                "num_phasar_total_tracked_vars":
+                    meta_data.num_total_tracked_vars,
+                "bta_wall_time":
+                    meta_data.bta_wall_time,
+            },
+            "scope": content.scope.name,
+            "columns": header_columns,
+        }).encode()
+        data_offset = _BlameReportSidecar.__data_offset(len(header))
+
+        sidecar_path = _BlameReportSidecar.sidecar_path(report_path)
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(sidecar_path) as sidecar_file:
+            sidecar_file.write(_BlameReportSidecar.MAGIC)
+            sidecar_file.write(len(header).to_bytes(8, "little"))
+            sidecar_file.write(header)
+            for name, (_, column) in columns.items():
+                sidecar_file.seek(data_offset + header_columns[name][3])
+                sidecar_file.write(np.ascontiguousarray(column).tobytes())
+            sidecar_file.truncate(data_offset + data_size)
+
+
 class BlameReport(BaseReport, shorthand="BR", file_type="yaml"):
     """Full blame report containing all blame interactions."""
 
+    # Blame reports are persisted in their own binary sidecar instead.
+    PERSISTABLE = False
+
     def __init__(self, path: Path) -> None:
         super().__init__(path)
 
+        try:
+            report_stat: tp.Optional[os.stat_result] = path.stat()
+        except OSError:
+            report_stat = None
+
+        content = _BlameReportSidecar.load(
+            path, report_stat
+        ) if report_stat else None
+        if content is None:
+            content = self.__parse_yaml(path)
+            if report_stat:
+                try:
+                    _BlameReportSidecar.store(path, report_stat, content)
+                except OSError as error:
+                    LOG.warning(
+                        f"Could not store blame report sidecar for {path}: "
+                        f"{error}"
+                    )
+
+        if content.version < 5:
+            LOG.warning(
+                "You are using an outdated blame report format "
+                "that might not be supported in the future."
+            )
+
+        self.__meta_data = content.meta_data
+        self.__blame_taint_scope = content.scope
+        self.__tables = content.tables
+        self.__function_entries = _BlameFunctionEntryView(self.__tables)
+
+    @staticmethod
+    def __parse_yaml(path: Path) -> _BlameReportSidecar.Content:
         with open(path, 'r') as stream:
             documents = yaml.load_all(stream, Loader=yaml.CLoader)
             version_header = VersionHeader(next(documents))
             version_header.raise_if_not_type("BlameReport")
             version_header.raise_if_version_is_less_than(4)
-            if version_header.version < 5:
-                LOG.warning(
-                    "You are using an outdated blame report format "
-                    "that might not be supported in the future."
-                )
 
-            self.__meta_data = BlameReportMetaData \
+            meta_data = BlameReportMetaData \
                 .create_blame_report_meta_data(next(documents))
 
-            self.__function_entries: tp.Dict[str, BlameResultFunctionEntry] = {}
             raw_blame_report = next(documents)
-            self.__blame_taint_scope = BlameTaintScope.from_string(
-                # be backwards compatible with blame report version 4
-                raw_blame_report.get('scope', "COMMIT")
-            )
-            for raw_func_entry in raw_blame_report['result-map']:
-                new_function_entry = (
-                    BlameResultFunctionEntry.create_blame_result_function_entry(
-                        raw_func_entry,
-                        raw_blame_report['result-map'][raw_func_entry]
-                    )
+            return _BlameReportSidecar.Content(
+                version_header.version,
+                meta_data,
+                BlameTaintScope.from_string(
+                    # be backwards compatible with blame report version 4
+                    raw_blame_report.get('scope', "COMMIT")
+                ),
+                BlameReportTables.create_blame_report_tables(
+                    raw_blame_report['result-map']
                 )
-                self.__function_entries[new_function_entry.name
-                                       ] = new_function_entry
+            )
 
     def get_blame_result_function_entry(
         self, mangled_function_name: str
@@ -474,9 +927,18 @@ class BlameReport(BaseReport, shorthand="BR", file_type="yaml"):
 
     @property
     def function_entries(self) -> tp.ValuesView[BlameResultFunctionEntry]:
-        """Iterate over all function entries."""
+        """
+        Iterate over all function entries.
+
+        Function entries are created from :attr:`tables` on access.
+        """
         return self.__function_entries.values()
 
+    @property
+    def tables(self) -> BlameReportTables:
+        """Compact column representation of the blame interactions."""
+        return self.__tables
+
     @property
     def head_commit(self) -> ShortCommitHash:
         """The current HEAD commit under which this CommitReport was created."""
@@ -657,32 +1119,137 @@ def count_interacting_commits(
     )
 
 
+class _InteractionColumns(tp.NamedTuple):
+    """Interactions of a report flattened into columns for vectorized
+    analyses."""
+    amounts: np.ndarray
+    base_commit_ids: np.ndarray
+    taint_interactions: np.ndarray
+    taint_commit_ids: np.ndarray
+
+
+def __interaction_columns(
+    report: tp.Union[BlameReport, BlameReportDiff],
+    commit_metadata: CommitMetadataStore,
+    with_base_commits: bool = False
+) -> _InteractionColumns:
+    """
+    Flattens the interactions of a report into columns of commit ids.
+
+    Interacting taints of uncommitted changes are skipped and the base commit
+    ids of interactions are only looked up if ``with_base_commits`` is set,
+    where uncommitted base commits get the id -1.
+    """
+    if isinstance(report, BlameReport):
+        return __table_interaction_columns(
+            report.tables, commit_metadata, with_base_commits
+        )
+
+    amounts: tp.List[int] = []
+    base_commits: tp.List[CommitRepoPair] = []
+    taint_interactions: tp.List[int] = []
+    taint_commits: tp.List[CommitRepoPair] = []
+
+    for func_entry in report.function_entries:
+        for interaction in func_entry.interactions:
+            interaction_idx = len(amounts)
+            amounts.append(interaction.amount)
+            base_commits.append(interaction.base_taint.commit)
+            for taint in interaction.interacting_taints:
+                if taint.commit.commit_hash != UNCOMMITTED_COMMIT_HASH:
+                    taint_interactions.append(interaction_idx)
+                    taint_commits.append(taint.commit)
+
+    base_commit_ids = np.full(len(amounts), -1, dtype=np.int64)
+    if with_base_commits:
+        for interaction_idx, base_commit in enumerate(base_commits):
+            if base_commit.commit_hash != UNCOMMITTED_COMMIT_HASH:
+                base_commit_ids[interaction_idx] = commit_metadata.commit_id(
+                    base_commit
+                )
+
+    return _InteractionColumns(
+        np.array(amounts, dtype=np.int64), base_commit_ids,
+        np.array(taint_interactions, dtype=np.int64),
+        commit_metadata.commit_ids(taint_commits)
+    )
+
+
+def __table_interaction_columns(
+    tables: BlameReportTables, commit_metadata: CommitMetadataStore,
+    with_base_commits: bool
+) -> _InteractionColumns:
+    """Flattens interactions like :func:`__interaction_columns` but only looks
+    up every distinct commit of the report once."""
+    is_committed = np.array([
+        commit_hash != UNCOMMITTED_COMMIT_HASH.hash
+        for commit_hash in tables.commit_hashes
+    ],
+                            dtype=bool)
+    taint_commits = tables.taint_commits[tables.interacting_taints]
+    taint_mask = is_committed[taint_commits]
+    taint_interactions = np.repeat(
+        np.arange(len(tables.interaction_amounts), dtype=np.int64),
+        np.diff(tables.interaction_taint_offsets)
+    )[taint_mask]
+    taint_commits = taint_commits[taint_mask]
+    base_commits = tables.taint_commits[tables.interaction_base_taints]
+
+    used_commits = np.unique(taint_commits)
+    if with_base_commits:
+        used_commits = np.union1d(
+            used_commits, base_commits[is_committed[base_commits]]
+        )
+    metadata_ids = np.full(len(tables.commit_hashes), -1, dtype=np.int64)
+    metadata_ids[used_commits] = commit_metadata.commit_ids(
+        CommitRepoPair(
+            FullCommitHash(tables.commit_hashes[commit_id]),
+            tables.repository_names[tables.commit_repositories[commit_id]]
+        ) for commit_id in used_commits.tolist()
+    )
+
+    return _InteractionColumns(
+        tables.interaction_amounts,
+        metadata_ids[base_commits] if with_base_commits else
+        np.full(len(tables.interaction_amounts), -1, dtype=np.int64),
+        taint_interactions, metadata_ids[taint_commits]
+    )
+
+
+def __sum_amounts_per_degree(
+    degrees: np.ndarray, amounts: np.ndarray
+) -> tp.List[tp.Tuple[int, int]]:
+    """Sums up the amounts of interactions with the same degree, ordered by the
+    first occurrence of each degree."""
+    unique_degrees, first_indices, inverse = np.unique(
+        degrees, return_index=True, return_inverse=True
+    )
+    degree_amounts = np.zeros(len(unique_degrees), dtype=np.int64)
+    np.add.at(degree_amounts, inverse.reshape(-1), amounts)
+
+    return [(int(unique_degrees[idx]), int(degree_amounts[idx]))
+            for idx in np.argsort(first_indices, kind="stable")]
+
+
 def count_interacting_authors(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy
+    commit_metadata: CommitMetadataStore
 ) -> int:
     """
     Counts the number of unique interacting authors.
 
     Args:
         report: the blame report or diff
-        commit_lookup: function to look up commits
+        commit_metadata: metadata of the project's commits
 
     Returns:
         the number unique interacting authors in this report or diff
     """
-
-    def extract_interacting_authors(
-        interaction: BlameInstInteractions
-    ) -> tp.Iterable[str]:
-        return map_commits(
-            # Issue (se-sic/VaRA#647): improve author uniquifying
-            lambda c: tp.cast(str, c.author.name),
-            [btd.commit for btd in interaction.interacting_taints],
-            commit_lookup
-        )
-
-    return __count_elements(report, extract_interacting_authors)
+    columns = __interaction_columns(report, commit_metadata)
+    # Issue (se-sic/VaRA#647): improve author uniquifying
+    return len(
+        np.unique(commit_metadata.author_name_ids[columns.taint_commit_ids])
+    )
 
 
 def generate_degree_tuples(
@@ -807,7 +1374,7 @@ def generate_lib_dependent_degrees(
 
 def generate_author_degree_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy
+    commit_metadata: CommitMetadataStore
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples (author_degree, amount) where author_degree is
@@ -817,32 +1384,69 @@ def generate_author_degree_tuples(
 
     Args:
         report: the blame report
-        commit_lookup: function to look up commits
+        commit_metadata: metadata of the project's commits
 
     Returns:
         list of tuples (author_degree, amount)
     """
+    columns = __interaction_columns(report, commit_metadata)
 
-    degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
+    # Issue (se-sic/VaRA#647): improve author uniquifying
+    author_ids = commit_metadata.author_name_ids[columns.taint_commit_ids]
+    interaction_authors = np.unique(
+        columns.taint_interactions * len(commit_metadata.author_names) +
+        author_ids
+    ) // max(1, len(commit_metadata.author_names))
+    degrees = np.bincount(interaction_authors, minlength=len(columns.amounts))
 
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            author_list = map_commits(
-                # Issue (se-sic/VaRA#647): improve author uniquifying
-                lambda c: tp.cast(str, c.author.name),
-                [btd.commit for btd in interaction.interacting_taints],
-                commit_lookup
-            )
+    return __sum_amounts_per_degree(degrees, columns.amounts)
 
-            degree = len(set(author_list))
-            degree_dict[degree] += interaction.amount
 
-    return list(degree_dict.items())
+SegmentAggregateTy = tp.Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def __time_delta_distribution(
+    report: tp.Union[BlameReport,
+                     BlameReportDiff], commit_metadata: CommitMetadataStore,
+    bucket_size: int, aggregate_segments: SegmentAggregateTy
+) -> tp.List[tp.Tuple[int, int]]:
+    """
+    Buckets interactions by the time delta between their base commit and their
+    interacting commits.
+
+    ``aggregate_segments`` receives the time deltas of all interactions in
+    contiguous segments together with the start index of every segment and
+    returns one aggregated value per segment.
+    """
+    columns = __interaction_columns(
+        report, commit_metadata, with_base_commits=True
+    )
+    has_base_commit = columns.base_commit_ids >= 0
+
+    taint_mask = has_base_commit[columns.taint_interactions]
+    taint_interactions = columns.taint_interactions[taint_mask]
+    base_times = commit_metadata.commit_times[
+        columns.base_commit_ids[taint_interactions]]
+    taint_times = commit_metadata.commit_times[
+        columns.taint_commit_ids[taint_mask]]
+    # Same as the days of the timedelta between both commit times
+    time_deltas = np.abs((base_times - taint_times) // (24 * 60 * 60))
+
+    aggregated_deltas = np.zeros(len(columns.amounts), dtype=np.float64)
+    if len(time_deltas):
+        segment_starts = np.flatnonzero(np.diff(taint_interactions, prepend=-1))
+        aggregated_deltas[taint_interactions[segment_starts]
+                         ] = aggregate_segments(time_deltas, segment_starts)
+
+    buckets = np.rint(aggregated_deltas[has_base_commit] / bucket_size)
+    return __sum_amounts_per_degree(
+        buckets.astype(np.int64), columns.amounts[has_base_commit]
+    )
 
 
 def generate_time_delta_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int,
+    commit_metadata: CommitMetadataStore, bucket_size: int,
     aggregate_function: tp.Callable[[tp.Sequence[tp.Union[int, float]]],
                                     tp.Union[int, float]]
 ) -> tp.List[tp.Tuple[int, int]]:
@@ -855,7 +1459,7 @@ def generate_time_delta_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_metadata: metadata of the project's commits
         bucket_size: size of a time bucket in days
         aggregate_function: to aggregate the delta values of all
                             interacting commits
@@ -863,40 +1467,24 @@ def generate_time_delta_distribution_tuples(
     Returns:
         list of (degree, amount) tuples
     """
-    degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
-
-    for func_entry in report.function_entries:
-        for interaction in func_entry.interactions:
-            base_crp: CommitRepoPair = interaction.base_taint.commit
-            if base_crp.commit_hash == UNCOMMITTED_COMMIT_HASH:
-                continue
-
-            base_commit = commit_lookup(interaction.base_taint.commit)
-            base_c_time = datetime.utcfromtimestamp(base_commit.commit_time)
-
-            def translate_to_time_deltas2(
-                commit: pygit2.Commit,
-                base_time: datetime = base_c_time
-            ) -> int:
-                other_c_time = datetime.utcfromtimestamp(commit.commit_time)
-                return abs((base_time - other_c_time).days)
-
-            author_list = map_commits(
-                translate_to_time_deltas2,
-                [btd.commit for btd in interaction.interacting_taints],
-                commit_lookup
-            )
-
-            degree = aggregate_function(author_list) if author_list else 0
-            bucket = round(degree / bucket_size)
-            degree_dict[bucket] += interaction.amount
 
-    return list(degree_dict.items())
+    def aggregate_segments(
+        time_deltas: np.ndarray, segment_starts: np.ndarray
+    ) -> np.ndarray:
+        return np.array([
+            aggregate_function(segment.tolist())
+            for segment in np.split(time_deltas, segment_starts[1:])
+        ],
+                        dtype=np.float64)
+
+    return __time_delta_distribution(
+        report, commit_metadata, bucket_size, aggregate_segments
+    )
 
 
 def generate_avg_time_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int
+    commit_metadata: CommitMetadataStore, bucket_size: int
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples that represent the distribution of average time
@@ -906,20 +1494,30 @@ def generate_avg_time_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_metadata: metadata of the project's commits
         bucket_size: size of a time bucket in days
 
     Returns:
         list of (degree, avg_time) tuples
     """
-    return generate_time_delta_distribution_tuples(
-        report, commit_lookup, bucket_size, np.average
+
+    def average_segments(
+        time_deltas: np.ndarray, segment_starts: np.ndarray
+    ) -> np.ndarray:
+        segment_sizes = np.diff(segment_starts, append=len(time_deltas))
+        return tp.cast(
+            np.ndarray,
+            np.add.reduceat(time_deltas, segment_starts) / segment_sizes
+        )
+
+    return __time_delta_distribution(
+        report, commit_metadata, bucket_size, average_segments
     )
 
 
 def generate_max_time_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int
+    commit_metadata: CommitMetadataStore, bucket_size: int
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples that represent the distribution of maximal time
@@ -930,14 +1528,20 @@ def generate_max_time_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_metadata: metadata of the project's commits
         bucket_size: size of a time bucket in days
 
     Returns:
         list of (degree, max_time) tuples
     """
-    return generate_time_delta_distribution_tuples(
-        report, commit_lookup, bucket_size, max
+
+    def max_segments(
+        time_deltas: np.ndarray, segment_starts: np.ndarray
+    ) -> np.ndarray:
+        return np.maximum.reduceat(time_deltas, segment_starts)
+
+    return __time_delta_distribution(
+        report, commit_metadata, bucket_size, max_segments
     )
 
 
@@ -1,8 +1,52 @@
 """This modules handles auto discovering of experiments from the tool suite."""
 
+import typing as tp
+
+from benchbuild.experiment import ExperimentRegistry
+
 from varats import experiments as __EXPERIMENTS__
+from varats.utils.plugin_manifest import (
+    load_plugin_manifest,
+    LazyRegistry,
+    PluginEntry,
+)
+
+if tp.TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from varats.experiment.experiment_util import VersionExperiment
 
 
 def initialize_experiments() -> None:
     # Discover and initialize all Reports
     __EXPERIMENTS__.discover()
+
+
+def get_experiment_entries() -> tp.Dict[str, PluginEntry]:
+    """Look up the experiments of the tool suite by their name without
+    importing them."""
+    return {
+        entry.name: entry
+        for entry in load_plugin_manifest(__EXPERIMENTS__).
+        subclasses(["Experiment", "VersionExperiment"])
+        if entry.name is not None
+    }
+
+
+def get_experiment_types(
+    include_name: tp.Callable[[str], bool] = lambda name: True
+) -> tp.Mapping[str, tp.Type['VersionExperiment']]:
+    """
+    Look up the experiments of the tool suite by their name.
+
+    Experiment modules are only imported when an experiment is accessed.
+
+    Args:
+        include_name: selects the experiments that are included
+
+    Returns:
+        mapping from experiment name to experiment
+    """
+    return LazyRegistry(
+        ExperimentRegistry.experiments, get_experiment_entries(),
+        initialize_experiments, include_name
+    )
@@ -1,20 +1,25 @@
 """Module for feature performance precision experiments that evaluate
 measurement support of vara."""
+import math
 import tempfile
 import textwrap
 import typing as tp
 from abc import abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from time import sleep
+from statistics import mean, stdev
+from time import perf_counter
 
 import benchbuild.extensions as bb_ext
 from benchbuild.command import cleanup, ProjectCommand
 from benchbuild.environments.domain.declarative import ContainerImage
 from benchbuild.utils import actions
 from benchbuild.utils.actions import StepResult
-from benchbuild.utils.cmd import time, cp, sudo, bpftrace
+from benchbuild.utils.cmd import time, sudo, bpftrace
 from plumbum import local, BG
 from plumbum.commands.modifiers import Future
+from scipy import stats
 
 from varats.data.reports.performance_influence_trace_report import (
     PerfInfluenceTraceReportAggregate,
@@ -29,7 +34,15 @@ from varats.experiment.experiment_util import (
     get_config_patch_steps,
 )
 from varats.experiment.steps.patch import ApplyPatch, RevertPatch
+from varats.experiment.steps.patched_variants import (
+    CompilePatchedVariants,
+    create_patched_variant,
+)
 from varats.experiment.steps.recompile import ReCompile
+from varats.experiment.tracer_util import (
+    create_bpftrace_script_with_ready_signal,
+    wait_for_tracer,
+)
 from varats.experiment.workload_util import WorkloadCategory, workload_commands
 from varats.experiments.vara.feature_experiment import (
     FeatureExperiment,
@@ -38,14 +51,19 @@ from varats.experiments.vara.feature_experiment import (
 from varats.project.project_domain import ProjectDomains
 from varats.project.project_util import BinaryType, ProjectBinaryWrapper
 from varats.project.varats_project import VProject
-from varats.provider.patch.patch_provider import PatchProvider
+from varats.provider.patch.patch_provider import Patch, PatchProvider
 from varats.report.gnu_time_report import TimeReportAggregate
+from varats.report.measurement_precision import (
+    MeasurementPrecision,
+    store_measurement_precision,
+)
 from varats.report.multi_patch_report import MultiPatchReport
 from varats.report.report import ReportSpecification
 from varats.report.tef_report import TEFReportAggregate
 from varats.tools.research_tools.vara import VaRA
 from varats.utils.config import get_current_config_id
 from varats.utils.git_util import ShortCommitHash
+from varats.utils.settings import vara_cfg
 
 REPS = 3
 
@@ -112,6 +130,103 @@ def get_threshold(project: VProject) -> int:
     return 100
 
 
+class AdaptiveRepetitions():
+    """
+    Repetitions of the workloads of a measurement step.
+
+    Workloads are repeated at least ``min_reps`` and at most ``max_reps``
+    times. In between, the repetitions stop as soon as the confidence interval
+    of the mean wall-clock time of every workload is within
+    ``target_precision`` of the mean. Without a target precision, the workloads
+    are repeated exactly ``max_reps`` times.
+
+    Args:
+        min_reps: minimal number of repetitions
+        max_reps: maximal number of repetitions
+        target_precision: relative half-width of the confidence intervals at
+                          which the repetitions stop
+    """
+
+    CONFIDENCE = 0.95
+
+    def __init__(
+        self,
+        min_reps: int,
+        max_reps: int,
+        target_precision: tp.Optional[float] = None
+    ) -> None:
+        # confidence intervals require at least two measurements
+        self.__min_reps = min_reps if target_precision is None else max(
+            2, min_reps
+        )
+        self.__max_reps = max(self.__min_reps, max_reps)
+        self.__target_precision = target_precision
+        self.__samples: tp.DefaultDict[str, tp.List[float]] = defaultdict(list)
+        self.__repetitions = 0
+
+    @classmethod
+    def from_config(cls, reps: int) -> 'AdaptiveRepetitions':
+        """Create the repetitions configured in ``vara_cfg()["experiment"]``,
+        which default to exactly ``reps`` repetitions."""
+        experiment_cfg = vara_cfg()["experiment"]
+        target_precision = experiment_cfg["repetition_target_precision"].value
+        if target_precision is None:
+            return cls(reps, reps)
+
+        return cls(
+            int(experiment_cfg["min_repetitions"].value),
+            int(experiment_cfg["max_repetitions"].value),
+            float(target_precision)
+        )
+
+    def __iter__(self) -> tp.Iterator[int]:
+        while self.__repetitions < self.__min_reps or (
+            self.__repetitions < self.__max_reps and
+            not self.is_precise_enough()
+        ):
+            yield self.__repetitions
+            self.__repetitions += 1
+
+    @contextmanager
+    def measure(self, workload: str) -> tp.Iterator[None]:
+        """Measure the wall-clock time of one run of a workload."""
+        start = perf_counter()
+        yield
+        self.__samples[workload].append(perf_counter() - start)
+
+    def workload_precision(self, workload: str) -> float:
+        """Relative half-width of the confidence interval of the mean wall-clock
+        time of a workload."""
+        samples = self.__samples[workload]
+        if len(samples) < 2 or mean(samples) == 0:
+            return math.inf
+
+        t_value = stats.t.ppf((1 + self.CONFIDENCE) / 2, len(samples) - 1)
+        return float(
+            t_value * stdev(samples) / math.sqrt(len(samples)) / mean(samples)
+        )
+
+    def is_precise_enough(self) -> bool:
+        """Checks if the mean wall-clock times of all workloads are known with
+        the target precision."""
+        if self.__target_precision is None:
+            return False
+
+        return all(
+            self.workload_precision(workload) <= self.__target_precision
+            for workload in self.__samples
+        )
+
+    def precision(self) -> MeasurementPrecision:
+        """The precision achieved by the completed repetitions."""
+        return MeasurementPrecision(
+            self.__repetitions, self.CONFIDENCE, {
+                workload: self.workload_precision(workload)
+                for workload in self.__samples
+            }
+        )
+
+
 class AnalysisProjectStepBase(OutputFolderStep):
     """Base class for project steps."""
 
@@ -189,7 +304,8 @@ class RunGenTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
         with local.cwd(local.path(self.project.builddir)):
             zip_tmp_dir = tmp_dir / self._file_name
             with ZippedReportFolder(zip_tmp_dir) as reps_tmp_dir:
-                for rep in range(0, self._reps):
+                repetitions = AdaptiveRepetitions.from_config(self._reps)
+                for rep in repetitions:
                     for prj_command in perf_prec_workload_commands(
                         self.project, self._binary
                     ):
@@ -206,7 +322,16 @@ class RunGenTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
                             )
 
                             with cleanup(prj_command):
-                                pb_cmd(retcode=self._binary.valid_exit_codes)
+                                with repetitions.measure(
+                                    prj_command.command.label
+                                ):
+                                    pb_cmd(
+                                        retcode=self._binary.valid_exit_codes
+                                    )
+
+                store_measurement_precision(
+                    Path(reps_tmp_dir), repetitions.precision()
+                )
 
         return StepResult.OK
 
@@ -233,7 +358,8 @@ class RunBPFTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
             zip_tmp_dir = tmp_dir / self._file_name
             with tempfile.TemporaryDirectory() as non_nfs_tmp_dir:
                 with ZippedReportFolder(zip_tmp_dir) as reps_tmp_dir:
-                    for rep in range(0, self._reps):
+                    repetitions = AdaptiveRepetitions.from_config(self._reps)
+                    for rep in repetitions:
                         for prj_command in perf_prec_workload_commands(
                             self.project, self._binary
                         ):
@@ -268,14 +394,22 @@ class RunBPFTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
                                         "Running example "
                                         f"{prj_command.command.label}"
                                     )
-                                    pb_cmd(
-                                        retcode=self._binary.valid_exit_codes
-                                    )
+                                    with repetitions.measure(
+                                        prj_command.command.label
+                                    ):
+                                        pb_cmd(
+                                            retcode=self._binary.
+                                            valid_exit_codes
+                                        )
 
                                 # wait for bpf script to exit
                                 if bpf_runner:
                                     bpf_runner.wait()
 
+                    store_measurement_precision(
+                        Path(reps_tmp_dir), repetitions.precision()
+                    )
+
         return StepResult.OK
 
     @staticmethod
@@ -288,20 +422,23 @@ class RunBPFTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
             "share/vara/perf_bpf_tracing/RawUsdtTefMarker.bt"
         )
         # Store bpftrace script in a local tmp dir that is not on nfs
-        bpftrace_script_location = non_nfs_tmp_dir / "RawUsdtTefMarker.bt"
-        cp(orig_bpftrace_script_location, bpftrace_script_location)
+        bpftrace_script_location, ready_file = \
+            create_bpftrace_script_with_ready_signal(
+                orig_bpftrace_script_location, non_nfs_tmp_dir
+            )
 
         bpftrace_script = bpftrace["-o", report_file, "--no-warnings", "-q",
-                                   bpftrace_script_location, binary]
+                                   "--unsafe", bpftrace_script_location, binary]
         bpftrace_script = bpftrace_script.with_env(BPFTRACE_PERF_RB_PAGES=8192)
 
         # Assertion: Can be run without sudo password prompt.
         bpftrace_cmd = sudo[bpftrace_script]
 
         bpftrace_runner = bpftrace_cmd & BG
-        # give bpftrace time to start up, requires more time than regular USDT
-        # script because a large number of probes increases the startup time
-        sleep(10)
+        # wait until bpftrace is attached, which takes longer than for the
+        # regular USDT script because a large number of probes increases the
+        # startup time
+        wait_for_tracer(bpftrace_runner, ready_file, timeout=120)
         return bpftrace_runner
 
 
@@ -326,7 +463,8 @@ class RunBCCTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
         with local.cwd(local.path(self.project.builddir)):
             zip_tmp_dir = tmp_dir / self._file_name
             with ZippedReportFolder(zip_tmp_dir) as reps_tmp_dir:
-                for rep in range(0, self._reps):
+                repetitions = AdaptiveRepetitions.from_config(self._reps)
+                for rep in repetitions:
                     for prj_command in perf_prec_workload_commands(
                         self.project, self._binary
                     ):
@@ -350,12 +488,21 @@ class RunBCCTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
                             )
 
                             with cleanup(prj_command):
-                                pb_cmd(retcode=self._binary.valid_exit_codes)
+                                with repetitions.measure(
+                                    prj_command.command.label
+                                ):
+                                    pb_cmd(
+                                        retcode=self._binary.valid_exit_codes
+                                    )
 
                             # wait for bpf script to exit
                             if bpf_runner:
                                 bpf_runner.wait()
 
+                store_measurement_precision(
+                    Path(reps_tmp_dir), repetitions.precision()
+                )
+
         return StepResult.OK
 
     @staticmethod
@@ -374,10 +521,74 @@ class RunBCCTracedWorkloads(AnalysisProjectStepBase):  # type: ignore
         bcc_cmd = sudo[bcc_cmd]
 
         bcc_runner = bcc_cmd & BG
-        sleep(3)  # give bcc script time to start up
+        # give bcc script time to start up, it does not signal readiness
+        wait_for_tracer(bcc_runner, None, timeout=3)
         return bcc_runner
 
 
+def setup_patch_steps(
+    experiment: FeatureExperiment, project: VProject,
+    patches: tp.Iterable[Patch],
+    create_analysis_step: tp.Callable[[VProject, str], actions.Step]
+) -> tp.Tuple[actions.Step, tp.List[actions.Step]]:
+    """
+    Sets up the steps that compile the project and the steps that analyze the
+    patched variants of it.
+
+    If more than one build slot is configured in
+    ``vara_cfg()["experiment"]["patched_variant_build_slots"]``, every patched
+    variant is built in its own build directory and all variants are compiled
+    in parallel before any of them is analyzed. Otherwise, the patches are
+    applied to the project, recompiled, and reverted one after another.
+
+    Args:
+        experiment: the experiment that analyzes the project
+        project: the project to analyze
+        patches: the patches to analyze
+        create_analysis_step: creates the analysis step for a project or
+                              variant that writes to the given file name
+
+    Returns:
+        the compile step and the analysis steps of the patched variants
+    """
+    build_slots = int(vara_cfg()["experiment"]["patched_variant_build_slots"])
+    patch_steps: tp.List[actions.Step] = []
+
+    if build_slots <= 1:
+        for patch in patches:
+            patch_steps.append(ApplyPatch(project, patch))
+            patch_steps.append(ReCompile(project))
+            patch_steps.append(
+                create_analysis_step(
+                    project,
+                    MultiPatchReport.create_patched_report_name(
+                        patch, "rep_measurements"
+                    )
+                )
+            )
+            patch_steps.append(RevertPatch(project, patch))
+
+        return actions.Compile(project), patch_steps
+
+    variants = [create_patched_variant(project, patch) for patch in patches]
+    for variant in variants:
+        # Add own error handler to the compile step of the variant.
+        variant.project.compile = get_default_compile_error_wrapped(
+            experiment.get_handle(), variant.project,
+            experiment.REPORT_SPEC.main_report
+        )
+        patch_steps.append(
+            create_analysis_step(
+                variant.project,
+                MultiPatchReport.create_patched_report_name(
+                    variant.patch, "rep_measurements"
+                )
+            )
+        )
+
+    return CompilePatchedVariants(project, variants, build_slots), patch_steps
+
+
 AnalysisProjectStepBaseTy = tp.TypeVar(
     "AnalysisProjectStepBaseTy", bound=AnalysisProjectStepBase
 )
@@ -435,24 +646,14 @@ def setup_actions_for_vara_experiment(
         ShortCommitHash(project.version_of_primary)
     )[IDENTIFIER_PATCH_TAG]
 
-    patch_steps = []
-    for patch in patches:
-        patch_steps.append(ApplyPatch(project, patch))
-        patch_steps.append(ReCompile(project))
-        patch_steps.append(
-            analysis_step(
-                project,
-                binary,
-                file_name=MultiPatchReport.create_patched_report_name(
-                    patch, "rep_measurements"
-                )
-            )
-        )
-        patch_steps.append(RevertPatch(project, patch))
+    compile_step, patch_steps = setup_patch_steps(
+        experiment, project, patches,
+        lambda prj, file_name: analysis_step(prj, binary, file_name=file_name)
+    )
 
     analysis_actions = get_config_patch_steps(project)
 
-    analysis_actions.append(actions.Compile(project))
+    analysis_actions.append(compile_step)
     analysis_actions.append(
         ZippedExperimentSteps(
             result_filepath, [
@@ -607,7 +808,8 @@ class RunBlackBoxBaseline(OutputFolderStep):  # type: ignore
         with local.cwd(local.path(self.project.builddir)):
             zip_tmp_dir = tmp_dir / self.__file_name
             with ZippedReportFolder(zip_tmp_dir) as reps_tmp_dir:
-                for rep in range(0, self.__reps):
+                repetitions = AdaptiveRepetitions.from_config(self.__reps)
+                for rep in repetitions:
                     for prj_command in perf_prec_workload_commands(
                         self.project, self.__binary
                     ):
@@ -624,7 +826,12 @@ class RunBlackBoxBaseline(OutputFolderStep):  # type: ignore
                                     time["-v", "-o", time_report_file],
                                     project=self.project
                                 )
-                            pb_cmd(retcode=self.__binary.valid_exit_codes)
+                            with repetitions.measure(prj_command.command.label):
+                                pb_cmd(retcode=self.__binary.valid_exit_codes)
+
+                store_measurement_precision(
+                    Path(reps_tmp_dir), repetitions.precision()
+                )
 
         return StepResult.OK
 
@@ -684,25 +891,14 @@ class BlackBoxBaselineRunner(FeatureExperiment, shorthand="BBBase"):
         )[IDENTIFIER_PATCH_TAG]
         print(f"{patches=}")
 
-        patch_steps = []
-        for patch in patches:
-            print(f"Got patch with path: {patch.path}")
-            patch_steps.append(ApplyPatch(project, patch))
-            patch_steps.append(ReCompile(project))
-            patch_steps.append(
-                RunBlackBoxBaseline(
-                    project,
-                    binary,
-                    file_name=MPRTimeReportAggregate.create_patched_report_name(
-                        patch, "rep_measurements"
-                    )
-                )
-            )
-            patch_steps.append(RevertPatch(project, patch))
+        compile_step, patch_steps = setup_patch_steps(
+            self, project, patches, lambda prj, file_name:
+            RunBlackBoxBaseline(prj, binary, file_name=file_name)
+        )
 
         analysis_actions = get_config_patch_steps(project)
 
-        analysis_actions.append(actions.Compile(project))
+        analysis_actions.append(compile_step)
         analysis_actions.append(
             ZippedExperimentSteps(
                 result_filepath, [
@@ -754,7 +950,8 @@ class RunGenTracedWorkloadsOverhead(AnalysisProjectStepBase):  # type: ignore
     def run_traced_code(self, tmp_dir: Path) -> StepResult:
         """Runs the binary with the embedded tracing code."""
         with local.cwd(local.path(self.project.builddir)):
-            for rep in range(0, self._reps):
+            repetitions = AdaptiveRepetitions.from_config(self._reps)
+            for rep in repetitions:
                 for prj_command in perf_prec_workload_commands(
                     self.project, self._binary
                 ):
@@ -778,7 +975,10 @@ class RunGenTracedWorkloadsOverhead(AnalysisProjectStepBase):  # type: ignore
                                     time["-v", "-o", time_report_file],
                                     project=self.project
                                 )
-                            pb_cmd(retcode=self._binary.valid_exit_codes)
+                            with repetitions.measure(prj_command.command.label):
+                                pb_cmd(retcode=self._binary.valid_exit_codes)
+
+            store_measurement_precision(tmp_dir, repetitions.precision())
 
         return StepResult.OK
 
@@ -813,7 +1013,8 @@ class RunBPFTracedWorkloadsOverhead(AnalysisProjectStepBase):  # type: ignore
         """Runs the binary with the embedded tracing code."""
         with local.cwd(local.path(self.project.builddir)):
             with tempfile.TemporaryDirectory() as non_nfs_tmp_dir:
-                for rep in range(0, self._reps):
+                repetitions = AdaptiveRepetitions.from_config(self._reps)
+                for rep in repetitions:
                     for prj_command in perf_prec_workload_commands(
                         self.project, self._binary
                     ):
@@ -852,12 +1053,19 @@ class RunBPFTracedWorkloadsOverhead(AnalysisProjectStepBase):  # type: ignore
                                     "Running example "
                                     f"{prj_command.command.label}"
                                 )
-                                pb_cmd(retcode=self._binary.valid_exit_codes)
+                                with repetitions.measure(
+                                    prj_command.command.label
+                                ):
+                                    pb_cmd(
+                                        retcode=self._binary.valid_exit_codes
+                                    )
 
                             # wait for bpf script to exit
                             if bpf_runner:
                                 bpf_runner.wait()
 
+                store_measurement_precision(tmp_dir, repetitions.precision())
+
         return StepResult.OK
 
 
@@ -890,7 +1098,8 @@ class RunBCCTracedWorkloadsOverhead(AnalysisProjectStepBase):  # type: ignore
     def run_traced_code(self, tmp_dir: Path) -> StepResult:
         """Runs the binary with the embedded tracing code."""
         with local.cwd(local.path(self.project.builddir)):
-            for rep in range(0, self._reps):
+            repetitions = AdaptiveRepetitions.from_config(self._reps)
+            for rep in repetitions:
                 for prj_command in perf_prec_workload_commands(
                     self.project, self._binary
                 ):
@@ -920,12 +1129,17 @@ class RunBCCTracedWorkloadsOverhead(AnalysisProjectStepBase):  # type: ignore
                         )
 
                         with cleanup(prj_command):
-                            timed_pb_cmd(retcode=self._binary.valid_exit_codes)
+                            with repetitions.measure(prj_command.command.label):
+                                timed_pb_cmd(
+                                    retcode=self._binary.valid_exit_codes
+                                )
 
                         # wait for bpf script to exit
                         if bpf_runner:
                             bpf_runner.wait()
 
+            store_measurement_precision(tmp_dir, repetitions.precision())
+
         return StepResult.OK
 
 
@@ -1113,7 +1327,8 @@ class RunBlackBoxBaselineOverhead(OutputFolderStep):  # type: ignore
     def run_traced_code(self, tmp_dir: Path) -> StepResult:
         """Runs the binary with the embedded tracing code."""
         with local.cwd(local.path(self.project.builddir)):
-            for rep in range(0, self.__reps):
+            repetitions = AdaptiveRepetitions.from_config(self.__reps)
+            for rep in repetitions:
                 for prj_command in perf_prec_workload_commands(
                     self.project, self.__binary
                 ):
@@ -1129,7 +1344,10 @@ class RunBlackBoxBaselineOverhead(OutputFolderStep):  # type: ignore
                             project=self.project
                         )
 
-                        pb_cmd(retcode=self.__binary.valid_exit_codes)
+                        with repetitions.measure(prj_command.command.label):
+                            pb_cmd(retcode=self.__binary.valid_exit_codes)
+
+            store_measurement_precision(tmp_dir, repetitions.precision())
 
         return StepResult.OK
 
@@ -1,9 +1,9 @@
 """Multiple experiments for tracing feature performance using VaRA's TEF and
 USDT instrumentation."""
+import tempfile
 import typing as tp
 from enum import Enum
 from pathlib import Path
-from time import sleep
 
 import benchbuild as bb
 from benchbuild.command import cleanup
@@ -18,6 +18,10 @@ from varats.experiment.experiment_util import (
     ZippedReportFolder,
     create_new_success_result_filepath,
 )
+from varats.experiment.tracer_util import (
+    create_bpftrace_script_with_ready_signal,
+    wait_for_tracer,
+)
 from varats.experiment.workload_util import workload_commands, WorkloadCategory
 from varats.experiments.vara.feature_experiment import (
     FeatureExperiment,
@@ -124,7 +128,8 @@ class TraceFeaturePerfAndTime(ProjectStep):  # type: ignore
             # execute and trace binary
             with ZippedReportFolder(
                 time_report_agg.full_path()
-            ) as time_report_dir, local.cwd(self.project.builddir):
+            ) as time_report_dir, tempfile.TemporaryDirectory(
+            ) as tracer_tmp_dir, local.cwd(self.project.builddir):
                 for i in range(self.num_iterations):
                     print(
                         f"Binary={binary.name} Progress "
@@ -163,7 +168,8 @@ class TraceFeaturePerfAndTime(ProjectStep):  # type: ignore
                             if self.bpf_prog_type is BPFProgType.BPFTRACE:
                                 bpf_runner = self.attach_usdt_raw_tracing(
                                     tef_report.full_path(),
-                                    self.project.source_of_primary / binary.path
+                                    self.project.source_of_primary /
+                                    binary.path, Path(tracer_tmp_dir)
                                 )
                         elif self.instrumentation is FeatureInstrType.USDT:
                             if self.bpf_prog_type is BPFProgType.BCC:
@@ -174,7 +180,8 @@ class TraceFeaturePerfAndTime(ProjectStep):  # type: ignore
                             elif self.bpf_prog_type is BPFProgType.BPFTRACE:
                                 bpf_runner = self.attach_usdt_bpftrace(
                                     tef_report.full_path(),
-                                    self.project.source_of_primary / binary.path
+                                    self.project.source_of_primary /
+                                    binary.path, Path(tracer_tmp_dir)
                                 )
 
                         # run binary with workload in foreground
@@ -203,17 +210,23 @@ class TraceFeaturePerfAndTime(ProjectStep):  # type: ignore
         bcc_cmd = numactl["--cpunodebind=0", "--membind=0", bcc_cmd]
 
         bcc_runner = bcc_cmd & BG
-        sleep(3)  # give bcc script time to start up
+        # give bcc script time to start up, it does not signal readiness
+        wait_for_tracer(bcc_runner, None, timeout=3)
         return bcc_runner
 
     @staticmethod
-    def attach_usdt_bpftrace(report_file: Path, binary: Path) -> Future:
+    def attach_usdt_bpftrace(
+        report_file: Path, binary: Path, tmp_dir: Path
+    ) -> Future:
         """Attach bpftrace script to binary to activate USDT probes."""
-        bpftrace_script_location = Path(
-            VaRA.install_location(),
-            "share/vara/perf_bpf_tracing/UsdtTefMarker.bt"
-        )
-        bpftrace_script = bpftrace["-o", report_file, "-q",
+        bpftrace_script_location, ready_file = \
+            create_bpftrace_script_with_ready_signal(
+                Path(
+                    VaRA.install_location(),
+                    "share/vara/perf_bpf_tracing/UsdtTefMarker.bt"
+                ), tmp_dir
+            )
+        bpftrace_script = bpftrace["-o", report_file, "-q", "--unsafe",
                                    bpftrace_script_location, binary]
         bpftrace_script = bpftrace_script.with_env(BPFTRACE_PERF_RB_PAGES=4096)
 
@@ -222,17 +235,22 @@ class TraceFeaturePerfAndTime(ProjectStep):  # type: ignore
         bpftrace_cmd = numactl["--cpunodebind=0", "--membind=0", bpftrace_cmd]
 
         bpftrace_runner = bpftrace_cmd & BG
-        sleep(3)  # give bpftrace time to start up
+        wait_for_tracer(bpftrace_runner, ready_file, timeout=60)
         return bpftrace_runner
 
     @staticmethod
-    def attach_usdt_raw_tracing(report_file: Path, binary: Path) -> Future:
+    def attach_usdt_raw_tracing(
+        report_file: Path, binary: Path, tmp_dir: Path
+    ) -> Future:
         """Attach bpftrace script to binary to activate raw USDT probes."""
-        bpftrace_script_location = Path(
-            VaRA.install_location(),
-            "share/vara/perf_bpf_tracing/RawUsdtTefMarker.bt"
-        )
-        bpftrace_script = bpftrace["-o", report_file, "-q",
+        bpftrace_script_location, ready_file = \
+            create_bpftrace_script_with_ready_signal(
+                Path(
+                    VaRA.install_location(),
+                    "share/vara/perf_bpf_tracing/RawUsdtTefMarker.bt"
+                ), tmp_dir
+            )
+        bpftrace_script = bpftrace["-o", report_file, "-q", "--unsafe",
                                    bpftrace_script_location, binary]
         bpftrace_script = bpftrace_script.with_env(BPFTRACE_PERF_RB_PAGES=4096)
 
@@ -241,9 +259,10 @@ class TraceFeaturePerfAndTime(ProjectStep):  # type: ignore
         bpftrace_cmd = numactl["--cpunodebind=0", "--membind=0", bpftrace_cmd]
 
         bpftrace_runner = bpftrace_cmd & BG
-        # give bpftrace time to start up, requires more time than regular USDT
-        # script because a large number of probes increases the startup time
-        sleep(10)
+        # wait until bpftrace is attached, which takes longer than for the
+        # regular USDT script because a large number of probes increases the
+        # startup time
+        wait_for_tracer(bpftrace_runner, ready_file, timeout=120)
         return bpftrace_runner
 
 
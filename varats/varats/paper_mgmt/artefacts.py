@@ -9,13 +9,25 @@ Typically, a paper config has a file ``artefacts.yaml`` that manages artefact
 definitions.
 """
 import abc
+import hashlib
+import json
 import logging
+import os
+import time
+import traceback
 import typing as tp
 from abc import ABC
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import lru_cache
 from pathlib import Path
 
 from varats.base.version_header import VersionHeader
+from varats.data.databases.evaluationdatabase import shared_databases
+from varats.mapping.commit_map import shared_commit_maps
+from varats.paper.case_study import CaseStudy
+from varats.paper.paper_config import get_paper_config
+from varats.revision.revisions import get_result_file_catalog
+from varats.utils.filesystem_util import atomic_write
 from varats.utils.settings import vara_cfg
 from varats.utils.yaml_util import load_yaml, store_as_yaml
 
@@ -149,6 +161,148 @@ class Artefact(ABC):
             a list of file info objects
         """
 
+    def get_project_names(self) -> tp.Set[str]:
+        """
+        Retrieve the names of the projects whose data this artefact uses.
+
+        Artefacts that use the same projects are generated by the same process,
+        so they can share loaded data.
+
+        Returns:
+            the project names, or an empty set if they are unknown
+        """
+        return set()
+
+    def get_input_files(self) -> tp.List[Path]:
+        """
+        Retrieve the files the generated artefact depends on.
+
+        These are the case study files and the result files of the projects
+        this artefact uses. If the projects are unknown, the files of all
+        projects of the current paper config are used.
+
+        Subclasses should first call this function on ``super()`` and then
+        extend the returned list with their own input files.
+
+        Returns:
+            the paths of the input files
+        """
+        paper_config = get_paper_config()
+        project_names = self.get_project_names() or {
+            case_study.project_name
+            for case_study in paper_config.get_all_case_studies()
+        }
+
+        input_files: tp.List[Path] = []
+        for project_name in sorted(project_names):
+            input_files.extend(
+                sorted(paper_config.path.glob(f"{project_name}_*.case_study"))
+            )
+            input_files.extend(
+                sorted(
+                    entry.report_filepath.full_path()
+                    for entry in get_result_file_catalog(project_name).entries()
+                )
+            )
+        return input_files
+
+    def get_input_fingerprint(self) -> str:
+        """
+        Compute a fingerprint of everything the generated artefact depends on,
+        i.e., the artefact definition and the path, size, and modification time
+        of all its :func:`input files<get_input_files>`.
+
+        Returns:
+            the fingerprint as hex string
+        """
+        fingerprint = hashlib.sha256(
+            json.dumps(self.get_dict(), sort_keys=True, default=str).encode()
+        )
+        for input_file in self.get_input_files():
+            try:
+                file_stat = input_file.stat()
+            except FileNotFoundError:
+                continue
+            fingerprint.update(
+                f"{input_file}\0{file_stat.st_size}\0"
+                f"{file_stat.st_mtime_ns}\n".encode()
+            )
+        return fingerprint.hexdigest()
+
+
+def get_case_study_project_names(
+    kwargs: tp.Mapping[str, tp.Any]
+) -> tp.Set[str]:
+    """
+    Collect the projects of the case studies in the arguments of an artefact.
+
+    Args:
+        kwargs: artefact-specific arguments, e.g., the plot arguments
+
+    Returns:
+        the names of the projects of all case studies in the arguments
+    """
+    project_names: tp.Set[str] = set()
+    for value in kwargs.values():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        project_names.update(
+            case_study.project_name
+            for case_study in values
+            if isinstance(case_study, CaseStudy)
+        )
+    return project_names
+
+
+class ArtefactGenerationResult():
+    """
+    Outcome of generating a single artefact.
+
+    Args:
+        name: name of the artefact
+        duration: wall-clock time spent on the artefact in seconds
+        error: description of the error if the generation failed
+        up_to_date: whether the artefact was not generated again because its
+                    inputs did not change
+    """
+
+    def __init__(
+        self,
+        name: str,
+        duration: float,
+        error: tp.Optional[str] = None,
+        up_to_date: bool = False
+    ) -> None:
+        self.__name = name
+        self.__duration = duration
+        self.__error = error
+        self.__up_to_date = up_to_date
+
+    @property
+    def name(self) -> str:
+        """Name of the generated artefact."""
+        return self.__name
+
+    @property
+    def duration(self) -> float:
+        """Time spent on generating the artefact in seconds."""
+        return self.__duration
+
+    @property
+    def error(self) -> tp.Optional[str]:
+        """Description of the error if the generation failed."""
+        return self.__error
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the artefact was generated successfully."""
+        return self.__error is None
+
+    @property
+    def up_to_date(self) -> bool:
+        """Whether the artefact was skipped because its inputs did not
+        change."""
+        return self.__up_to_date
+
 
 _ARTEFACTS_FILE_NAME = 'artefacts.yaml'
 _ARTEFACTS_FILE_VERSION = 2
@@ -279,6 +433,214 @@ def load_artefacts_from_file(file_path: Path) -> Artefacts:
     return Artefacts(file_path, artefacts)
 
 
+def _group_artefacts_by_project(
+    artefacts: tp.Iterable[Artefact]
+) -> tp.List[tp.List[Artefact]]:
+    """Group artefacts that (transitively) share a project, largest groups
+    first."""
+    groups: tp.List[tp.Tuple[tp.Set[str], tp.List[Artefact]]] = []
+    positions: tp.Dict[str, int] = {}
+    for position, artefact in enumerate(artefacts):
+        positions[artefact.name] = position
+        project_names = set(artefact.get_project_names())
+        members: tp.List[Artefact] = []
+        for group in [group for group in groups if project_names & group[0]]:
+            groups.remove(group)
+            project_names |= group[0]
+            members.extend(group[1])
+        groups.append((project_names, [*members, artefact]))
+
+    grouped_artefacts = [
+        sorted(members, key=lambda artefact: positions[artefact.name])
+        for _, members in groups
+    ]
+    return sorted(grouped_artefacts, key=len, reverse=True)
+
+
+def _generate_artefact_group(
+    artefacts: tp.Iterable[Artefact],
+    progress: tp.Optional["Progress"] = None
+) -> tp.Iterator[ArtefactGenerationResult]:
+    with shared_commit_maps(), shared_databases():
+        for artefact in artefacts:
+            LOG.info(
+                f"Generating artefact {artefact.name} in location "
+                f"{artefact.output_dir}"
+            )
+            start = time.perf_counter()
+            error = None
+            try:
+                artefact.generate_artefact(progress)
+            except Exception:  # pylint: disable=broad-except
+                error = traceback.format_exc()
+            yield ArtefactGenerationResult(
+                artefact.name,
+                time.perf_counter() - start, error
+            )
+
+
+def _initialize_artefact_worker() -> None:
+    """Register the plugins in worker processes that are not forked."""
+    # pylint: disable=import-outside-toplevel
+    from varats.data.discover_reports import initialize_reports
+    from varats.projects.discover_projects import initialize_projects
+    from varats.ts_utils.cli_util import initialize_logger_config
+
+    initialize_logger_config()
+    initialize_projects()
+    initialize_reports()
+    initialize_artefact_types()
+
+
+def _generate_artefact_group_by_name(
+    artefact_names: tp.List[str]
+) -> tp.List[ArtefactGenerationResult]:
+    """Generate artefacts of the current paper config in a worker process."""
+    artefacts = load_artefacts(get_paper_config())
+    return list(
+        _generate_artefact_group(
+            tp.cast(Artefact, artefacts.get_artefact(name))
+            for name in artefact_names
+        )
+    )
+
+
+_FINGERPRINTS_FILE_NAME = '.artefact_fingerprints.json'
+
+
+def _load_artefact_fingerprints() -> tp.Dict[str, str]:
+    """Load the input fingerprints of the last successful generation of each
+    artefact."""
+    try:
+        with open(
+            Artefact.base_output_dir() / _FINGERPRINTS_FILE_NAME, "r"
+        ) as fingerprints_file:
+            fingerprints = json.load(fingerprints_file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(fingerprints, dict):
+        return {}
+    return {str(name): str(value) for name, value in fingerprints.items()}
+
+
+def _store_artefact_fingerprints(fingerprints: tp.Dict[str, str]) -> None:
+    fingerprints_path = Artefact.base_output_dir() / _FINGERPRINTS_FILE_NAME
+    fingerprints_path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(fingerprints_path, "w") as fingerprints_file:
+        json.dump(fingerprints, fingerprints_file, indent=2, sort_keys=True)
+
+
+def _generated_files_exist(artefact: Artefact) -> bool:
+    file_infos = artefact.get_artefact_file_infos()
+    return bool(file_infos) and all(
+        (artefact.output_dir / file_info.file_name).exists()
+        for file_info in file_infos
+    )
+
+
+def generate_artefacts(
+    artefacts: tp.Iterable[Artefact],
+    jobs: tp.Optional[int] = None,
+    progress: tp.Optional["Progress"] = None,
+    force: bool = False
+) -> tp.List[ArtefactGenerationResult]:
+    """
+    Generate artefacts of the current paper config.
+
+    An artefact is only generated if its
+    :func:`input fingerprint<Artefact.get_input_fingerprint>` changed since it
+    was generated the last time, or if its generated files are missing.
+
+    Artefacts that use the same projects are generated one after another by the
+    same process, which shares loaded commit maps and database data between
+    them. These groups of artefacts are generated in parallel by ``jobs``
+    processes. Failing artefacts do not stop the generation of the others.
+
+    Args:
+        artefacts: the artefacts to generate; they must be part of the
+                   artefacts of the current paper config
+        jobs: number of processes to use; defaults to the number of CPUs and
+              ``1`` generates all artefacts in the current process
+        progress: progress bar to report the generated artefacts to
+        force: generate all artefacts, even if they are up to date
+
+    Returns:
+        the generation results, first the ones of up-to-date artefacts and then
+        the others in the order in which they finished
+    """
+    artefacts = list(artefacts)
+    task_id = None
+    if progress:
+        task_id = progress.add_task(
+            total=len(artefacts), description="Generating artefacts"
+        )
+
+    results: tp.List[ArtefactGenerationResult] = []
+    stored_fingerprints = _load_artefact_fingerprints()
+    fingerprints: tp.Dict[str, str] = {}
+
+    def add_result(result: ArtefactGenerationResult) -> None:
+        if result.error:
+            LOG.error(
+                f"Could not generate artefact {result.name}:\n{result.error}"
+            )
+            stored_fingerprints.pop(result.name, None)
+        elif result.up_to_date:
+            LOG.info(f"Artefact {result.name} is up to date")
+        else:
+            LOG.info(
+                f"Generated artefact {result.name} "
+                f"in {result.duration:.1f}s"
+            )
+            stored_fingerprints[result.name] = fingerprints[result.name]
+
+        results.append(result)
+        if progress and task_id is not None:
+            progress.advance(task_id)
+
+    outdated_artefacts: tp.List[Artefact] = []
+    for artefact in artefacts:
+        fingerprint = artefact.get_input_fingerprint()
+        fingerprints[artefact.name] = fingerprint
+        is_up_to_date = not force and stored_fingerprints.get(
+            artefact.name
+        ) == fingerprint and _generated_files_exist(artefact)
+
+        if is_up_to_date:
+            add_result(
+                ArtefactGenerationResult(artefact.name, 0, up_to_date=True)
+            )
+        else:
+            outdated_artefacts.append(artefact)
+
+    groups = _group_artefacts_by_project(outdated_artefacts)
+    jobs = min(jobs or os.cpu_count() or 1, len(groups))
+    try:
+        if jobs <= 1:
+            for group in groups:
+                for result in _generate_artefact_group(group, progress):
+                    add_result(result)
+            return results
+
+        with ProcessPoolExecutor(
+            jobs, initializer=_initialize_artefact_worker
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _generate_artefact_group_by_name,
+                    [artefact.name for artefact in group]
+                ) for group in groups
+            ]
+            for future in as_completed(futures):
+                for result in future.result():
+                    add_result(result)
+        return results
+    finally:
+        if groups:
+            _store_artefact_fingerprints(stored_fingerprints)
+
+
 def initialize_artefact_types() -> None:
     """Import plots and tables module to register artefact types."""
     import varats.plot.plots  # pylint: disable=C0415,unused-import
@@ -1,5 +1,6 @@
 """General plots module."""
 import abc
+import inspect
 import logging
 import typing as tp
 from copy import deepcopy
@@ -8,7 +9,15 @@ from typing import final
 
 import click
 
-from varats.paper_mgmt.artefacts import Artefact, ArtefactFileInfo
+from varats.paper_mgmt.artefacts import (
+    Artefact,
+    ArtefactFileInfo,
+    get_case_study_project_names,
+)
+from varats.plots.discover_plots import (
+    get_plot_generator_entries,
+    initialize_plot_generator,
+)
 from varats.ts_utils.artefact_util import convert_kwargs
 from varats.ts_utils.cli_util import (
     make_cli_option,
@@ -386,6 +395,22 @@ class PlotGenerator(abc.ABC):
         cls.OPTIONS = options
         cls.GENERATORS[generator_name] = cls
 
+    @staticmethod
+    def get_plot_generator_names() -> tp.List[str]:
+        """
+        Look up the names of all available plot generators without importing
+        them.
+
+        Returns:
+            the names of the plot generators of the tool suite and of all
+            other registered plot generators
+        """
+        return list(
+            dict.fromkeys([
+                *get_plot_generator_entries(), *PlotGenerator.GENERATORS
+            ])
+        )
+
     @staticmethod
     def get_plot_generator_types_help_string() -> str:
         """
@@ -395,7 +420,7 @@ class PlotGenerator(abc.ABC):
             a help string that contains all available plot names.
         """
         return "The following plot generators are available:\n  " + "\n  ".join(
-            list(PlotGenerator.GENERATORS)
+            PlotGenerator.get_plot_generator_names()
         )
 
     @staticmethod
@@ -411,6 +436,9 @@ class PlotGenerator(abc.ABC):
         Returns:
             the class for the plot generator
         """
+        if plot_generator_type_name not in PlotGenerator.GENERATORS:
+            initialize_plot_generator(plot_generator_type_name)
+
         if plot_generator_type_name not in PlotGenerator.GENERATORS:
             raise LookupError(
                 f"Unknown plot generator '{plot_generator_type_name}'.\n" +
@@ -638,3 +666,25 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
                 plot.plot_kwargs.get("case_study", None)
             ) for plot in generator_instance.generate()
         ]
+
+    def get_project_names(self) -> tp.Set[str]:
+        """
+        Retrieve the names of the projects whose data this artefact uses.
+
+        Returns:
+            the projects of the case studies passed to the plot
+        """
+        return get_case_study_project_names(self.__plot_kwargs)
+
+    def get_input_files(self) -> tp.List[Path]:
+        """
+        Retrieve the files the generated artefact depends on.
+
+        Returns:
+            the case study and result files of the used projects and the source
+            file of the plot generator
+        """
+        return [
+            *super().get_input_files(),
+            Path(inspect.getfile(self.plot_generator_class))
+        ]
@@ -334,8 +334,8 @@ def _filter_data_frame(
     ).reset_index()
 
     # fix missing time_ids introduced by the product index
-    interaction_plot_df['time_id'] = interaction_plot_df['revision'].apply(
-        commit_map.short_time_id
+    interaction_plot_df['time_id'] = commit_map.short_time_ids(
+        interaction_plot_df['revision']
     )
     interaction_plot_df.sort_values(by=['time_id'], inplace=True)
 
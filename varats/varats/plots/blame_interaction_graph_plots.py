@@ -65,7 +65,7 @@ class CommitInteractionGraphPlot(Plot, plot_name='cig_plot'):
 
         cig = create_blame_interaction_graph(
             project_name, revision, BlameReportExperiment
-        ).commit_interaction_graph()
+        ).commit_interaction_graph().copy()
         nx.set_node_attributes(
             cig,
             {node: cig.nodes[node]["commit"].commit_hash for node in cig.nodes},
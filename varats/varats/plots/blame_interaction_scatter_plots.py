@@ -20,10 +20,6 @@ from varats.paper_mgmt.case_study import (
 from varats.plot.plot import Plot, PlotDataEmpty
 from varats.plot.plots import PlotGenerator
 from varats.plots.scatter_plot_utils import multivariate_grid
-from varats.project.project_util import (
-    get_local_project_gits,
-    get_local_project_git_path,
-)
 from varats.ts_utils.cli_util import CLIOptionTy, make_cli_option
 from varats.ts_utils.click_param_types import REQUIRE_MULTI_CASE_STUDY
 from varats.utils.exceptions import UnsupportedOperation
@@ -31,7 +27,7 @@ from varats.utils.git_util import (
     create_commit_lookup_helper,
     CommitRepoPair,
     ChurnConfig,
-    calc_repo_code_churn,
+    calc_project_code_churn,
     UNCOMMITTED_COMMIT_HASH,
     FullCommitHash,
 )
@@ -68,13 +64,9 @@ class CentralCodeScatterPlot(Plot, plot_name='central_code_scatter'):
         ).commit_interaction_graph()
 
         commit_lookup = create_commit_lookup_helper(project_name)
-        repo_lookup = get_local_project_gits(project_name)
-        code_churn_lookup = {
-            repo_name: calc_repo_code_churn(
-                get_local_project_git_path(project_name, repo_name),
-                ChurnConfig.create_c_style_languages_config()
-            ) for repo_name, _ in repo_lookup.items()
-        }
+        code_churn_lookup = calc_project_code_churn(
+            project_name, ChurnConfig.create_c_style_languages_config()
+        )
 
         def filter_nodes(node: CommitRepoPair) -> bool:
             if node.commit_hash == UNCOMMITTED_COMMIT_HASH:
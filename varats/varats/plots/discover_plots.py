@@ -1,8 +1,27 @@
 """This modules handles auto discovering of plots from the tool suite."""
 
+import typing as tp
+
 from varats import plots as __PLOTS__
+from varats.utils.plugin_manifest import load_plugin_manifest, PluginEntry
 
 
 def initialize_plots() -> None:
     # Discover and initialize all plots
     __PLOTS__.discover()
+
+
+def get_plot_generator_entries() -> tp.Dict[str, PluginEntry]:
+    """Look up the plot generators of the tool suite by their name without
+    importing them."""
+    return load_plugin_manifest(__PLOTS__).registrations("generator_name")
+
+
+def initialize_plot_generator(generator_name: str) -> None:
+    """Import only the module that provides the given plot generator or all
+    plots if the generator is not known."""
+    entry = get_plot_generator_entries().get(generator_name)
+    if entry is None:
+        initialize_plots()
+    else:
+        entry.load()
@@ -61,7 +61,7 @@ def build_repo_churn_table(
     )
     churn_data = pd.DataFrame({
         "revision": list(code_churn),
-        "time_id": [commit_map.time_id(x) for x in code_churn],
+        "time_id": commit_map.time_ids(code_churn),
         "insertions": [x[1] for x in code_churn.values()],
         "deletions": [x[2] for x in code_churn.values()],
         "changed_files": [x[0] for x in code_churn.values()]
@@ -116,7 +116,7 @@ def build_revisions_churn_table(
     ])
     churn_data = pd.DataFrame({
         "revision": revisions,
-        "time_id": [commit_map.time_id(x) for x in revisions],
+        "time_id": commit_map.time_ids(revisions),
         "insertions": [x[1] for x in code_churn],
         "deletions": [x[2] for x in code_churn],
         "changed_files": [x[0] for x in code_churn]
@@ -1,5 +1,6 @@
 """General tables module."""
 import abc
+import inspect
 import logging
 import typing as tp
 from copy import deepcopy
@@ -9,7 +10,15 @@ from typing import final
 
 import click
 
-from varats.paper_mgmt.artefacts import Artefact, ArtefactFileInfo
+from varats.paper_mgmt.artefacts import (
+    Artefact,
+    ArtefactFileInfo,
+    get_case_study_project_names,
+)
+from varats.tables.discover_tables import (
+    get_table_generator_entries,
+    initialize_table_generator,
+)
 from varats.ts_utils.artefact_util import convert_kwargs
 from varats.ts_utils.cli_util import (
     make_cli_option,
@@ -361,6 +370,22 @@ class TableGenerator(abc.ABC):
         cls.OPTIONS = options
         cls.GENERATORS[generator_name] = cls
 
+    @staticmethod
+    def get_table_generator_names() -> tp.List[str]:
+        """
+        Look up the names of all available table generators without importing
+        them.
+
+        Returns:
+            the names of the table generators of the tool suite and of all
+            other registered table generators
+        """
+        return list(
+            dict.fromkeys([
+                *get_table_generator_entries(), *TableGenerator.GENERATORS
+            ])
+        )
+
     @staticmethod
     def get_table_generator_types_help_string() -> str:
         """
@@ -370,7 +395,7 @@ class TableGenerator(abc.ABC):
             a help string that contains all available table names.
         """
         return "The following table generators are available:\n  " + \
-               "\n  ".join(list(TableGenerator.GENERATORS))
+               "\n  ".join(TableGenerator.get_table_generator_names())
 
     @staticmethod
     def get_class_for_table_generator_type(
@@ -385,6 +410,9 @@ class TableGenerator(abc.ABC):
         Returns:
             the class for the table generator
         """
+        if table_generator_type_name not in TableGenerator.GENERATORS:
+            initialize_table_generator(table_generator_type_name)
+
         if table_generator_type_name not in TableGenerator.GENERATORS:
             raise LookupError(
                 f"Unknown table generator '{table_generator_type_name}'.\n" +
@@ -617,3 +645,25 @@ class TableArtefact(Artefact, artefact_type="table", artefact_type_version=2):
                 table.table_kwargs.get("case_study", None)
             ) for table in generator_instance.generate()
         ]
+
+    def get_project_names(self) -> tp.Set[str]:
+        """
+        Retrieve the names of the projects whose data this artefact uses.
+
+        Returns:
+            the projects of the case studies passed to the table
+        """
+        return get_case_study_project_names(self.__table_kwargs)
+
+    def get_input_files(self) -> tp.List[Path]:
+        """
+        Retrieve the files the generated artefact depends on.
+
+        Returns:
+            the case study and result files of the used projects and the source
+            file of the table generator
+        """
+        return [
+            *super().get_input_files(),
+            Path(inspect.getfile(self.table_generator_class))
+        ]
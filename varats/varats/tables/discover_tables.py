@@ -1,8 +1,27 @@
 """This modules handles auto discovering of tables from the tool suite."""
 
+import typing as tp
+
 from varats import tables as __TABLES__
+from varats.utils.plugin_manifest import load_plugin_manifest, PluginEntry
 
 
 def initialize_tables() -> None:
     # Discover and initialize all plots
     __TABLES__.discover()
+
+
+def get_table_generator_entries() -> tp.Dict[str, PluginEntry]:
+    """Look up the table generators of the tool suite by their name without
+    importing them."""
+    return load_plugin_manifest(__TABLES__).registrations("generator_name")
+
+
+def initialize_table_generator(generator_name: str) -> None:
+    """Import only the module that provides the given table generator or all
+    tables if the generator is not known."""
+    entry = get_table_generator_entries().get(generator_name)
+    if entry is None:
+        initialize_tables()
+    else:
+        entry.load()
@@ -18,6 +18,8 @@ from varats.data.discover_reports import initialize_reports
 from varats.paper.paper_config import get_paper_config
 from varats.paper_mgmt.artefacts import (
     Artefact,
+    ArtefactGenerationResult,
+    generate_artefacts,
     initialize_artefact_types,
     load_artefacts,
 )
@@ -84,25 +86,45 @@ def show(name: str) -> None:
 
 
 @main.command(
-    help="Generate artefacts. By default, all artefacts are generated."
+    help="Generate artefacts. By default, all artefacts that are not up to "
+    "date are generated."
 )
 @click.option(
     "--only",
     multiple=True,
     help="Only generate artefacts with the given names."
 )
-def generate(only: tp.Optional[str]) -> None:
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of processes used to generate artefacts in parallel. "
+    "Defaults to the number of CPUs."
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Generate artefacts even if their inputs did not change."
+)
+def generate(
+    only: tp.Optional[str], jobs: tp.Optional[int], force: bool
+) -> None:
     """
     Generate artefacts.
 
-    By default, all artefacts are generated.
+    By default, all artefacts are generated. Artefacts whose definition, case
+    studies, and result files did not change since their last generation are
+    skipped.
 
     Args:
         only: generate only this artefact
+        jobs: number of processes used to generate artefacts
+        force: also generate artefacts that are up to date
     """
     if not Artefact.base_output_dir().exists():
         Artefact.base_output_dir().mkdir(parents=True)
-    artefacts: tp.Iterable[Artefact]
+    artefacts: tp.List[Artefact]
 
     if only:
         artefacts = [
@@ -110,17 +132,11 @@ def generate(only: tp.Optional[str]) -> None:
             if art.name in only
         ]
     else:
-        artefacts = load_artefacts(get_paper_config())
+        artefacts = list(load_artefacts(get_paper_config()))
 
     with Progress() as progress:
-        for artefact in progress.track(
-            list(artefacts), description="Generating artefacts"
-        ):
-            LOG.info(
-                f"Generating artefact {artefact.name} in location "
-                f"{artefact.output_dir}"
-            )
-            artefact.generate_artefact(progress)
+        results = generate_artefacts(artefacts, jobs, progress, force)
+    _print_generation_summary(results)
 
     # generate index.html
     _generate_index_html(artefacts, Artefact.base_output_dir() / "index.html")
@@ -131,6 +147,24 @@ def generate(only: tp.Optional[str]) -> None:
         Artefact.base_output_dir() / "plot_matrix.html"
     )
 
+    failed_artefacts = [result.name for result in results if result.error]
+    if failed_artefacts:
+        raise click.ClickException(
+            "Could not generate the artefacts " + ", ".join(failed_artefacts)
+        )
+
+
+def _print_generation_summary(
+    results: tp.Iterable[ArtefactGenerationResult]
+) -> None:
+    """Print the time spent on each artefact, slowest first."""
+    for result in sorted(results, key=lambda res: res.duration, reverse=True):
+        if result.up_to_date:
+            status = "up to date"
+        else:
+            status = "ok" if result.succeeded else "failed"
+        print(f"{result.duration:8.1f}s  {status:10}  {result.name}")
+
 
 __INDEX_TABLE_TEMPLATE = """      <h2>{heading}</h2>
       <p><table>
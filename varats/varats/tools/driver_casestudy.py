@@ -62,6 +62,7 @@ from varats.ts_utils.cli_util import (
     initialize_cli_tool,
     cli_yn_choice,
     add_cli_options,
+    LazyMultiCommand,
 )
 from varats.ts_utils.click_param_types import (
     create_experiment_type_choice,
@@ -378,20 +379,21 @@ def __gen_per_year(
     store_case_study(ctx.obj['case_study'], ctx.obj['path'])
 
 
-class SmoothPlotCLI(click.MultiCommand):
+class SmoothPlotCLI(LazyMultiCommand):
     """Command factory for plots."""
 
-    def __init__(self, **attrs: tp.Any):
-        initialize_plots()
-        super().__init__(**attrs)
-
     def list_commands(self, ctx: click.Context) -> tp.List[str]:
-        return list(PlotGenerator.GENERATORS.keys())
+        return PlotGenerator.get_plot_generator_names()
 
     def get_command(self, ctx: click.Context,
                     cmd_name: str) -> tp.Optional[click.Command]:
 
-        generator_cls = PlotGenerator.GENERATORS[cmd_name]
+        try:
+            generator_cls = PlotGenerator.get_class_for_plot_generator_type(
+                cmd_name
+            )
+        except LookupError:
+            return None
 
         @click.pass_context
         def command_template(context: click.Context, **kwargs: tp.Any) -> None:
@@ -13,7 +13,10 @@ import click
 from rich.progress import Progress
 
 from varats.paper.paper_config import get_paper_config
-from varats.paper_mgmt.artefacts import load_artefacts
+from varats.paper_mgmt.artefacts import (
+    load_artefacts,
+    initialize_artefact_types,
+)
 from varats.plot.plots import (
     PlotGenerator,
     CommonPlotOptions,
@@ -21,28 +24,31 @@ from varats.plot.plots import (
     PlotGeneratorFailed,
     PlotArtefact,
 )
-from varats.plots.discover_plots import initialize_plots
 from varats.projects.discover_projects import initialize_projects
-from varats.tables.discover_tables import initialize_tables
-from varats.ts_utils.cli_util import initialize_cli_tool, add_cli_options
+from varats.ts_utils.cli_util import (
+    initialize_cli_tool,
+    add_cli_options,
+    LazyMultiCommand,
+)
 
 LOG = logging.getLogger(__name__)
 
 
-class PlotCLI(click.MultiCommand):
+class PlotCLI(LazyMultiCommand):
     """Command factory for plots."""
 
-    def __init__(self, **attrs: tp.Any):
-        initialize_plots()
-        super().__init__(**attrs)
-
     def list_commands(self, ctx: click.Context) -> tp.List[str]:
-        return list(PlotGenerator.GENERATORS.keys())
+        return PlotGenerator.get_plot_generator_names()
 
     def get_command(self, ctx: click.Context,
                     cmd_name: str) -> tp.Optional[click.Command]:
 
-        generator_cls = PlotGenerator.GENERATORS[cmd_name]
+        try:
+            generator_cls = PlotGenerator.get_class_for_plot_generator_type(
+                cmd_name
+            )
+        except LookupError:
+            return None
 
         @click.pass_context
         def command_template(context: click.Context, **kwargs: tp.Any) -> None:
@@ -107,9 +113,11 @@ def main(context: click.Context, **kwargs: tp.Any) -> None:
     context.obj["save_artefact"] = kwargs["save_artefact"]
 
     initialize_cli_tool()
+    # projects are looked up by name in benchbuild's project registry, e.g.,
+    # by case studies and revision lookups in varats-core, so they cannot be
+    # resolved lazily via a manifest; importing them takes only a few ms
     initialize_projects()
-    initialize_tables()
-    initialize_plots()
+    initialize_artefact_types()
 
 
 if __name__ == '__main__':
@@ -1,9 +1,9 @@
 """Utility functions for working with artefacts."""
 import typing as tp
 
-from benchbuild.experiment import ExperimentRegistry
-
+from varats.data.discover_reports import get_report_types
 from varats.experiment.experiment_util import VersionExperiment
+from varats.experiments.discover_experiments import get_experiment_types
 from varats.paper.case_study import CaseStudy
 from varats.paper.paper_config import get_loaded_paper_config, PaperConfig
 from varats.report.report import BaseReport
@@ -65,7 +65,7 @@ class ReportTypeConverter(CLIOptionConverter[tp.Type[BaseReport]]):
     ) -> tp.Union[tp.Type[BaseReport], tp.List[tp.Type[BaseReport]]]:
         if isinstance(str_value, tp.List):
             raise ValueError("Conversion for lists not implemented.")
-        return BaseReport.REPORT_TYPES[str_value]
+        return get_report_types()[str_value]
 
 
 class ExperimentTypeConverter(CLIOptionConverter[tp.Type[VersionExperiment]]):
@@ -87,10 +87,7 @@ class ExperimentTypeConverter(CLIOptionConverter[tp.Type[VersionExperiment]]):
                   tp.List[tp.Type[VersionExperiment]]]:
         if isinstance(str_value, tp.List):
             raise ValueError("Conversion for lists not implemented.")
-        return tp.cast(
-            tp.Type[VersionExperiment],
-            ExperimentRegistry.experiments[str_value]
-        )
+        return get_experiment_types()[str_value]
 
 
 def convert_kwargs(
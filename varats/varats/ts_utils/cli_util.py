@@ -122,6 +122,23 @@ def add_cli_options(command: CommandTy, *options: CLIOptionTy) -> CommandTy:
     return command
 
 
+class LazyMultiCommand(click.MultiCommand):
+    """
+    Command factory that lists its sub-commands without creating them.
+
+    Creating a sub-command may require to import the module that provides it,
+    so the help text only lists the names of the sub-commands.
+    """
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        commands = self.list_commands(ctx)
+        if commands:
+            with formatter.section("Commands"):
+                formatter.write_dl([(command, "") for command in commands])
+
+
 # ------------------------------------------------------------------------------
 # CLIOptionConverter
 # ------------------------------------------------------------------------------
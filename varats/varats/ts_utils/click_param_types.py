@@ -4,11 +4,10 @@ import typing as tp
 from enum import Enum
 
 import click
-from benchbuild.experiment import ExperimentRegistry
 from click import ParamType
 
-from varats.data.discover_reports import initialize_reports
-from varats.experiments.discover_experiments import initialize_experiments
+from varats.data.discover_reports import get_report_types
+from varats.experiments.discover_experiments import get_experiment_types
 from varats.paper.paper_config import get_paper_config
 from varats.report.report import BaseReport
 from varats.ts_utils.artefact_util import (
@@ -34,7 +33,7 @@ class TypedChoice(click.Choice, tp.Generic[ChoiceTy]):
     name = "typed choice"
 
     def __init__(
-        self, choices: tp.Dict[str, ChoiceTy], case_sensitive: bool = True
+        self, choices: tp.Mapping[str, ChoiceTy], case_sensitive: bool = True
     ):
         self.__choices = choices
         super().__init__(list(choices.keys()), case_sensitive)
@@ -60,7 +59,7 @@ class TypedMultiChoice(click.Choice, tp.Generic[ChoiceTy]):
 
     def __init__(
         self,
-        choices: tp.Dict[str, tp.List[ChoiceTy]],
+        choices: tp.Mapping[str, tp.List[ChoiceTy]],
         case_sensitive: bool = True
     ):
         self.__choices = choices
@@ -81,6 +80,25 @@ class TypedMultiChoice(click.Choice, tp.Generic[ChoiceTy]):
         ]
 
 
+class _SingleOrAllChoices(tp.Mapping[str, tp.List[ChoiceTy]]):
+    """Choices that select a single value or all values with ``all``."""
+
+    def __init__(self, values: tp.Mapping[str, ChoiceTy]):
+        self.__values = values
+
+    def __getitem__(self, key: str) -> tp.List[ChoiceTy]:
+        if key == "all":
+            return list(self.__values.values())
+        return [self.__values[key]]
+
+    def __iter__(self) -> tp.Iterator[str]:
+        yield from self.__values
+        yield "all"
+
+    def __len__(self) -> int:
+        return len(self.__values) + 1
+
+
 EnumTy = tp.TypeVar("EnumTy", bound=Enum)
 
 
@@ -142,8 +160,7 @@ def create_single_case_study_choice() -> TypedChoice['CaseStudy']:
 
 def create_report_type_choice() -> TypedChoice[tp.Type[BaseReport]]:
     """Create a choice parameter type that allows selecting a report type."""
-    initialize_reports()
-    return TypedChoice(BaseReport.REPORT_TYPES)
+    return TypedChoice(get_report_types())
 
 
 def __is_experiment_excluded(experiment_name: str) -> bool:
@@ -158,32 +175,26 @@ def __is_experiment_excluded(experiment_name: str) -> bool:
 def create_experiment_type_choice(
 ) -> TypedChoice[tp.Type['VersionExperiment']]:
     """Create a choice parameter type that allows selecting a report type."""
-    initialize_experiments()
-    return TypedChoice({
-        k: v
-        for k, v in ExperimentRegistry.experiments.items()
-        if not __is_experiment_excluded(k)
-    })
+    return TypedChoice(
+        get_experiment_types(lambda name: not __is_experiment_excluded(name))
+    )
 
 
 def create_multi_experiment_type_choice(
-) -> TypedMultiChoice['VersionExperiment']:
+) -> TypedMultiChoice[tp.Type['VersionExperiment']]:
     """
     Create a choice parameter type that allows selecting multiple experiments.
 
     Multiple experiments can be given as a comma separated list. The special
     value "all" selects all experiments.
     """
-    initialize_experiments()
-    value_dict = {
-        k: [v]  # make value a list to be consistent with entry for 'all'
-        for k, v in ExperimentRegistry.experiments.items()
-        if not __is_experiment_excluded(k)
-    }
-    value_dict["all"] = [
-        experiment for value in value_dict.values() for experiment in value
-    ]
-    return TypedMultiChoice(value_dict)
+    return TypedMultiChoice(
+        _SingleOrAllChoices(
+            get_experiment_types(
+                lambda name: not __is_experiment_excluded(name)
+            )
+        )
+    )
 
 
 class ShortCommitHashParamType(ParamType):